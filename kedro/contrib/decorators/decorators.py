@@ -30,24 +30,163 @@
 This module contains function decorators, which can be used as ``Node``
 decorators. See ``kedro.pipeline.node.decorate``
 """
+import inspect
 import logging
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from functools import wraps
 from time import sleep
-from typing import Callable
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
 
 import pandas as pd
 from pyspark.sql import SparkSession
 
+ARROW_ENABLED = "spark.sql.execution.arrow.enabled"
+ARROW_BATCH_SIZE = "spark.sql.execution.arrow.maxRecordsPerBatch"
+CONVERSION_CACHE_BYTES = 1024 ** 3
 
-def pandas_to_spark(spark: SparkSession) -> Callable:
+
+class _ConversionCache:
+    """Least recently used cache of the data frames converted by the
+    ``pandas_to_spark`` and ``spark_to_pandas`` decorators created with
+    ``cache=True``, so that a data frame feeding several decorated nodes is
+    only converted once. Entries are keyed by the id of their source data
+    frame and hold it through a weak reference, so an entry is dropped as
+    soon as its source is garbage collected, e.g. once the run which loaded
+    it has released it. The cache is also bounded by the memory of the
+    pandas data frame of each entry.
+    """
+
+    def __init__(self, max_bytes: int = CONVERSION_CACHE_BYTES):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._size = 0
+        # entries may be dropped by weak reference callbacks running in the
+        # garbage collector while the lock is held by the same thread
+        self._lock = threading.RLock()
+
+    def get(self, source: Any, key: Hashable = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get((id(source), key))
+            if entry is None or entry[0]() is not source:
+                return None
+            self._entries.move_to_end((id(source), key))
+            return entry[1]
+
+    def put(self, source: Any, converted: Any, size: int, key: Hashable = None) -> None:
+        if size > self._max_bytes:
+            return
+        entry_key = (id(source), key)
+
+        def _drop(source_ref):
+            with self._lock:
+                entry = self._entries.get(entry_key)
+                if entry is not None and entry[0] is source_ref:
+                    self._pop(entry_key)
+
+        with self._lock:
+            if entry_key in self._entries:
+                self._pop(entry_key)
+            self._entries[entry_key] = (weakref.ref(source, _drop), converted, size)
+            self._size += size
+            while self._size > self._max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, entry_key: Hashable) -> None:
+        self._size -= self._entries.pop(entry_key)[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_TO_SPARK_CACHE = _ConversionCache()
+_TO_PANDAS_CACHE = _ConversionCache()
+
+
+def clear_conversion_cache() -> None:
+    """Removes all the data frames cached by ``pandas_to_spark`` and
+    ``spark_to_pandas``."""
+    _TO_SPARK_CACHE.clear()
+    _TO_PANDAS_CACHE.clear()
+
+
+def _memory_usage(data: pd.DataFrame) -> int:
+    return int(data.memory_usage(index=True).sum())
+
+
+_ARROW_CONF_LOCK = threading.Lock()
+
+
+@contextmanager
+def _arrow_conf(
+    spark: SparkSession, arrow: Optional[bool], max_records_per_batch: Optional[int]
+) -> Iterator[None]:
+    """Sets the given Arrow options of the Spark session for the duration
+    of a conversion, and restores their previous values afterwards. The
+    options are session-wide, so the conversions setting them run one at
+    a time."""
+    options = {}
+    if arrow is not None:
+        options[ARROW_ENABLED] = str(arrow).lower()
+    if max_records_per_batch is not None:
+        options[ARROW_BATCH_SIZE] = str(max_records_per_batch)
+    if not options:
+        yield
+        return
+
+    with _ARROW_CONF_LOCK:
+        previous = {key: spark.conf.get(key, None) for key in options}
+        try:
+            for key, value in options.items():
+                spark.conf.set(key, value)
+            yield
+        finally:
+            for key, value in previous.items():
+                if value is None:
+                    spark.conf.unset(key)
+                else:
+                    spark.conf.set(key, value)
+
+
+def _convert_inputs(
+    node_func: Callable,
+    convert: Callable[[Optional[str], Any], Any],
+    args: Tuple,
+    kwargs: Dict[str, Any],
+) -> Tuple[Tuple, Dict[str, Any]]:
+    """Converts the positional and keyword arguments of a call to
+    ``node_func``, passing ``convert`` the name of the parameter each
+    argument binds to, or None for variadic positional arguments."""
+    parameters = [
+        param.name
+        for param in inspect.signature(node_func).parameters.values()
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD)
+    ]
+    names = parameters + [None] * (len(args) - len(parameters))
+    return (
+        tuple(convert(name, arg) for name, arg in zip(names, args)),
+        {key: convert(key, value) for key, value in kwargs.items()},
+    )
+
+
+def pandas_to_spark(
+    spark: SparkSession,
+    schema: Any = None,
+    arrow: bool = None,
+    max_records_per_batch: int = None,
+    cache: bool = False,
+) -> Callable:
     """Inspects the decorated function's inputs and converts all pandas
     DataFrame inputs to spark DataFrames.
 
-    **Note** that in the example below we have enabled
-    ``spark.sql.execution.arrow.enabled``. For this to work, you should first
-    ``pip install pyarrow`` and add ``pyarrow`` to ``requirements.txt``.
-    Enabling this option makes the convertion between pyspark <-> DataFrames
-    **much faster**.
+    **Note** that converting with Apache Arrow, e.g. with ``arrow=True``,
+    makes the convertion between pyspark <-> DataFrames **much faster**.
+    For this to work, you should first ``pip install pyarrow`` and add
+    ``pyarrow`` to ``requirements.txt``.
 
     Args:
         spark: The spark session singleton object to use for the creation of
@@ -66,7 +205,6 @@ def pandas_to_spark(spark: SparkSession) -> Callable:
                 >>>       .appName("kedro")
                 >>>       .config("spark.driver.memory", "4g")
                 >>>       .config("spark.driver.maxResultSize", "3g")
-                >>>       .config("spark.sql.execution.arrow.enabled", "true")
                 >>>       .getOrCreate()
                 >>>     )
 
@@ -78,50 +216,103 @@ def pandas_to_spark(spark: SparkSession) -> Callable:
                 >>> def node_1(data):
                 >>>     data.show() # data is pyspark.sql.DataFrame
 
+        schema: Schema of the created pySpark DataFrames, either a
+            ``pyspark.sql.types.StructType`` or a DDL string, which skips
+            the inference of the schema from the data. A dictionary maps
+            the names of the decorated function's arguments to the schema
+            of each of them.
+        arrow: Whether to convert the data with Apache Arrow. The
+            ``spark.sql.execution.arrow.enabled`` setting of ``spark`` is
+            used if None.
+        max_records_per_batch: Maximum number of records of the Arrow
+            record batches sent to Spark. Spark's setting is used if None.
+            The Arrow options given are only set on ``spark`` while the
+            data frames are converted.
+        cache: Whether to reuse the pySpark DataFrame created from a
+            pandas DataFrame which is passed to several decorated nodes,
+            e.g. by a ``MemoryDataSet`` with ``copy_mode="assign"``. The
+            cached pySpark DataFrame is dropped when the pandas DataFrame
+            is garbage collected.
+
     Returns:
         The original function with any pandas DF inputs translated to spark.
 
     """
 
-    def _to_spark(arg):
-        if isinstance(arg, pd.DataFrame):
-            return spark.createDataFrame(arg)
-        return arg
+    def _get_schema(name: Optional[str]) -> Any:
+        if isinstance(schema, dict):
+            return schema.get(name)
+        return schema
+
+    def _to_spark(name, arg):
+        if not isinstance(arg, pd.DataFrame):
+            return arg
+        arg_schema = _get_schema(name)
+        key = (id(spark), repr(arg_schema))
+        if cache:
+            cached = _TO_SPARK_CACHE.get(arg, key)
+            if cached is not None:
+                return cached
+        with _arrow_conf(spark, arrow, max_records_per_batch):
+            converted = spark.createDataFrame(arg, schema=arg_schema)
+        if cache:
+            _TO_SPARK_CACHE.put(arg, converted, _memory_usage(arg), key)
+        return converted
 
     def inputs_to_spark(node_func: Callable):
         @wraps(node_func)
         def _wrapper(*args, **kwargs):
-            return node_func(
-                *[_to_spark(arg) for arg in args],
-                **{key: _to_spark(value) for key, value in kwargs}
-            )
+            args, kwargs = _convert_inputs(node_func, _to_spark, args, kwargs)
+            return node_func(*args, **kwargs)
 
         return _wrapper
 
     return inputs_to_spark
 
 
-def spark_to_pandas() -> Callable:
+def spark_to_pandas(
+    arrow: bool = None, max_records_per_batch: int = None, cache: bool = False
+) -> Callable:
     """Inspects the decorated function's inputs and converts all pySpark
     DataFrame inputs to pandas DataFrames.
 
+    Args:
+        arrow: Whether to convert the data with Apache Arrow. The
+            ``spark.sql.execution.arrow.enabled`` setting of the session of
+            the pySpark DataFrames is used if None.
+        max_records_per_batch: Maximum number of records of the Arrow
+            record batches collected from Spark. Spark's setting is used
+            if None. The Arrow options given are only set on the session
+            while the data frames are converted.
+        cache: Whether to reuse the pandas DataFrame collected from a
+            pySpark DataFrame which feeds several decorated nodes. Each node
+            receives its own copy of the cached pandas DataFrame, which is
+            dropped when the pySpark DataFrame is garbage collected.
+
     Returns:
         The original function with any pySpark DF inputs translated to pandas.
 
     """
 
-    def _to_pandas(arg):
-        if "pyspark.sql.dataframe" in str(type(arg)):
-            return arg.toPandas()
-        return arg
+    def _to_pandas(_, arg):
+        if "pyspark.sql.dataframe" not in str(type(arg)):
+            return arg
+        if cache:
+            cached = _TO_PANDAS_CACHE.get(arg)
+            if cached is not None:
+                return cached.copy()
+        with _arrow_conf(arg.sql_ctx.sparkSession, arrow, max_records_per_batch):
+            converted = arg.toPandas()
+        if cache:
+            _TO_PANDAS_CACHE.put(arg, converted, _memory_usage(converted))
+            return converted.copy()
+        return converted
 
     def inputs_to_pandas(node_func: Callable):
         @wraps(node_func)
         def _wrapper(*args, **kwargs):
-            return node_func(
-                *[_to_pandas(arg) for arg in args],
-                **{key: _to_pandas(value) for key, value in kwargs}
-            )
+            args, kwargs = _convert_inputs(node_func, _to_pandas, args, kwargs)
+            return node_func(*args, **kwargs)
 
         return _wrapper
 
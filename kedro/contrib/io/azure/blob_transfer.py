@@ -0,0 +1,257 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``kedro.contrib.io.azure.blob_transfer`` provides file objects used by the
+Azure blob data sets to move large block blobs: a readable one which
+streams a blob with concurrent ranged downloads and a writable one which
+uploads blocks in parallel.
+"""
+import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from azure.storage.blob.models import BlobBlock
+
+from kedro.io.parallel_upload import ParallelUploadWriter
+
+MAX_BLOCK_SIZE = 100 * 1024 ** 2
+DEFAULT_TRANSFER_ARGS = {"block_size": 4 * 1024 ** 2, "max_concurrency": 8}
+
+
+def _validate_transfer_args(block_size: int, max_concurrency: int) -> None:
+    if not 0 < block_size <= MAX_BLOCK_SIZE:
+        raise ValueError(
+            "`block_size` must be between 1 and {} bytes, got {}.".format(
+                MAX_BLOCK_SIZE, block_size
+            )
+        )
+    if max_concurrency < 1:
+        raise ValueError(
+            "`max_concurrency` must be a positive integer, got {}.".format(
+                max_concurrency
+            )
+        )
+
+
+class BlobBlockReader(io.RawIOBase):
+    """``BlobBlockReader`` is a readable binary file object streaming a blob
+    in ranges of ``block_size`` bytes. Up to ``max_concurrency`` ranges
+    following the one being read are downloaded in parallel, so the memory
+    held by the reader is bounded by roughly
+    ``(max_concurrency + 1) * block_size`` bytes. All ranges are pinned to
+    the ETag seen when the reader was created, so a concurrent overwrite of
+    the blob makes the read fail instead of returning a mix of both
+    versions.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>> from azure.storage.blob import BlockBlobService
+        >>> from kedro.contrib.io.azure.blob_transfer import BlobBlockReader
+        >>>
+        >>> blob_service = BlockBlobService(account_name="...",
+        >>>                                 account_key="...")
+        >>> with BlobBlockReader(blob_service, "container", "data.csv") as blob:
+        >>>     data = pd.read_csv(blob)
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        blob_service: Any,
+        container_name: str,
+        blob_name: str,
+        block_size: int = DEFAULT_TRANSFER_ARGS["block_size"],
+        max_concurrency: int = DEFAULT_TRANSFER_ARGS["max_concurrency"],
+        **blob_args
+    ) -> None:
+        """Creates a new instance of ``BlobBlockReader``.
+
+        Args:
+            blob_service: An azure ``BlockBlobService``.
+            container_name: Azure container name.
+            blob_name: Name of the blob to read.
+            block_size: Size of each downloaded range in bytes.
+            max_concurrency: Maximum number of ranges downloaded in parallel.
+            **blob_args: Additional arguments, such as ``snapshot`` or
+                ``lease_id``, passed to ``get_blob_properties`` and to
+                ``get_blob_to_bytes`` for every range.
+
+        Raises:
+            ValueError: When ``block_size`` or ``max_concurrency`` is invalid.
+
+        """
+        super().__init__()
+        _validate_transfer_args(block_size, max_concurrency)
+        self._blob_service = blob_service
+        self._container_name = container_name
+        self._blob_name = blob_name
+        self._block_size = block_size
+        # ranges are pinned to the ETag instead of any ``if_match`` given
+        self._blob_args = {k: v for k, v in blob_args.items() if k != "if_match"}
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._pending = deque()
+        self._block = memoryview(b"")
+
+        properties = blob_service.get_blob_properties(
+            container_name,
+            blob_name,
+            **{k: v for k, v in blob_args.items() if k != "validate_content"}
+        ).properties
+        self._size = properties.content_length
+        self._etag = properties.etag
+        self._offsets = iter(range(0, self._size, block_size))
+        for _ in range(max_concurrency):
+            self._prefetch()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:  # pylint: disable=arguments-differ
+        if not self._block:
+            if not self._pending:
+                return 0
+            self._block = memoryview(self._pending.popleft().result())
+            self._prefetch()
+        size = min(len(buffer), len(self._block))
+        buffer[:size] = self._block[:size]
+        self._block = self._block[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._executor.shutdown(wait=True)
+        super().close()
+
+    def _prefetch(self) -> None:
+        start = next(self._offsets, None)
+        if start is not None:
+            self._pending.append(self._executor.submit(self._read_range, start))
+
+    def _read_range(self, start: int) -> bytes:
+        end = min(start + self._block_size, self._size) - 1
+        blob = self._blob_service.get_blob_to_bytes(
+            self._container_name,
+            self._blob_name,
+            start_range=start,
+            end_range=end,
+            max_connections=1,
+            if_match=self._etag,
+            **self._blob_args
+        )
+        return blob.content
+
+
+class BlobBlockWriter(ParallelUploadWriter):
+    """``BlobBlockWriter`` is a writable binary file object which uploads its
+    content to a block blob in blocks of ``block_size`` bytes. Up to
+    ``max_concurrency`` blocks are uploaded in parallel, and writing blocks
+    once that many blocks are in flight, so the memory held by the writer is
+    bounded by roughly ``(max_concurrency + 1) * block_size`` bytes.
+
+    Content smaller than ``block_size`` is sent with a single request. The
+    block list is committed when the writer is closed. If an error is raised
+    inside a ``with`` block, nothing is committed and the blob is left
+    unchanged.
+
+    Example:
+    ::
+
+        >>> from azure.storage.blob import BlockBlobService
+        >>> from kedro.contrib.io.azure.blob_transfer import BlobBlockWriter
+        >>>
+        >>> blob_service = BlockBlobService(account_name="...",
+        >>>                                 account_key="...")
+        >>> with BlobBlockWriter(blob_service, "container", "data.bin") as blob:
+        >>>     blob.write(b"some data")
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        blob_service: Any,
+        container_name: str,
+        blob_name: str,
+        block_size: int = DEFAULT_TRANSFER_ARGS["block_size"],
+        max_concurrency: int = DEFAULT_TRANSFER_ARGS["max_concurrency"],
+        **blob_args
+    ) -> None:
+        """Creates a new instance of ``BlobBlockWriter``.
+
+        Args:
+            blob_service: An azure ``BlockBlobService``.
+            container_name: Azure container name.
+            blob_name: Name of the blob to write.
+            block_size: Size of each uploaded block in bytes.
+            max_concurrency: Maximum number of blocks uploaded in parallel.
+            **blob_args: Additional arguments, such as ``content_settings``
+                or ``metadata``, passed to ``put_block_list`` or, for
+                content smaller than ``block_size``, to
+                ``create_blob_from_bytes``.
+
+        Raises:
+            ValueError: When ``block_size`` or ``max_concurrency`` is invalid.
+
+        """
+        _validate_transfer_args(block_size, max_concurrency)
+        super().__init__(block_size, max_concurrency)
+        self._blob_service = blob_service
+        self._container_name = container_name
+        self._blob_name = blob_name
+        self._blob_args = blob_args
+        self._block_args = {
+            key: value
+            for key, value in blob_args.items()
+            if key in ("validate_content", "lease_id", "timeout")
+        }
+
+    def _put(self, body: bytes) -> None:
+        self._blob_service.create_blob_from_bytes(
+            self._container_name,
+            self._blob_name,
+            body,
+            max_connections=1,
+            **self._blob_args
+        )
+
+    def _upload_part(self, index: int, body: bytes) -> BlobBlock:
+        block_id = "{:08d}".format(index)
+        self._blob_service.put_block(
+            self._container_name, self._blob_name, body, block_id, **self._block_args
+        )
+        return BlobBlock(id=block_id)
+
+    def _commit(self, parts: List[BlobBlock]) -> None:
+        self._blob_service.put_block_list(
+            self._container_name, self._blob_name, parts, **self._blob_args
+        )
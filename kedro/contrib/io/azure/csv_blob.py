@@ -35,8 +35,17 @@ from typing import Any, Dict, Optional
 import pandas as pd
 from azure.storage.blob import BlockBlobService
 
+from kedro.contrib.io.azure.blob_transfer import (
+    DEFAULT_TRANSFER_ARGS,
+    BlobBlockReader,
+    BlobBlockWriter,
+)
 from kedro.io import AbstractDataSet
 
+# arguments of ``get_blob_to_text`` and ``create_blob_from_text`` which do
+# not apply to block transfers
+_TEXT_ARGS = ("encoding", "max_connections", "progress_callback")
+
 
 class CSVBlobDataSet(AbstractDataSet):
     """``CSVBlobDataSet`` loads and saves csv files in Microsoft's Azure
@@ -59,6 +68,13 @@ class CSVBlobDataSet(AbstractDataSet):
         >>> reloaded = data_set.load()
         >>>
         >>> assert data.equals(reloaded)
+
+    The blob is streamed into the csv parser in blocks downloaded in
+    parallel and the csv is uploaded in blocks while it is written, so
+    memory use is bounded by the block size and concurrency set in
+    ``transfer_args`` rather than by the size of the blob. Setting
+    ``is_emulated`` to True in ``credentials`` connects to a local storage
+    emulator such as Azurite.
     """
 
     def _describe(self) -> Dict[str, Any]:
@@ -69,6 +85,7 @@ class CSVBlobDataSet(AbstractDataSet):
             blob_from_text_args=self._blob_from_text_args,
             load_args=self._load_args,
             save_args=self._save_args,
+            transfer_args=self._transfer_args,
         )
 
     # pylint: disable=too-many-arguments
@@ -81,6 +98,7 @@ class CSVBlobDataSet(AbstractDataSet):
         blob_from_text_args: Optional[Dict[str, Any]] = None,
         load_args: Optional[Dict[str, Any]] = None,
         save_args: Optional[Dict[str, Any]] = None,
+        transfer_args: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Creates a new instance of ``CSVBlobDataSet`` pointing to a
         concrete csv file on Azure blob storage.
@@ -90,11 +108,15 @@ class CSVBlobDataSet(AbstractDataSet):
             container_name: Azure container name.
             credentials: Credentials (``account_name`` and
                 ``account_key`` or ``sas_token``)to access the azure blob
-            blob_to_text_args: Any additional arguments to pass to azure's
-                ``get_blob_to_text`` method:
+            blob_to_text_args: Any additional arguments of azure's
+                ``get_blob_to_text`` method, which are passed to the
+                requests downloading the blob, except for ``encoding``,
+                which is used to decode it:
                 https://docs.microsoft.com/en-us/python/api/azure.storage.blob.baseblobservice.baseblobservice?view=azure-python#get-blob-to-text
-            blob_from_text_args: Any additional arguments to pass to azure's
-                ``create_blob_from_text`` method:
+            blob_from_text_args: Any additional arguments of azure's
+                ``create_blob_from_text`` method, which are passed to the
+                requests uploading the blob, except for ``encoding``,
+                which is used to encode it:
                 https://docs.microsoft.com/en-us/python/api/azure.storage.blob.blockblobservice.blockblobservice?view=azure-python#create-blob-from-text
             load_args: Pandas options for loading csv files.
                 Here you can find all available arguments:
@@ -104,6 +126,11 @@ class CSVBlobDataSet(AbstractDataSet):
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.DataFrame.to_csv.html
                 All defaults are preserved, but "index", which is set to False.
+            transfer_args: Options of the block transfers: ``block_size``,
+                the size of each downloaded range and uploaded block in
+                bytes, defaults to 4 MiB, and ``max_concurrency``, the
+                maximum number of blocks transferred in parallel, defaults
+                to 8.
 
         """
         default_save_args = {"index": False}
@@ -116,22 +143,51 @@ class CSVBlobDataSet(AbstractDataSet):
         self._credentials = credentials if credentials else {}
         self._blob_to_text_args = blob_to_text_args if blob_to_text_args else {}
         self._blob_from_text_args = blob_from_text_args if blob_from_text_args else {}
+        self._transfer_args = (
+            {**DEFAULT_TRANSFER_ARGS, **transfer_args}
+            if transfer_args
+            else dict(DEFAULT_TRANSFER_ARGS)
+        )
 
     def _load(self) -> pd.DataFrame:
         blob_service = BlockBlobService(**self._credentials)
-        blob = blob_service.get_blob_to_text(
-            container_name=self._container_name,
-            blob_name=self._filepath,
-            **self._blob_to_text_args
-        )
-        csv_content = io.StringIO(blob.content)
-        return pd.read_csv(csv_content, **self._load_args)
+        blob_args = {
+            k: v for k, v in self._blob_to_text_args.items() if k not in _TEXT_ARGS
+        }
+        load_args = {
+            "encoding": self._blob_to_text_args.get("encoding", "utf-8"),
+            **self._load_args,
+        }
+        with BlobBlockReader(
+            blob_service,
+            self._container_name,
+            self._filepath,
+            **self._transfer_args,
+            **blob_args
+        ) as blob:
+            buffered = io.BufferedReader(
+                blob, buffer_size=self._transfer_args["block_size"]
+            )
+            return pd.read_csv(buffered, **load_args)
 
     def _save(self, data: pd.DataFrame) -> None:
         blob_service = BlockBlobService(**self._credentials)
-        blob_service.create_blob_from_text(
-            container_name=self._container_name,
-            blob_name=self._filepath,
-            text=data.to_csv(**self._save_args),
-            **self._blob_from_text_args
-        )
+        blob_args = {
+            k: v for k, v in self._blob_from_text_args.items() if k not in _TEXT_ARGS
+        }
+        with BlobBlockWriter(
+            blob_service,
+            self._container_name,
+            self._filepath,
+            **self._transfer_args,
+            **blob_args
+        ) as blob:
+            # the csv is encoded and uploaded in blocks while it is written
+            text_blob = io.TextIOWrapper(
+                blob,
+                encoding=self._blob_from_text_args.get("encoding", "utf-8"),
+                newline="",
+            )
+            data.to_csv(text_blob, **self._save_args)
+            text_blob.flush()
+            text_blob.detach()
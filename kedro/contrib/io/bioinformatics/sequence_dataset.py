@@ -29,14 +29,39 @@
 """BioSequenceLocalDataSet loads and saves data to/from bio-sequence objects to
 file.
 """
+from itertools import islice
 from os.path import isfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from Bio import SeqIO
+from Bio.SeqRecord import SeqRecord
 
 from kedro.io import AbstractDataSet, ExistsMixin
 
+LOAD_MODES = ["list", "iterator", "index"]
+
+
+def _iterate_batches(
+    records: Iterator[SeqRecord], chunksize: int
+) -> Iterator[List[SeqRecord]]:
+    while True:
+        batch = list(islice(records, chunksize))
+        if not batch:
+            return
+        yield batch
+
+
+def _flatten_records(data: Iterable[Any]) -> Iterator[SeqRecord]:
+    """Yields the records of an iterable of records or of batches of
+    records, such as the ones loaded when ``chunksize`` is set.
+    """
+    for item in data:
+        if isinstance(item, SeqRecord):
+            yield item
+        else:
+            yield from item
+
 
 class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
     """``BioSequenceLocalDataSet`` loads and saves data to a sequence file.
@@ -67,6 +92,18 @@ class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
         >>> sequence_list = data_set.load()
         >>> assert raw_sequence_list.equals(sequence_list)
 
+    Large files can be processed in constant memory by loading an iterator
+    of records, or of lists of ``chunksize`` records, and by saving
+    generators of records or of lists of records:
+    ::
+
+        >>> data_set = BioSequenceLocalDataSet(filepath="reads.fastq",
+        >>>                                    load_args={"format": "fastq",
+        >>>                                               "chunksize": 10000},
+        >>>                                    save_args={"format": "fastq"})
+        >>> for batch in data_set.load():
+        >>>     print(len(batch))
+
     """
 
     def _describe(self) -> Dict[str, Any]:
@@ -74,6 +111,7 @@ class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
             filepath=self._filepath,
             load_args=self._load_args,
             save_args=self._save_args,
+            load_mode=self._load_mode,
         )
 
     def __init__(
@@ -81,6 +119,7 @@ class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
         filepath: str,
         load_args: Optional[Dict[str, Any]] = None,
         save_args: Optional[Dict[str, Any]] = None,
+        load_mode: str = "list",
     ) -> None:
         """
         Creates a new instance of ``BioSequenceLocalDataSet`` pointing
@@ -90,10 +129,27 @@ class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
             filepath: path to sequence file
             load_args: Options for loading sequence files. Here you can find
                 all supported file formats: https://biopython.org/wiki/SeqIO
+                If ``chunksize`` is set, ``load`` returns an iterator of
+                lists of ``chunksize`` records.
             save_args: args supported by Biopython are 'handle' and 'format'.
                 Handle by default is equal to ``filepath``.
+            load_mode: How records are loaded, must be one of ['list',
+                'iterator', 'index']. 'list' reads all the records in a
+                list, 'iterator' returns the lazy iterator of
+                ``SeqIO.parse`` and 'index' returns the read-only
+                dictionary of ``SeqIO.index``, which reads records by id
+                from the file on access.
+
+        Raises:
+            ValueError: If 'load_mode' is not one of ['list', 'iterator',
+                'index'].
 
         """
+        if load_mode not in LOAD_MODES:
+            raise ValueError(
+                "load_mode should be one of {}, got {}".format(LOAD_MODES, load_mode)
+            )
+
         self._filepath = filepath
         default_load_args = {}
         default_save_args = {}
@@ -107,13 +163,26 @@ class BioSequenceLocalDataSet(AbstractDataSet, ExistsMixin):
             if save_args is not None
             else default_save_args
         )
+        self._load_mode = load_mode
+
+    def _load(self) -> Union[List, Iterator, Dict[str, SeqRecord]]:
+        load_args = self._load_args.copy()
+        chunksize = load_args.pop("chunksize", None)
+        if self._load_mode == "index":
+            return SeqIO.index(self._filepath, **load_args)
 
-    def _load(self) -> List:
-        return list(SeqIO.parse(self._filepath, **self._load_args))
+        records = SeqIO.parse(self._filepath, **load_args)
+        if chunksize:
+            return _iterate_batches(records, chunksize)
+        if self._load_mode == "iterator":
+            return records
+        return list(records)
 
-    def _save(self, data: list) -> None:
+    def _save(self, data: Union[SeqRecord, Iterable[Any]]) -> None:
         save_path = Path(self._filepath)
         save_path.parent.mkdir(parents=True, exist_ok=True)
+        if not isinstance(data, SeqRecord):
+            data = _flatten_records(data)
         SeqIO.write(data, handle=str(save_path), **self._save_args)
 
     def _exists(self) -> bool:
@@ -31,13 +31,59 @@
 """
 
 import pickle
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from pyspark import StorageLevel
 from pyspark.sql import DataFrame, SparkSession
-from pyspark.sql.utils import AnalysisException
 
 from kedro.io import AbstractDataSet, ExistsMixin
 
+# options handled by the data set rather than passed to Spark
+LOAD_OPTIONS = ("persist", "repartition", "coalesce")
+SAVE_OPTIONS = ("repartition", "coalesce", "bucketBy", "sortBy", "tableName")
+
+
+def _split_options(
+    args: Dict[str, Any], options: Tuple[str, ...]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    spark_args = {k: v for k, v in args.items() if k not in options}
+    kedro_args = {k: v for k, v in args.items() if k in options}
+    return spark_args, kedro_args
+
+
+def _get_storage_level(persist: Any) -> StorageLevel:
+    if persist is True:
+        return StorageLevel.MEMORY_AND_DISK
+    storage_level = getattr(StorageLevel, str(persist), None)
+    if not isinstance(storage_level, StorageLevel):
+        raise ValueError(
+            "`persist` should be True or the name of a pyspark "
+            "StorageLevel, got {}".format(persist)
+        )
+    return storage_level
+
+
+def _partition(data: DataFrame, options: Dict[str, Any]) -> DataFrame:
+    """Repartitions the data frame by a number of partitions, a list of
+    columns or both, given as ``numPartitions`` and ``cols``, and/or
+    coalesces it to a number of partitions.
+    """
+    repartition = options.get("repartition")
+    if isinstance(repartition, int):
+        data = data.repartition(repartition)
+    elif isinstance(repartition, dict):
+        cols = repartition.get("cols", [])
+        if "numPartitions" in repartition:
+            data = data.repartition(repartition["numPartitions"], *cols)
+        else:
+            data = data.repartition(*cols)
+    elif repartition:
+        data = data.repartition(*repartition)
+
+    if options.get("coalesce"):
+        data = data.coalesce(options["coalesce"])
+    return data
+
 
 class SparkDataSet(AbstractDataSet, ExistsMixin):
     """``SparkDataSet`` loads and saves Spark data frames.
@@ -64,6 +110,27 @@ class SparkDataSet(AbstractDataSet, ExistsMixin):
         >>> reloaded = data_set.load()
         >>>
         >>> reloaded.take(4)
+
+    Besides the options of the file format, ``load_args`` and ``save_args``
+    accept options controlling the partitioning and caching of the data
+    frame. For example, the following catalog entry persists the loaded data
+    frame, so that nodes sharing it do not scan the files again, and writes
+    a data frame partitioned by date and bucketed by user as a table:
+    ::
+
+        events:
+          type: kedro.contrib.io.pyspark.SparkDataSet
+          filepath: data/02_intermediate/events
+          load_args:
+            persist: MEMORY_AND_DISK
+            repartition: {numPartitions: 200, cols: [user_id]}
+          save_args:
+            mode: overwrite
+            coalesce: 16
+            partitionBy: [date]
+            bucketBy: {numBuckets: 8, cols: [user_id]}
+            sortBy: [user_id]
+            tableName: events
     """
 
     def _describe(self) -> Dict[str, Any]:
@@ -95,6 +162,12 @@ class SparkDataSet(AbstractDataSet, ExistsMixin):
                 a list of read options for each supported format
                 in Spark DataFrame read documentation:
                 https://spark.apache.org/docs/latest/api/python/pyspark.sql.html#pyspark.sql.DataFrame
+                Additionally, ``repartition`` (a number of partitions, a
+                list of columns or a dictionary with ``numPartitions`` and
+                ``cols``) and ``coalesce`` (a number of partitions) set the
+                partitioning of the loaded data frame, and ``persist``
+                (True or the name of a ``StorageLevel``, e.g.
+                ``MEMORY_AND_DISK``) persists it.
             save_args: Save args passed to Spark DataFrame write options.
                 Similar to load_args this is dependent on the selected file
                 format. You can pass ``mode`` and ``partitionBy`` to specify
@@ -102,6 +175,17 @@ class SparkDataSet(AbstractDataSet, ExistsMixin):
                 a list of options for each format in Spark DataFrame
                 write documentation:
                 https://spark.apache.org/docs/latest/api/python/pyspark.sql.html#pyspark.sql.DataFrame
+                Additionally, ``repartition`` and ``coalesce`` set the
+                partitioning of the data frame before it is written, and
+                ``bucketBy`` (a dictionary with ``numBuckets`` and
+                ``cols``), optionally with ``sortBy`` (a list of columns),
+                buckets the output. Bucketed data is saved as the table
+                ``tableName`` stored in ``filepath``.
+
+        Raises:
+            ValueError: When ``persist`` is not a valid storage level or
+                ``bucketBy`` is set without ``tableName``.
+
         """
 
         self._filepath = filepath
@@ -109,26 +193,54 @@ class SparkDataSet(AbstractDataSet, ExistsMixin):
         self._load_args = load_args if load_args is not None else {}
         self._save_args = save_args if save_args is not None else {}
 
+        _, load_options = _split_options(self._load_args, LOAD_OPTIONS)
+        if "persist" in load_options:
+            _get_storage_level(load_options["persist"])
+        _, save_options = _split_options(self._save_args, SAVE_OPTIONS)
+        if "bucketBy" in save_options and "tableName" not in save_options:
+            raise ValueError("`bucketBy` requires `tableName` to be set.")
+
     @staticmethod
     def _get_spark():
         return SparkSession.builder.getOrCreate()
 
     def _load(self) -> DataFrame:
-        return self._get_spark().read.load(
-            self._filepath, self._file_format, **self._load_args
+        load_args, options = _split_options(self._load_args, LOAD_OPTIONS)
+        data = self._get_spark().read.load(
+            self._filepath, self._file_format, **load_args
         )
+        data = _partition(data, options)
+        if options.get("persist"):
+            data = data.persist(_get_storage_level(options["persist"]))
+        return data
 
     def _save(self, data: DataFrame) -> None:
-        data.write.save(self._filepath, self._file_format, **self._save_args)
+        save_args, options = _split_options(self._save_args, SAVE_OPTIONS)
+        writer = _partition(data, options).write
+        if "bucketBy" not in options:
+            writer.save(self._filepath, self._file_format, **save_args)
+            return
+
+        bucket_by = options["bucketBy"]
+        writer = writer.bucketBy(bucket_by["numBuckets"], *bucket_by["cols"])
+        if options.get("sortBy"):
+            writer = writer.sortBy(*options["sortBy"])
+        writer.saveAsTable(
+            options["tableName"],
+            format=self._file_format,
+            path=self._filepath,
+            **save_args
+        )
 
     def _exists(self) -> bool:
-        try:
-            self._get_spark().read.load(self._filepath, self._file_format)
-        except AnalysisException as exception:
-            if exception.desc.startswith("Path does not exist:"):
-                return False
-            raise
-        return True
+        # checks the path through the Hadoop FileSystem API, which works for
+        # any file system configured in Spark without reading the files
+        spark_context = self._get_spark().sparkContext
+        # pylint: disable=protected-access
+        hadoop_fs = spark_context._jvm.org.apache.hadoop.fs
+        path = hadoop_fs.Path(self._filepath)
+        file_system = path.getFileSystem(spark_context._jsc.hadoopConfiguration())
+        return file_system.exists(path)
 
     def __getstate__(self):
         raise pickle.PicklingError("PySpark datasets can't be serialized")
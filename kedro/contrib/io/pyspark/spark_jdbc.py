@@ -27,7 +27,8 @@
 # limitations under the License.
 """SparkJDBCDataSet to load and save a PySpark DataFrame via JDBC."""
 import pickle
-from typing import Any, Dict, Optional
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
 
 from pyspark.sql import DataFrame, SparkSession
 
@@ -35,6 +36,40 @@ from kedro.io import AbstractDataSet, DataSetError
 
 __all__ = ["SparkJDBCDataSet"]
 
+# save_args moved to the connection properties, where Spark reads them
+WRITE_OPTIONS = ("batchsize", "numPartitions", "isolationLevel")
+
+
+def _format_bound(bound: date) -> str:
+    if isinstance(bound, datetime):
+        return bound.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return bound.isoformat()
+
+
+def _get_date_predicates(
+    column: str, lower: date, upper: date, num_partitions: int
+) -> List[str]:
+    """Splits the range of a date or timestamp column into
+    ``num_partitions`` predicates, which together select every row,
+    including the ones where the column is null.
+    """
+    step = (upper - lower) / num_partitions
+    if not isinstance(lower, datetime):
+        # dates are split on whole days
+        step = timedelta(days=max(step.days, 1))
+    bounds = sorted({lower + i * step for i in range(1, num_partitions)})
+    bounds = [_format_bound(bound) for bound in bounds if lower < bound <= upper]
+    if not bounds:
+        return ["1 = 1"]
+
+    predicates = ["{0} < '{1}' OR {0} IS NULL".format(column, bounds[0])]
+    predicates += [
+        "{0} >= '{1}' AND {0} < '{2}'".format(column, start, end)
+        for start, end in zip(bounds, bounds[1:])
+    ]
+    predicates.append("{} >= '{}'".format(column, bounds[-1]))
+    return predicates
+
 
 class SparkJDBCDataSet(AbstractDataSet):
     """``SparkJDBCDataSet`` loads data from a database table accessible
@@ -69,6 +104,19 @@ class SparkJDBCDataSet(AbstractDataSet):
         >>>
         >>> assert data.toPandas().equals(reloaded.toPandas())
 
+    Large tables can be read in parallel through ``numPartitions``
+    connections by setting ``column`` and ``numPartitions`` in
+    ``load_args``. Unless ``lowerBound`` and ``upperBound`` are given too,
+    the data set queries the minimum and maximum of ``column`` first. The
+    range of numeric columns is split by Spark, and the range of date and
+    timestamp columns is split into a list of predicates:
+    ::
+
+        >>> data_set = SparkJDBCDataSet(
+        >>>     url=url, table=table,
+        >>>     load_args={'column': 'id', 'numPartitions': 16},
+        >>>     save_args={'batchsize': 10000, 'numPartitions': 8})
+
     """
 
     def _describe(self) -> Dict[str, Any]:
@@ -114,13 +162,22 @@ class SparkJDBCDataSet(AbstractDataSet):
                 with the JDBC URL and the name of the table. To find all
                 supported arguments, see here:
                 https://spark.apache.org/docs/latest/api/python/pyspark.sql.html?highlight=jdbc#pyspark.sql.DataFrameReader.jdbc
+                If ``column`` and ``numPartitions`` are set without
+                ``lowerBound`` and ``upperBound``, the bounds are read
+                from the table before it is loaded.
             save_args: Provided to underlying PySpark ``jdbc`` function along
                 with the JDBC URL and the name of the table. To find all
                 supported arguments, see here:
                 https://spark.apache.org/docs/latest/api/python/pyspark.sql.html?highlight=jdbc#pyspark.sql.DataFrameWriter.jdbc
+                ``batchsize``, the number of rows inserted per round trip,
+                ``numPartitions``, the maximum number of parallel
+                connections, and ``isolationLevel`` are passed to the JDBC
+                writer through ``properties``.
 
         Raises:
-            DataSetError: When either ``url`` or ``table`` is empty.
+            DataSetError: When either ``url`` or ``table`` is empty, or only
+                one of ``lowerBound`` and ``upperBound`` is set in
+                ``load_args``.
 
         """
 
@@ -138,6 +195,13 @@ class SparkJDBCDataSet(AbstractDataSet):
                 "data to."
             )
 
+        if load_args and ("lowerBound" in load_args) != ("upperBound" in load_args):
+            raise DataSetError(
+                "`lowerBound` and `upperBound` must be set together in "
+                "`load_args`. Please set both of them, or neither of them "
+                "to read them from the table."
+            )
+
         self._url = url
         self._table = table
         self._load_args = load_args if load_args is not None else {}
@@ -154,11 +218,53 @@ class SparkJDBCDataSet(AbstractDataSet):
     def _get_spark():
         return SparkSession.builder.getOrCreate()
 
+    def _get_bounds(self, column: str) -> Any:
+        query = (
+            "(SELECT MIN({0}) AS lower_bound, MAX({0}) AS upper_bound "
+            "FROM {1}) kedro_bounds".format(column, self._table)
+        )
+        properties = self._load_args.get("properties")
+        reader = self._get_spark().read
+        if properties is None:
+            return reader.jdbc(self._url, query).collect()[0]
+        return reader.jdbc(self._url, query, properties=properties).collect()[0]
+
+    def _get_partitioning_args(self) -> Dict[str, Any]:
+        """Returns the load arguments with the partitioning bounds, if
+        ``column`` and ``numPartitions`` are set without them."""
+        load_args = self._load_args
+        column = load_args.get("column")
+        if not column or "numPartitions" not in load_args or "lowerBound" in load_args:
+            return load_args
+
+        lower, upper = self._get_bounds(column)
+        load_args = {k: v for k, v in load_args.items() if k != "column"}
+        num_partitions = load_args.pop("numPartitions")
+        if lower is None:
+            # empty table
+            return load_args
+        if isinstance(lower, date):
+            predicates = _get_date_predicates(column, lower, upper, num_partitions)
+            return {**load_args, "predicates": predicates}
+        return {
+            **load_args,
+            "column": column,
+            "lowerBound": int(lower),
+            "upperBound": int(upper),
+            "numPartitions": num_partitions,
+        }
+
     def _load(self) -> DataFrame:
-        return self._get_spark().read.jdbc(self._url, self._table, **self._load_args)
+        return self._get_spark().read.jdbc(
+            self._url, self._table, **self._get_partitioning_args()
+        )
 
     def _save(self, data: DataFrame) -> None:
-        return data.write.jdbc(self._url, self._table, **self._save_args)
+        save_args = {k: v for k, v in self._save_args.items() if k not in WRITE_OPTIONS}
+        options = {k: str(v) for k, v in self._save_args.items() if k in WRITE_OPTIONS}
+        if options:
+            save_args["properties"] = {**save_args.get("properties", {}), **options}
+        return data.write.jdbc(self._url, self._table, **save_args)
 
     def __getstate__(self):
         raise pickle.PicklingError("PySpark datasets can't be serialized")
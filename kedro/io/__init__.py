@@ -44,12 +44,14 @@ from .csv_s3 import CSVS3DataSet  # NOQA
 from .data_catalog import DataCatalog  # NOQA
 from .excel_local import ExcelLocalDataSet  # NOQA
 from .hdf_local import HDFLocalDataSet  # NOQA
+from .json_lines_local import JSONLinesLocalDataSet  # NOQA
 from .json_local import JSONLocalDataSet  # NOQA
 from .lambda_data_set import LambdaDataSet  # NOQA
 from .memory_data_set import MemoryDataSet  # NOQA
 from .parquet_local import ParquetLocalDataSet  # NOQA
 from .pickle_local import PickleLocalDataSet  # NOQA
 from .pickle_s3 import PickleS3DataSet  # NOQA
+from .sql import SQLIncrementalDataSet  # NOQA
 from .sql import SQLQueryDataSet  # NOQA
 from .sql import SQLTableDataSet  # NOQA
 from .text_local import TextLocalDataSet  # NOQA
@@ -33,11 +33,12 @@ saving functionality provided by ``kedro.io``.
 import abc
 import copy
 import logging
+import os
+import shutil
 from collections import namedtuple
-from datetime import datetime, timezone
-from glob import iglob
+from datetime import datetime, timedelta, timezone
 from pathlib import Path, PurePosixPath
-from typing import Any, Dict, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 from warnings import warn
 
 from kedro.utils import load_obj
@@ -45,6 +46,8 @@ from kedro.utils import load_obj
 MAX_DESCRIPTION_LENGTH = 70
 VERSIONED_FLAG_KEY = "versioned"
 VERSION_KEY = "version"
+VERSION_FORMAT = "%Y-%m-%dT%H.%M.%S.%fZ"
+MAX_DELETE_BATCH_SIZE = 1000  # limit of S3 DeleteObjects requests
 
 
 class DataSetError(Exception):
@@ -238,6 +241,27 @@ class AbstractDataSet(abc.ABC):
             )
             raise DataSetError(message) from exc
 
+    def release(self) -> None:
+        """Releases the resources held by the data set, such as connection
+        pools, once it is no longer used. Runners release every data set in
+        the catalog when a run finishes.
+
+        Raises:
+            DataSetError: when underlying release method raises error.
+
+        """
+
+        try:
+            logging.getLogger(__name__).debug("Releasing %s", str(self))
+            self._release()
+        except DataSetError:
+            raise
+        except Exception as exc:
+            message = "Failed while releasing data set {}.\n{}".format(
+                str(self), str(exc)
+            )
+            raise DataSetError(message) from exc
+
     def __str__(self):
         def _to_str(obj, is_root=False):
             """Returns a string representation where
@@ -283,6 +307,9 @@ class AbstractDataSet(abc.ABC):
             "it must implement the `_save` method".format(self.__class__.__name__)
         )
 
+    def _release(self) -> None:
+        pass
+
     @abc.abstractmethod
     def _describe(self) -> Dict[str, Any]:
         raise NotImplementedError(
@@ -357,21 +384,182 @@ _PATH_CONSISTENCY_WARNING = (
 )
 
 
+def _parse_version(version: str) -> Optional[datetime]:
+    try:
+        parsed = datetime.strptime(version, VERSION_FORMAT)
+    except ValueError:
+        return None
+    return parsed.replace(tzinfo=timezone.utc)
+
+
+def select_versions_to_prune(
+    versions: Iterable[str],
+    keep_last: int = None,
+    max_age: timedelta = None,
+    pinned: Iterable[str] = None,
+) -> List[str]:
+    """Select the versions which a retention policy does not keep. A version
+    is kept if it is one of the ``keep_last`` most recent versions, if it
+    is younger than ``max_age`` or if it is pinned. The most recent version
+    is always kept. Names which are not timestamps in ``VERSION_FORMAT``,
+    such as backup directories, are not versions: they are never selected
+    and do not count as recent versions.
+
+    Args:
+        versions: Version strings of a data set.
+        keep_last: Number of most recent versions to keep.
+        max_age: Maximum age of the versions to keep.
+        pinned: Versions which must be kept in any case.
+
+    Returns:
+        The versions to delete, most recent first.
+
+    Raises:
+        ValueError: When neither ``keep_last`` nor ``max_age`` is given,
+            or ``keep_last`` or ``max_age`` is not positive.
+
+    """
+    if keep_last is None and max_age is None:
+        raise ValueError("Either `keep_last` or `max_age` must be specified.")
+    if keep_last is not None and keep_last < 1:
+        raise ValueError("`keep_last` must be a positive integer.")
+    if max_age is not None and max_age <= timedelta(0):
+        raise ValueError("`max_age` must be a positive duration.")
+
+    created = {}  # version: creation time
+    for version in versions:
+        created_at = _parse_version(version)
+        if created_at is not None:
+            created[version] = created_at
+    versions = sorted(created, key=created.__getitem__, reverse=True)
+    keep = set(versions[: keep_last or 1]) | set(pinned or ())
+    if max_age is not None:
+        cutoff = datetime.now(tz=timezone.utc) - max_age
+        keep.update(version for version in versions if created[version] > cutoff)
+    return [version for version in versions if version not in keep]
+
+
 # pylint: disable=too-few-public-methods
-class FilepathVersionMixIn:
-    """Mixin class which helps to version filepath-like data sets."""
+class _VersionMixIn:
+    """Base class of the versioning mixins.
+
+    It keeps the latest version resolved by a versioned data set, so that
+    it is not looked up on every ``load`` and ``exists`` call. Entries are
+    marked as stale by saves and refreshed on next use.
+
+    It also provides ``prune_versions``, which deletes the versions not
+    kept by a retention policy.
+    """
+
+    def prune_versions(
+        self,
+        keep_last: int = None,
+        max_age: timedelta = None,
+        pinned: Iterable[str] = None,
+        dry_run: bool = False,
+    ) -> List[str]:
+        """Delete the versions of the data set not kept by a retention
+        policy. See ``kedro.io.core.select_versions_to_prune`` for how the
+        versions to delete are selected. The load version of the data set,
+        if set, is always kept.
+
+        Args:
+            keep_last: Number of most recent versions to keep.
+            max_age: Maximum age of the versions to keep.
+            pinned: Versions which must be kept in any case.
+            dry_run: If True, only report the versions which would
+                have been deleted.
+
+        Returns:
+            The deleted versions.
+
+        Raises:
+            DataSetError: When the data set is not versioned, or the
+                versions could not be listed or deleted.
+
+        """
+        version = getattr(self, "_version", None)
+        if not version:
+            raise DataSetError(
+                "Versions can only be pruned for versioned data sets, "
+                "but {} is not versioned.".format(str(self))
+            )
+        pinned = set(pinned or ())
+        if version.load:
+            pinned.add(version.load)
+        try:
+            to_prune = select_versions_to_prune(
+                self._list_versions(), keep_last, max_age, pinned
+            )
+            if to_prune and not dry_run:
+                self._delete_versions(to_prune)
+                self._version_cache.clear()
+        except (DataSetError, ValueError):
+            raise
+        except Exception as exc:
+            message = "Failed while pruning versions of data set {}.\n{}".format(
+                str(self), str(exc)
+            )
+            raise DataSetError(message) from exc
+        return to_prune
+
+    def _list_versions(self) -> List[str]:
+        raise NotImplementedError(
+            "`{}` does not support listing its versions".format(self.__class__.__name__)
+        )
+
+    def _delete_versions(self, versions: List[str]) -> None:
+        raise NotImplementedError(
+            "`{}` does not support deleting its versions".format(
+                self.__class__.__name__
+            )
+        )
+
+    @property
+    def _version_cache(self) -> Dict[Any, Tuple[str, bool]]:
+        return self.__dict__.setdefault("_latest_versions", {})
+
+    def _invalidate_version_cache(self, cache_key: Any) -> None:
+        if cache_key in self._version_cache:
+            latest, _ = self._version_cache[cache_key]
+            self._version_cache[cache_key] = (latest, True)
+
+    def __getstate__(self):
+        # other processes must resolve versions on their own, since
+        # the ones cached here can be outdated by their saves
+        state = self.__dict__.copy()
+        state.pop("_latest_versions", None)
+        return state
+
+
+# pylint: disable=too-few-public-methods
+class FilepathVersionMixIn(_VersionMixIn):
+    """Mixin class which helps to version filepath-like data sets.
+
+    The latest version found for a data set is cached on the instance, so
+    the versions directory is scanned once per data set rather than on
+    every ``load`` and ``exists`` call. Saving marks the cached version as
+    stale, and the next lookup only checks the versions sorting after it.
+    If the cached version no longer exists, all versions are scanned again.
+
+    ``prune_versions`` expects the data set to keep its path in
+    ``self._filepath`` and its version in ``self._version``.
+    """
 
     def _get_load_path(self, filepath: str, version: Version = None) -> str:
         if not version:
             return filepath
         if version.load:
             return self._get_versioned_path(filepath, version.load)
-        pattern = self._get_versioned_path(filepath, "*")
-        paths = [f for f in iglob(pattern) if Path(f).exists()]
-        if not paths:
-            message = "Did not find any versions for {}".format(str(self))
-            raise DataSetError(message)
-        return sorted(paths, reverse=True)[0]
+        latest, stale = self._version_cache.get(filepath, (None, True))
+        if latest and not Path(latest).exists():
+            # the cached version was deleted behind our back, so the
+            # versions sorting before it have to be scanned again
+            latest, stale = None, True
+        if stale:
+            latest = self._find_latest_path(filepath, latest)
+            self._version_cache[filepath] = (latest, False)
+        return latest
 
     def _get_save_path(self, filepath: str, version: Version = None) -> str:
         if not version:
@@ -384,8 +572,45 @@ class FilepathVersionMixIn:
                 "is enabled.".format(versioned_path, str(self))
             )
             raise DataSetError(message)
+        self._invalidate_version_cache(filepath)
         return versioned_path
 
+    def _find_latest_path(self, filepath: str, known_path: str = None) -> str:
+        known_version = Path(known_path).parent.name if known_path else ""
+        try:
+            versions = [
+                entry.name
+                for entry in os.scandir(filepath)
+                if not entry.name.startswith(".") and entry.name > known_version
+            ]
+        except (FileNotFoundError, NotADirectoryError):
+            versions = []
+        # only stat the candidates until the most recent complete one is found
+        for candidate in sorted(versions, reverse=True):
+            path = self._get_versioned_path(filepath, candidate)
+            if Path(path).exists():
+                return path
+        if known_path:
+            return known_path
+        message = "Did not find any versions for {}".format(str(self))
+        raise DataSetError(message)
+
+    def _list_versions(self) -> List[str]:
+        try:
+            entries = list(os.scandir(self._filepath))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+        return [
+            entry.name
+            for entry in entries
+            if not entry.name.startswith(".")
+            and Path(self._get_versioned_path(self._filepath, entry.name)).exists()
+        ]
+
+    def _delete_versions(self, versions: List[str]) -> None:
+        for version in versions:
+            shutil.rmtree(str(Path(self._filepath) / version))
+
     @staticmethod
     def _get_versioned_path(filepath: str, version: str) -> str:
         filepath = Path(filepath)
@@ -397,8 +622,19 @@ class FilepathVersionMixIn:
 
 
 # pylint: disable=too-few-public-methods
-class S3PathVersionMixIn:
-    """Mixin class which helps to version S3 data sets."""
+class S3PathVersionMixIn(_VersionMixIn):
+    """Mixin class which helps to version S3 data sets.
+
+    The latest version found for a data set is cached on the instance, so
+    the version prefix is listed once per data set rather than on every
+    ``load`` and ``exists`` call. Saving marks the cached version as stale,
+    and the next lookup only lists the keys that sort after it.
+
+    ``prune_versions`` expects the data set to keep its S3 client, bucket
+    name, path and version in ``self._client``, ``self._bucket_name``,
+    ``self._filepath`` and ``self._version``, and deletes the pruned
+    versions with batched ``DeleteObjects`` requests.
+    """
 
     def _get_load_path(
         self, client: Any, bucket: str, filepath: str, version: Version = None
@@ -408,11 +644,19 @@ class S3PathVersionMixIn:
         if version.load:
             return self._get_versioned_path(filepath, version.load)
         prefix = filepath if filepath.endswith("/") else filepath + "/"
-        keys = list(self._list_objects(client, bucket, prefix))
-        if not keys:
-            message = "Did not find any versions for {}".format(str(self))
-            raise DataSetError(message)
-        return sorted(keys, reverse=True)[0]
+        latest, stale = self._version_cache.get((bucket, prefix), (None, True))
+        if stale:
+            # versions sort lexicographically, so only keys listed after
+            # the last known version can be newer than it
+            keys = list(self._list_objects(client, bucket, prefix, latest))
+            if latest:
+                keys.append(latest)
+            if not keys:
+                message = "Did not find any versions for {}".format(str(self))
+                raise DataSetError(message)
+            latest = max(keys)
+            self._version_cache[(bucket, prefix)] = (latest, False)
+        return latest
 
     def _get_save_path(
         self, client: Any, bucket: str, filepath: str, version: Version = None
@@ -427,21 +671,49 @@ class S3PathVersionMixIn:
                 "is enabled.".format(versioned_path, str(self))
             )
             raise DataSetError(message)
+        prefix = filepath if filepath.endswith("/") else filepath + "/"
+        self._invalidate_version_cache((bucket, prefix))
         return versioned_path
 
     def _check_paths_consistency(self, load_path: str, save_path: str):
         if load_path != save_path:
             warn(_PATH_CONSISTENCY_WARNING.format(save_path, load_path, str(self)))
 
+    def _list_versions(self) -> List[str]:
+        filepath = self._filepath
+        prefix = filepath if filepath.endswith("/") else filepath + "/"
+        versions = set()
+        for key in self._list_objects(self._client, self._bucket_name, prefix):
+            version = key[len(prefix) :].split("/", 1)[0]
+            if key == self._get_versioned_path(filepath, version):
+                versions.add(version)
+        return list(versions)
+
+    def _delete_versions(self, versions: List[str]) -> None:
+        keys = [self._get_versioned_path(self._filepath, v) for v in versions]
+        for start in range(0, len(keys), MAX_DELETE_BATCH_SIZE):
+            batch = keys[start : start + MAX_DELETE_BATCH_SIZE]
+            response = self._client.delete_objects(
+                Bucket=self._bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            if response.get("Errors"):
+                raise DataSetError(
+                    "Failed to delete {} objects, first error: {}".format(
+                        len(response["Errors"]), response["Errors"][0]
+                    )
+                )
+
     @staticmethod
     def _get_versioned_path(filepath: str, version: str) -> str:
         filepath = PurePosixPath(filepath)
         return str(filepath / version / filepath.name)
 
     @staticmethod
-    def _list_objects(client: Any, bucket: str, prefix: str):
+    def _list_objects(client: Any, bucket: str, prefix: str, start_after: str = None):
         paginator = client.get_paginator("list_objects_v2")
-        page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix)
+        kwargs = {"StartAfter": start_after} if start_after else {}
+        page_iterator = paginator.paginate(Bucket=bucket, Prefix=prefix, **kwargs)
         for page in page_iterator:
             yield from (
                 obj["Key"]
@@ -31,7 +31,7 @@ underlying functionality is supported by pandas, so it supports all
 allowed pandas options for loading and saving csv files.
 """
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Union
 
 import pandas as pd
 
@@ -47,7 +47,10 @@ from kedro.io.core import (
 class CSVLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
     """``CSVLocalDataSet`` loads and saves data to a local csv file. The
     underlying functionality is supported by pandas, so it supports all
-    allowed pandas options for loading and saving csv files.
+    allowed pandas options for loading and saving csv files. Data frames can
+    also be saved chunk by chunk from an iterable, such as the chunks yielded
+    by a generator node, and loaded in chunks with the ``chunksize`` load
+    argument.
 
     Example:
     ::
@@ -67,6 +70,8 @@ class CSVLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
 
     """
 
+    _SAVES_CHUNKS = True
+
     def _describe(self) -> Dict[str, Any]:
         return dict(
             filepath=self._filepath,
@@ -119,16 +124,28 @@ class CSVLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
         load_path = self._get_load_path(self._filepath, self._version)
         return pd.read_csv(load_path, **self._load_args)
 
-    def _save(self, data: pd.DataFrame) -> None:
+    def _save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
         save_path = Path(self._get_save_path(self._filepath, self._version))
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        data.to_csv(str(save_path), **self._save_args)
+        if isinstance(data, pd.DataFrame):
+            data.to_csv(str(save_path), **self._save_args)
+        else:
+            self._save_chunks(str(save_path), data)
 
         load_path = Path(self._get_load_path(self._filepath, self._version))
         self._check_paths_consistency(
             str(load_path.absolute()), str(save_path.absolute())
         )
 
+    def _save_chunks(self, save_path: str, chunks: Iterable[pd.DataFrame]) -> None:
+        # the first chunk writes the header, the following ones are appended
+        save_args = self._save_args
+        for chunk in chunks:
+            chunk.to_csv(save_path, **save_args)
+            save_args = {**self._save_args, "mode": "a", "header": False}
+        if save_args is self._save_args:
+            pd.DataFrame().to_csv(save_path, **save_args)
+
     def _exists(self) -> bool:
         try:
             path = self._get_load_path(self._filepath, self._version)
@@ -29,6 +29,7 @@
 """``CSVS3DataSet`` loads and saves data to a file in S3. It uses s3fs
 to read and write from S3 and pandas to handle the csv file.
 """
+from io import BytesIO, TextIOWrapper
 from typing import Any, Dict, Optional
 
 import pandas as pd
@@ -41,6 +42,11 @@ from kedro.io.core import (
     S3PathVersionMixIn,
     Version,
 )
+from kedro.io.s3_transfer import (
+    S3MultipartWriter,
+    get_transfer_args,
+    read_s3_object,
+)
 
 
 class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
@@ -72,6 +78,7 @@ class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             bucket_name=self._bucket_name,
             load_args=self._load_args,
             save_args=self._save_args,
+            transfer_args=self._transfer_args,
             version=self._version,
         )
 
@@ -84,6 +91,7 @@ class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
         load_args: Optional[Dict[str, Any]] = None,
         save_args: Optional[Dict[str, Any]] = None,
         version: Version = None,
+        transfer_args: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Creates a new instance of ``CSVS3DataSet`` pointing to a concrete
         csv file on S3.
@@ -105,6 +113,15 @@ class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
                 ``kedro.io.core.Version``. If its ``load`` attribute is
                 None, the latest version will be loaded. If its ``save``
                 attribute is None, save version will be autogenerated.
+            transfer_args: Options for transferring the file to and from
+                S3: ``part_size`` is the size in bytes of each multipart
+                upload part and ranged download request (at least 5 MiB,
+                8 MiB by default) and ``max_concurrency`` is the number of
+                parts transferred in parallel (10 by default).
+
+        Raises:
+            DataSetError: When ``transfer_args`` has unknown or invalid
+                options.
 
         """
         default_save_args = {"index": False}
@@ -116,6 +133,7 @@ class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
         self._bucket_name = bucket_name
         self._credentials = credentials if credentials else {}
         self._version = version
+        self._transfer_args = get_transfer_args(transfer_args)
         self._s3 = S3FileSystem(client_kwargs=self._credentials)
 
     @property
@@ -127,21 +145,28 @@ class CSVS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             self._client, self._bucket_name, self._filepath, self._version
         )
 
-        with self._s3.open(
-            "{}/{}".format(self._bucket_name, load_key), mode="rb"
-        ) as s3_file:
-            return pd.read_csv(s3_file, **self._load_args)
+        content = read_s3_object(
+            self._client, self._bucket_name, load_key, **self._transfer_args
+        )
+        return pd.read_csv(BytesIO(content), **self._load_args)
 
     def _save(self, data: pd.DataFrame) -> None:
         save_key = self._get_save_path(
             self._client, self._bucket_name, self._filepath, self._version
         )
 
-        with self._s3.open(
-            "{}/{}".format(self._bucket_name, save_key), mode="wb"
+        with S3MultipartWriter(
+            self._client, self._bucket_name, save_key, **self._transfer_args
         ) as s3_file:
-            # Only binary read and write modes are implemented for S3Files
-            s3_file.write(data.to_csv(**self._save_args).encode("utf8"))
+            # serialise straight into the multipart upload instead of
+            # building the whole csv in memory first
+            text_file = TextIOWrapper(s3_file, encoding="utf8", newline="")
+            try:
+                data.to_csv(text_file, **self._save_args)
+            finally:
+                # the wrapper must never close the upload: closing completes
+                # it, whereas a failed save is aborted when leaving the block
+                text_file.detach()
 
         load_key = self._get_load_path(
             self._client, self._bucket_name, self._filepath, self._version
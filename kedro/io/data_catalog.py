@@ -33,6 +33,7 @@ relaying load and save functions to the underlying data sets.
 """
 import copy
 import logging
+from datetime import timedelta
 from typing import Any, Dict, List, Optional, Type
 
 from kedro.io.core import (
@@ -422,6 +423,80 @@ class DataCatalog:
 
             self.add(data_set_name, data_set, replace)
 
+    def prune_versions(
+        self,
+        keep_last: int = None,
+        max_age: timedelta = None,
+        load_versions: Dict[str, str] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, List[str]]:
+        """Deletes the versions of all versioned data sets in the catalog
+        which are not kept by the retention policy. A version is kept if it
+        is one of the ``keep_last`` most recent versions of its data set, if
+        it is younger than ``max_age``, or if it is the load version of its
+        data set. The most recent version of each data set is always kept.
+
+        Args:
+            keep_last: Number of most recent versions to keep per data set.
+            max_age: Maximum age of the versions to keep.
+            load_versions: Additional versions to keep, as a mapping of
+                data set names to version strings.
+            dry_run: If True, only report the versions which would
+                have been deleted.
+
+        Returns:
+            A dictionary mapping the names of the data sets which had
+            versions deleted to the deleted versions.
+
+        Raises:
+            DataSetError: When pruning the versions of a data set fails.
+            ValueError: When neither ``keep_last`` nor ``max_age`` is given.
+
+        Example:
+        ::
+
+            >>> from datetime import timedelta
+            >>>
+            >>> io = DataCatalog.from_config(config)
+            >>> io.prune_versions(keep_last=5, max_age=timedelta(days=30))
+        """
+        load_versions = load_versions or {}
+        pruned = {}
+        for name, data_set in self._data_sets.items():
+            versioned = getattr(data_set, "_version", None)
+            if not versioned or not hasattr(data_set, "prune_versions"):
+                continue
+            pinned = [load_versions[name]] if name in load_versions else None
+            versions = data_set.prune_versions(keep_last, max_age, pinned, dry_run)
+            if versions:
+                self._logger.info(
+                    "%s %d versions of `%s`",
+                    "Would delete" if dry_run else "Deleted",
+                    len(versions),
+                    name,
+                )
+                pruned[name] = versions
+        return pruned
+
+    def release(self) -> None:
+        """Release the resources held by the data sets of the catalog, such
+        as connection pools. Runners call it when a run finishes. Every
+        data set is released, even if releasing another one fails.
+
+        Raises:
+            DataSetError: When any data set fails to release its resources.
+
+        """
+        errors = []
+        for name, data_set in self._data_sets.items():
+            try:
+                data_set.release()
+            except Exception as exc:  # pylint: disable=broad-except
+                self._logger.error("Failed to release data set `%s`: %s", name, exc)
+                errors.append(str(exc))
+        if errors:
+            raise DataSetError("\n".join(errors))
+
     def list(self) -> List[str]:
         """List of ``DataSet`` names registered in the catalog.
 
@@ -31,7 +31,7 @@ underlying functionality is supported by pandas, so it supports all
 allowed pandas options for loading and saving hdf files.
 """
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Union
 
 import pandas as pd
 from pandas.io.pytables import HDFStore
@@ -45,6 +45,18 @@ from kedro.io.core import (
 )
 
 
+def _iterate_hdf_chunks(
+    chunks: Iterator[pd.DataFrame], store: HDFStore
+) -> Iterator[pd.DataFrame]:
+    """Yields the data frames selected from an open HDF store and closes
+    the store once the iteration stops.
+    """
+    try:
+        yield from chunks
+    finally:
+        store.close()
+
+
 class HDFLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
     """``HDFLocalDataSet`` loads and saves data to a local hdf file. The
     underlying functionality is supported by pandas, so it supports all
@@ -67,6 +79,29 @@ class HDFLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
         >>>
         >>> assert data.equals(reloaded)
 
+    Data sets saved in the ``table`` format can be appended to and queried
+    without reading the whole store. For example, the following catalog
+    entries append daily slices to a store and load a time window of its
+    ``value`` column in chunks of 100000 rows:
+    ::
+
+        daily_events:
+          type: HDFLocalDataSet
+          filepath: data/02_intermediate/events.h5
+          key: events
+          save_args:
+            append: True
+            data_columns: ['timestamp']
+
+        last_week_events:
+          type: HDFLocalDataSet
+          filepath: data/02_intermediate/events.h5
+          key: events
+          load_args:
+            where: "timestamp >= '2019-06-01'"
+            columns: ['timestamp', 'value']
+            chunksize: 100000
+
     """
 
     # pylint: disable=too-many-arguments
@@ -87,16 +122,27 @@ class HDFLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
             load_args: Pandas options for loading hdf files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_hdf.html
-                All defaults are preserved.
+                All defaults are preserved. ``where`` and ``columns``
+                select rows and columns of stores saved in the ``table``
+                format. If ``chunksize`` is set, ``load`` returns an
+                iterator of data frames, which keeps the file open until
+                it is exhausted.
             save_args: Pandas options for saving hdf files.
                 Here you can find all available arguments:
                 https://pandas.pydata.org/pandas-docs/stable/generated/pandas.DataFrame.to_hdf.html
-                All defaults are preserved.
+                All defaults are preserved. If ``append`` is True, the data
+                is appended to the existing table in the ``table`` format.
+                Columns which are queried with ``where`` on load should be
+                listed in ``data_columns``.
             version: If specified, should be an instance of
                 ``kedro.io.core.Version``. If its ``load`` attribute is
                 None, the latest version will be loaded. If its ``save``
                 attribute is None, save version will be autogenerated.
 
+        Raises:
+            DataSetError: When ``append`` is set in ``save_args`` of a
+                versioned data set.
+
         """
         default_load_args = {}
         default_save_args = {}
@@ -114,8 +160,26 @@ class HDFLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
         )
         self._version = version
 
-    def _load(self) -> pd.DataFrame:
+        if self._save_args.get("append"):
+            if version is not None:
+                raise DataSetError(
+                    "Appending is not supported for versioned "
+                    "`HDFLocalDataSet`, as every save creates a new file."
+                )
+            # only tables can be appended to
+            self._save_args.setdefault("format", "table")
+
+    def _load(self) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         load_path = self._get_load_path(self._filepath, self._version)
+        if self._load_args.get("chunksize"):
+            load_args = {k: v for k, v in self._load_args.items() if k != "iterator"}
+            store = HDFStore(load_path, mode="r")
+            try:
+                chunks = store.select(self._key, iterator=True, **load_args)
+            except Exception:
+                store.close()
+                raise
+            return _iterate_hdf_chunks(chunks, store)
         return pd.read_hdf(load_path, key=self._key, **self._load_args)
 
     def _save(self, data: pd.DataFrame) -> None:
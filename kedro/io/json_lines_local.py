@@ -0,0 +1,225 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``JSONLinesLocalDataSet`` streams records to and from a local JSON Lines
+file, which holds one json encoded record per line.
+"""
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Union
+
+import pandas as pd
+
+from kedro.io.core import (
+    AbstractDataSet,
+    DataSetError,
+    ExistsMixin,
+    FilepathVersionMixIn,
+    Version,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _iterate_records(path: str, loads: Callable[[bytes], Any]) -> Iterator[Any]:
+    # the file is opened by the first iteration, so that it is not left
+    # open by an iterator which is never consumed
+    with open(path, "rb") as local_file:
+        for line in local_file:
+            if line.strip():
+                yield loads(line)
+
+
+def _iterate_chunks(records: Iterator[Any], chunksize: int) -> Iterator[pd.DataFrame]:
+    while True:
+        chunk = list(islice(records, chunksize))
+        if not chunk:
+            return
+        yield pd.DataFrame.from_records(chunk)
+
+
+class JSONLinesLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
+    """``JSONLinesLocalDataSet`` loads and saves records lazily from and to a
+    local JSON Lines file, so that files larger than memory can be streamed
+    through nodes. ``load`` returns an iterator of the records, or of data
+    frames holding ``chunksize`` records each. ``save`` accepts a data
+    frame or an iterable of records or data frames, e.g. the output of a
+    generator, and writes them in batches of ``buffer_size`` records.
+
+    The records are encoded and decoded with ``orjson`` if it is installed,
+    or with Python's ``json`` library otherwise.
+
+    Example:
+    ::
+
+        >>> from kedro.io import JSONLinesLocalDataSet
+        >>>
+        >>> events = ({'id': i, 'value': i * 2} for i in range(10))
+        >>> data_set = JSONLinesLocalDataSet(filepath="events.jsonl")
+        >>> data_set.save(events)
+        >>> for event in data_set.load():
+        >>>     print(event['value'])
+
+    """
+
+    _SAVES_CHUNKS = True
+
+    def _describe(self) -> Dict[str, Any]:
+        return dict(
+            filepath=self._filepath,
+            backend=self._backend,
+            load_args=self._load_args,
+            save_args=self._save_args,
+            version=self._version,
+        )
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        filepath: str,
+        backend: str = "auto",
+        load_args: Dict[str, Any] = None,
+        save_args: Dict[str, Any] = None,
+        version: Version = None,
+    ) -> None:
+        """Creates a new instance of ``JSONLinesLocalDataSet`` pointing to a
+        concrete filepath.
+
+        Args:
+            filepath: path to a local JSON Lines file.
+            backend: json codec to use, must be one of ['auto', 'json',
+                'orjson']. 'auto' uses ``orjson`` if it is installed and
+                ``json`` otherwise.
+            load_args: Options for loading JSON Lines files. If
+                ``chunksize`` is set, ``load`` returns an iterator of data
+                frames of ``chunksize`` records instead of an iterator of
+                records.
+            save_args: Options for saving JSON Lines files. ``buffer_size``
+                is the number of records encoded before they are written
+                to the file. Defaults to 1000.
+            version: If specified, should be an instance of
+                ``kedro.io.core.Version``. If its ``load`` attribute is
+                None, the latest version will be loaded. If its ``save``
+                attribute is None, save version will be autogenerated.
+
+        Raises:
+            ValueError: If 'backend' is not one of ['auto', 'json', 'orjson'].
+            ImportError: If 'backend' could not be imported.
+
+        """
+        default_save_args = {"buffer_size": 1000}
+        default_load_args = {}
+
+        if backend not in ["auto", "json", "orjson"]:
+            raise ValueError(
+                "backend should be one of ['auto', 'json', 'orjson'], "
+                "got %s" % backend
+            )
+        if backend == "orjson" and orjson is None:
+            raise ImportError(
+                "selected backend 'orjson' could not be "
+                "imported. Make sure it is installed."
+            )
+
+        self._filepath = filepath
+        self._backend = backend
+        self._load_args = (
+            {**default_load_args, **load_args}
+            if load_args is not None
+            else default_load_args
+        )
+        self._save_args = (
+            {**default_save_args, **save_args}
+            if save_args is not None
+            else default_save_args
+        )
+        self._version = version
+
+    def _use_orjson(self) -> bool:
+        return self._backend == "orjson" or (
+            self._backend == "auto" and orjson is not None
+        )
+
+    def _load(self) -> Union[Iterator[Any], Iterator[pd.DataFrame]]:
+        load_path = self._get_load_path(self._filepath, self._version)
+        if not Path(load_path).is_file():
+            # a missing file fails the load rather than the first iteration
+            raise DataSetError("No such file: `{}`".format(load_path))
+        loads = orjson.loads if self._use_orjson() else json.loads
+        records = _iterate_records(load_path, loads)
+        chunksize = self._load_args.get("chunksize")
+        if chunksize:
+            return _iterate_chunks(records, chunksize)
+        return records
+
+    def _encode_records(self, records: Iterable[Any]) -> bytes:
+        if self._use_orjson():
+            return b"".join(orjson.dumps(record) + b"\n" for record in records)
+        return "".join(json.dumps(record) + "\n" for record in records).encode("utf-8")
+
+    def _write(self, local_file: IO[bytes], data: Any) -> None:
+        if isinstance(data, pd.DataFrame):
+            data = [data]
+
+        buffer_size = self._save_args["buffer_size"]
+        buffer = []
+        for item in data:
+            if isinstance(item, pd.DataFrame):
+                local_file.write(self._encode_records(buffer))
+                buffer = []
+                if not item.empty:
+                    lines = item.to_json(orient="records", lines=True)
+                    local_file.write(lines.rstrip("\n").encode("utf-8") + b"\n")
+                continue
+            buffer.append(item)
+            if len(buffer) >= buffer_size:
+                local_file.write(self._encode_records(buffer))
+                buffer = []
+        local_file.write(self._encode_records(buffer))
+
+    def _save(self, data: Union[pd.DataFrame, Iterable[Any]]) -> None:
+        save_path = Path(self._get_save_path(self._filepath, self._version))
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        with save_path.open("wb") as local_file:
+            self._write(local_file, data)
+
+        load_path = Path(self._get_load_path(self._filepath, self._version))
+        self._check_paths_consistency(
+            str(load_path.absolute()), str(save_path.absolute())
+        )
+
+    def _exists(self) -> bool:
+        try:
+            path = self._get_load_path(self._filepath, self._version)
+        except DataSetError:
+            return False
+        return Path(path).is_file()
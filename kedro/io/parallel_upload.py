@@ -0,0 +1,174 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``kedro.io.parallel_upload`` provides the base class of the writable file
+objects which upload their content in parts, such as ``S3MultipartWriter``
+and ``BlobBlockWriter``.
+"""
+import abc
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+
+class ParallelUploadWriter(io.RawIOBase, abc.ABC):
+    """``ParallelUploadWriter`` is the base class of writable binary file
+    objects which upload their content in parts of ``part_size`` bytes. Up
+    to ``max_concurrency`` parts are uploaded in parallel, and writing
+    blocks once that many parts are in flight, so the memory held by the
+    writer is bounded by roughly ``(max_concurrency + 1) * part_size`` bytes.
+
+    Content smaller than ``part_size`` is sent with ``_put``. Otherwise the
+    parts are committed with ``_commit`` when the writer is closed. If the
+    upload fails, or if an error is raised inside a ``with`` block, the
+    writer is aborted instead. The writer is closed in every case, so it
+    never uploads anything once an upload has failed.
+    """
+
+    def __init__(self, part_size: int, max_concurrency: int) -> None:
+        """Creates a new instance of ``ParallelUploadWriter``.
+
+        Args:
+            part_size: Size of each uploaded part in bytes.
+            max_concurrency: Maximum number of parts uploaded in parallel.
+
+        """
+        super().__init__()
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._futures = []  # type: List[Any]
+
+    @abc.abstractmethod
+    def _put(self, body: bytes) -> None:
+        raise NotImplementedError(
+            "`{}` is a subclass of ParallelUploadWriter and "
+            "it must implement the `_put` method".format(self.__class__.__name__)
+        )
+
+    @abc.abstractmethod
+    def _upload_part(self, index: int, body: bytes) -> Any:
+        raise NotImplementedError(
+            "`{}` is a subclass of ParallelUploadWriter and "
+            "it must implement the `_upload_part` method".format(
+                self.__class__.__name__
+            )
+        )
+
+    @abc.abstractmethod
+    def _commit(self, parts: List[Any]) -> None:
+        raise NotImplementedError(
+            "`{}` is a subclass of ParallelUploadWriter and "
+            "it must implement the `_commit` method".format(self.__class__.__name__)
+        )
+
+    def _start(self) -> None:
+        """Called before the first part is uploaded."""
+
+    def _abort_upload(self) -> None:
+        """Called once the parts in flight are uploaded or cancelled when
+        the writer is aborted."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # pylint: disable=arguments-differ
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        # slice large writes into parts directly rather than copying
+        # them into the buffer first, so at most one extra part is held
+        view = memoryview(data).cast("B")
+        size = len(view)
+        if self._buffer:
+            missing = self._part_size - len(self._buffer)
+            self._buffer += view[:missing]
+            view = view[missing:]
+            if len(self._buffer) < self._part_size:
+                return size
+            self._submit_part(bytes(self._buffer))
+            self._buffer = bytearray()
+        while len(view) >= self._part_size:
+            self._submit_part(bytes(view[: self._part_size]))
+            view = view[self._part_size :]
+        self._buffer += view
+        return size
+
+    def close(self) -> None:
+        """Uploads the remaining content and commits the upload."""
+        if self.closed:
+            return
+        try:
+            if self._executor is None:
+                self._put(bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._submit_part(bytes(self._buffer))
+                self._commit([future.result() for future in self._futures])
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._release()
+            super().close()
+
+    def abort(self) -> None:
+        """Discards the content written so far."""
+        try:
+            if self._executor is not None:
+                for future in self._futures:
+                    future.cancel()
+                self._executor.shutdown(wait=True)
+                self._abort_upload()
+        finally:
+            self._release()
+            super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def _submit_part(self, body: bytes) -> None:
+        if self._executor is None:
+            self._start()
+            self._executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+        self._slots.acquire()  # pylint: disable=consider-using-with
+        future = self._executor.submit(self._upload_part, len(self._futures), body)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+    def _release(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._buffer = bytearray()
+        self._futures = []
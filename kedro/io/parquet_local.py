@@ -37,9 +37,11 @@ https://arrow.apache.org/docs/python/index.html
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from kedro.io.core import (
     AbstractDataSet,
@@ -50,8 +52,25 @@ from kedro.io.core import (
 )
 
 
+def _cast_chunk(table: pa.Table, schema: pa.Schema, idx: int) -> pa.Table:
+    """Cast a chunk to the schema of the file, which is the schema of the
+    first chunk, e.g. when an integer column of the first chunk holds
+    floats in a later chunk."""
+    try:
+        return table.cast(schema)
+    except (ValueError, pa.ArrowException) as exc:
+        fields = ", ".join("{}: {}".format(field.name, field.type) for field in schema)
+        raise DataSetError(
+            "Chunk {} does not match the schema of the first chunk ({}) and "
+            "cannot be cast to it.\n{}".format(idx, fields, exc)
+        )
+
+
 class ParquetLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
     """``AbstractDataSet`` with functionality for handling local parquet files.
+    Data frames can also be saved chunk by chunk from an iterable, such as
+    the chunks yielded by a generator node, with every chunk written as a
+    row group by the ``pyarrow`` engine.
 
     Example:
     ::
@@ -67,6 +86,8 @@ class ParquetLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
         >>> assert data.equals(loaded_data)
     """
 
+    _SAVES_CHUNKS = True
+
     def _describe(self) -> Dict[str, Any]:
         return dict(
             filepath=self._filepath,
@@ -135,16 +156,41 @@ class ParquetLocalDataSet(AbstractDataSet, ExistsMixin, FilepathVersionMixIn):
         load_path = self._get_load_path(self._filepath, self._version)
         return pd.read_parquet(load_path, engine=self._engine, **self._load_args)
 
-    def _save(self, data: pd.DataFrame) -> None:
+    def _save(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]) -> None:
         save_path = Path(self._get_save_path(self._filepath, self._version))
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        data.to_parquet(save_path, engine=self._engine, **self._save_args)
+        if isinstance(data, pd.DataFrame):
+            data.to_parquet(save_path, engine=self._engine, **self._save_args)
+        else:
+            self._save_chunks(str(save_path), data)
 
         load_path = Path(self._get_load_path(self._filepath, self._version))
         self._check_paths_consistency(
             str(load_path.absolute()), str(save_path.absolute())
         )
 
+    def _save_chunks(self, save_path: str, chunks: Iterable[pd.DataFrame]) -> None:
+        if self._engine == "fastparquet":
+            raise DataSetError(
+                "Saving data frames in chunks requires the `pyarrow` engine."
+            )
+        save_args = dict(self._save_args)
+        preserve_index = save_args.pop("index", None)
+        writer = None
+        try:
+            for idx, chunk in enumerate(chunks):
+                table = pa.Table.from_pandas(chunk, preserve_index=preserve_index)
+                if writer is None:
+                    writer = pq.ParquetWriter(save_path, table.schema, **save_args)
+                elif not table.schema.equals(writer.schema):
+                    table = _cast_chunk(table, writer.schema, idx)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            pd.DataFrame().to_parquet(save_path, engine="pyarrow", **self._save_args)
+
     def _exists(self) -> bool:
         try:
             path = self._get_load_path(self._filepath, self._version)
@@ -42,6 +42,11 @@ from kedro.io.core import (
     S3PathVersionMixIn,
     Version,
 )
+from kedro.io.s3_transfer import (
+    S3MultipartWriter,
+    get_transfer_args,
+    read_s3_object,
+)
 
 
 class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
@@ -76,12 +81,13 @@ class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
         load_args: Optional[Dict[str, Any]] = None,
         save_args: Optional[Dict[str, Any]] = None,
         version: Version = None,
+        transfer_args: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Creates a new instance of ``PickleS3DataSet`` pointing to a
         concrete file on S3. ``PickleS3DataSet`` uses pickle backend to
         serialise objects to disk:
 
-        pickle.dumps: https://docs.python.org/3/library/pickle.html#pickle.dumps
+        pickle.dump: https://docs.python.org/3/library/pickle.html#pickle.dump
 
         and to load serialised objects into memory:
 
@@ -95,11 +101,20 @@ class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             load_args: Options for loading pickle files. Refer to the help
                 file of ``pickle.loads`` for options.
             save_args: Options for saving pickle files. Refer to the help
-                file of ``pickle.dumps`` for options.
+                file of ``pickle.dump`` for options.
             version: If specified, should be an instance of
                 ``kedro.io.core.Version``. If its ``load`` attribute is
                 None, the latest version will be loaded. If its ``save``
                 attribute is None, save version will be autogenerated.
+            transfer_args: Options for transferring the file to and from
+                S3: ``part_size`` is the size in bytes of each multipart
+                upload part and ranged download request (at least 5 MiB,
+                8 MiB by default) and ``max_concurrency`` is the number of
+                parts transferred in parallel (10 by default).
+
+        Raises:
+            DataSetError: When ``transfer_args`` has unknown or invalid
+                options.
         """
         default_load_args = {}
         default_save_args = {}
@@ -118,6 +133,7 @@ class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             if save_args is not None
             else default_save_args
         )
+        self._transfer_args = get_transfer_args(transfer_args)
         self._s3 = S3FileSystem(client_kwargs=self._credentials)
 
     @property
@@ -130,6 +146,7 @@ class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             bucket_name=self._bucket_name,
             load_args=self._load_args,
             save_args=self._save_args,
+            transfer_args=self._transfer_args,
             version=self._version,
         )
 
@@ -138,21 +155,20 @@ class PickleS3DataSet(AbstractDataSet, ExistsMixin, S3PathVersionMixIn):
             self._client, self._bucket_name, self._filepath, self._version
         )
 
-        with self._s3.open(
-            "{}/{}".format(self._bucket_name, load_key), mode="rb"
-        ) as s3_file:
-            return pickle.loads(s3_file.read(), **self._load_args)
+        content = read_s3_object(
+            self._client, self._bucket_name, load_key, **self._transfer_args
+        )
+        return pickle.loads(content, **self._load_args)
 
     def _save(self, data: Any) -> None:
         save_key = self._get_save_path(
             self._client, self._bucket_name, self._filepath, self._version
         )
-        bytes_object = pickle.dumps(data, **self._save_args)
 
-        with self._s3.open(
-            "{}/{}".format(self._bucket_name, save_key), mode="wb"
+        with S3MultipartWriter(
+            self._client, self._bucket_name, save_key, **self._transfer_args
         ) as s3_file:
-            s3_file.write(bytes_object)
+            pickle.dump(data, s3_file, **self._save_args)
 
         load_key = self._get_load_path(
             self._client, self._bucket_name, self._filepath, self._version
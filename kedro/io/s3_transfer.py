@@ -0,0 +1,225 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``kedro.io.s3_transfer`` provides helpers used by the S3 data sets to
+move large objects in parallel: a writable file object backed by a
+concurrent multipart upload and a function performing concurrent ranged
+downloads.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from kedro.io.core import DataSetError
+from kedro.io.parallel_upload import ParallelUploadWriter
+
+MIN_PART_SIZE = 5 * 1024 ** 2
+DEFAULT_TRANSFER_ARGS = {"part_size": 8 * 1024 ** 2, "max_concurrency": 10}
+
+
+def _validate_transfer_args(part_size: int, max_concurrency: int) -> None:
+    if part_size < MIN_PART_SIZE:
+        raise ValueError(
+            "`part_size` must be at least {} bytes, got {}.".format(
+                MIN_PART_SIZE, part_size
+            )
+        )
+    if max_concurrency < 1:
+        raise ValueError(
+            "`max_concurrency` must be a positive integer, got {}.".format(
+                max_concurrency
+            )
+        )
+
+
+def get_transfer_args(transfer_args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merges the ``transfer_args`` of an S3 data set with the default ones
+    and validates them.
+
+    Args:
+        transfer_args: ``part_size`` and ``max_concurrency`` options
+            overriding the default ones.
+
+    Returns:
+        The transfer options, including the defaults.
+
+    Raises:
+        DataSetError: When an option is unknown or invalid.
+
+    """
+    transfer_args = {**DEFAULT_TRANSFER_ARGS, **(transfer_args or {})}
+    unknown = sorted(set(transfer_args).difference(DEFAULT_TRANSFER_ARGS))
+    if unknown:
+        raise DataSetError(
+            "Unknown `transfer_args` {}, the supported options are {}.".format(
+                unknown, sorted(DEFAULT_TRANSFER_ARGS)
+            )
+        )
+    try:
+        _validate_transfer_args(**transfer_args)
+    except ValueError as exc:
+        raise DataSetError(str(exc))
+    return transfer_args
+
+
+class S3MultipartWriter(ParallelUploadWriter):
+    """``S3MultipartWriter`` is a writable binary file object which uploads
+    its content to S3 in parts of ``part_size`` bytes. Up to
+    ``max_concurrency`` parts are uploaded in parallel, and writing blocks
+    once that many parts are in flight, so the memory held by the writer is
+    bounded by roughly ``(max_concurrency + 1) * part_size`` bytes.
+
+    Content smaller than ``part_size`` is sent with a single ``PutObject``
+    request. The multipart upload is completed when the writer is closed,
+    and aborted if an error is raised inside a ``with`` block.
+
+    Example:
+    ::
+
+        >>> from s3fs.core import S3FileSystem
+        >>> from kedro.io.s3_transfer import S3MultipartWriter
+        >>>
+        >>> client = S3FileSystem().s3
+        >>> with S3MultipartWriter(client, "test_bucket", "data.bin") as s3_file:
+        >>>     s3_file.write(b"some data")
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        part_size: int = DEFAULT_TRANSFER_ARGS["part_size"],
+        max_concurrency: int = DEFAULT_TRANSFER_ARGS["max_concurrency"],
+    ) -> None:
+        """Creates a new instance of ``S3MultipartWriter``.
+
+        Args:
+            client: A ``boto3`` or ``botocore`` S3 client.
+            bucket: S3 bucket name.
+            key: Key of the object to write.
+            part_size: Size of each uploaded part in bytes. Must be at
+                least 5 MiB, which is the minimum size S3 accepts.
+            max_concurrency: Maximum number of parts uploaded in parallel.
+
+        Raises:
+            ValueError: When ``part_size`` or ``max_concurrency`` is invalid.
+
+        """
+        _validate_transfer_args(part_size, max_concurrency)
+        super().__init__(part_size, max_concurrency)
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._upload_id = None
+
+    def _put(self, body: bytes) -> None:
+        self._client.put_object(Bucket=self._bucket, Key=self._key, Body=body)
+
+    def _start(self) -> None:
+        response = self._client.create_multipart_upload(
+            Bucket=self._bucket, Key=self._key
+        )
+        self._upload_id = response["UploadId"]
+
+    def _upload_part(self, index: int, body: bytes) -> Dict[str, Any]:
+        part_number = index + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _commit(self, parts: List[Dict[str, Any]]) -> None:
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    def _abort_upload(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+
+
+def read_s3_object(
+    client: Any,
+    bucket: str,
+    key: str,
+    part_size: int = DEFAULT_TRANSFER_ARGS["part_size"],
+    max_concurrency: int = DEFAULT_TRANSFER_ARGS["max_concurrency"],
+) -> bytearray:
+    """Downloads an S3 object using up to ``max_concurrency`` parallel
+    ranged ``GetObject`` requests of ``part_size`` bytes each. All ranges
+    are pinned to the ``ETag`` seen when the download started, so a
+    concurrent overwrite of the object makes the download fail instead of
+    returning a mix of both versions.
+
+    Args:
+        client: A ``boto3`` or ``botocore`` S3 client.
+        bucket: S3 bucket name.
+        key: Key of the object to read.
+        part_size: Size of each requested byte range.
+        max_concurrency: Maximum number of ranges downloaded in parallel.
+
+    Returns:
+        Content of the object.
+
+    Raises:
+        ValueError: When ``part_size`` or ``max_concurrency`` is invalid.
+
+    """
+    _validate_transfer_args(part_size, max_concurrency)
+    head = client.head_object(Bucket=bucket, Key=key)
+    size = head["ContentLength"]
+    if size <= part_size:
+        response = client.get_object(Bucket=bucket, Key=key, IfMatch=head["ETag"])
+        return bytearray(response["Body"].read())
+
+    content = bytearray(size)
+    view = memoryview(content)
+
+    def _read_range(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        response = client.get_object(
+            Bucket=bucket,
+            Key=key,
+            IfMatch=head["ETag"],
+            Range="bytes={}-{}".format(start, end),
+        )
+        view[start : end + 1] = response["Body"].read()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        list(executor.map(_read_range, range(0, size, part_size)))
+    return content
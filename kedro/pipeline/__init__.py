@@ -30,5 +30,6 @@
 data-driven pipelines.
 """
 
+from .map_node import map_node  # NOQA
 from .node import node  # NOQA
 from .pipeline import Pipeline  # NOQA
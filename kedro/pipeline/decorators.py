@@ -126,3 +126,43 @@ def mem_profile(func: Callable) -> Callable:
         return result
 
     return with_memory
+
+
+def batchable(func: Callable) -> Callable:
+    """A function decorator which marks a node function as able to process
+    the inputs of many pipeline runs at once. When a ``CompiledPipeline`` runs
+    a batch of feed dictionaries, the function is called once for the whole
+    batch: every argument is a list holding the value of that input for each
+    run, and every output it returns must be a list with the value of that
+    output for each run, in the same order. In any other kind of run, the
+    function is called with batches of one run.
+
+    Args:
+        func: The node function processing batches.
+
+    Returns:
+        The same function, marked as batchable.
+
+    """
+    func.__kedro_batchable__ = True
+    return func
+
+
+def streaming(func: Callable) -> Callable:
+    """A function decorator which marks a node function as able to consume
+    streamed data sets. When a ``StreamingRunner`` streams the chunks yielded
+    by a generator node, a marked function receives an iterator over the
+    chunks of each streamed input, so that it can process them one at a
+    time. Generator functions always receive such iterators, whereas the
+    other functions receive the list of chunks, or their concatenation if
+    they are pandas data frames, once all of them have been yielded.
+
+    Args:
+        func: The node function consuming iterators over chunks.
+
+    Returns:
+        The same function, marked as consuming streamed data sets.
+
+    """
+    func.__kedro_streaming__ = True
+    return func
@@ -0,0 +1,226 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module provides map nodes, which run a function over every partition
+of a partitioned input as a single node of a Kedro pipeline.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+from kedro.pipeline.node import Node
+
+
+class MapNode(Node):
+    """``MapNode`` is a ``Node`` which runs its function once for every
+    partition of one of its inputs, in a pool of threads. The partitioned
+    input is a dictionary from partition ids to the data of each partition,
+    or to functions without arguments loading it, which are called in the
+    pool of threads so that at most ``max_workers`` partitions are loaded at
+    once. The other inputs are passed unchanged to every call. Every output
+    of a ``MapNode`` is a dictionary from partition ids to the results of
+    the function for each partition.
+    """
+
+    __slots__ = ("_partitioned", "_max_workers")
+
+    # pylint: disable=W9016
+    def __init__(
+        self,
+        func: Callable,
+        inputs: Union[str, List[str], Dict[str, str]],
+        outputs: Union[None, str, List[str], Dict[str, str]],
+        *,
+        partitioned: str = None,
+        max_workers: int = None,
+        name: str = None,
+        tags: Iterable[str] = None,
+        decorators: Iterable[Callable] = None
+    ):
+        """Create a map node in the pipeline by providing a function to be
+        called for every partition of an input, along with variable names for
+        inputs and/or outputs.
+
+        Args:
+            func: A function that corresponds to the node logic for a
+                single partition.
+            inputs: The name or the list of the names of variables used as
+                inputs to the function, as for ``Node``.
+            outputs: The name or the list of the names of variables used
+                as outputs to the function, as for ``Node``.
+            partitioned: The name of the partitioned input. Defaults to the
+                first input.
+            max_workers: The maximum number of partitions processed at once.
+                Defaults to the number of processors plus four, up to 32.
+            name: Optional node name to be used when displaying the node in
+                logs or any other visualisations.
+            tags: Optional set of tags to be applied to the node.
+            decorators: Optional list of decorators to be applied to the node.
+
+        Raises:
+            ValueError: When the node has no inputs, when ``partitioned`` is
+                not one of them, or when ``max_workers`` is not positive.
+
+        """
+        super().__init__(
+            func, inputs, outputs, name=name, tags=tags, decorators=decorators
+        )
+        if not self._input_names:
+            raise ValueError(
+                "Failed to create map node {}.\n"
+                "A map node must have a partitioned input.".format(str(self))
+            )
+        partitioned = partitioned or self._input_names[0]
+        if partitioned not in self._input_names:
+            raise ValueError(
+                "Failed to create map node {}.\n"
+                "The partitioned input `{}` is not an input of the "
+                "node.".format(str(self), partitioned)
+            )
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("`max_workers` of a map node must be positive.")
+
+        self._partitioned = partitioned
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+    @property
+    def partitioned(self) -> str:
+        """The name of the input whose partitions the node maps over.
+
+        Returns:
+            The name of the partitioned input.
+
+        """
+        return self._partitioned
+
+    @property
+    def streaming(self) -> bool:
+        # the function runs for several partitions at once, which cannot
+        # share an iterator over chunks
+        return False
+
+    @property
+    def _yields_chunks(self) -> bool:
+        return False
+
+    def _stream(self, inputs: Dict[str, Any]) -> Tuple[Any, bool]:
+        # partitions are mapped over as a whole, they are never streamed
+        return self._call(inputs), False
+
+    def _call(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        partitions = inputs.get(self._partitioned)
+        if not isinstance(partitions, dict):
+            raise ValueError(
+                "Map node {} expected a dictionary of partitions for input "
+                "`{}`, but got `{}` instead.".format(
+                    str(self), self._partitioned, type(partitions).__name__
+                )
+            )
+
+        def _run_partition(partition_id):
+            data = partitions[partition_id]
+            data = data() if callable(data) else data
+            return super(MapNode, self)._call({**inputs, self._partitioned: data})
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            results = dict(zip(partitions, pool.map(_run_partition, partitions)))
+
+        return {
+            output: {
+                partition_id: result[output] for partition_id, result in results.items()
+            }
+            for output in self._output_names
+        }
+
+    def __repr__(self):  # pragma: no cover
+        return "MapNode({}, {!r}, {!r}, {!r}, partitioned={!r})".format(
+            self._func.__name__,
+            self._inputs,
+            self._outputs,
+            self._name,
+            self._partitioned,
+        )
+
+
+def map_node(  # pylint: disable=W9016
+    func: Callable,
+    inputs: Union[str, List[str], Dict[str, str]],
+    outputs: Union[None, str, List[str], Dict[str, str]],
+    *,
+    partitioned: str = None,
+    max_workers: int = None,
+    name: str = None,
+    tags: Iterable[str] = None
+) -> MapNode:
+    """Create a map node in the pipeline, which runs a function for every
+    partition of an input, as a single node.
+
+    Args:
+        func: A function that corresponds to the node logic for a single
+            partition. The function is called with the data of a partition
+            in place of the partitioned input.
+        inputs: The name or the list of the names of variables used as inputs
+            to the function. When Dict[str, str] is provided, variable names
+            will be mapped to function argument names.
+        outputs: The name or the list of the names of variables used as outputs
+            to the function. Each of them receives a dictionary from partition
+            ids to the results of the function for each partition.
+        partitioned: The name of the input holding a dictionary from partition
+            ids to the data of each partition, or to functions without
+            arguments loading it. Defaults to the first input.
+        max_workers: The maximum number of partitions processed at once.
+            Defaults to the number of processors plus four, up to 32.
+        name: Optional node name to be used when displaying the node in logs or
+            any other visualisations.
+        tags: Optional set of tags to be applied to the node.
+
+    Returns:
+        A MapNode object with mapped inputs, outputs and function.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> def clean(shop: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        >>>     return shop[columns].dropna()
+        >>>
+        >>> # ``shops`` is a dictionary of data frames or of functions loading
+        >>> # them, by shop, and ``clean_shops`` a dictionary of clean ones
+        >>> map_node(clean, ["shops", "params:columns"], "clean_shops",
+        >>>          max_workers=8)
+    """
+    return MapNode(
+        func,
+        inputs,
+        outputs,
+        partitioned=partitioned,
+        max_workers=max_workers,
+        name=name,
+        tags=tags,
+    )
@@ -33,7 +33,10 @@ import inspect
 import logging
 from collections import Counter
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Set, Union
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+_NO_TAGS = frozenset()  # type: FrozenSet[str]
 
 
 class Node:
@@ -41,6 +44,22 @@ class Node:
     run user-provided functions as part of Kedro pipelines.
     """
 
+    # a pipeline can hold many thousands of nodes, so they are kept compact and
+    # everything derived from their (immutable) definition is computed once
+    __slots__ = (
+        "_func",
+        "_inputs",
+        "_outputs",
+        "_name",
+        "_tags",
+        "_decorators",
+        "_composed_func",
+        "_input_names",
+        "_output_names",
+        "_str",
+        "_hash",
+    )
+
     # pylint: disable=W9016
     def __init__(
         self,
@@ -114,15 +133,53 @@ class Node:
         self._validate_inputs(func, inputs)
 
         self._func = func
-        self._inputs = inputs
-        self._outputs = outputs
+        # copy mutable definitions, so that they cannot diverge from the
+        # names derived from them
+        self._inputs = copy.copy(inputs)
+        self._outputs = copy.copy(outputs)
         self._name = name
-        self._tags = set([] if tags is None else tags)
-        self._decorators = decorators or []
+        self._tags = frozenset(tags) if tags else _NO_TAGS
+        self._decorators = tuple(decorators or ())
+        self._composed_func = None  # composed on first use by ``_decorated_func``
+        self._input_names = self._to_tuple(inputs)
+        self._output_names = self._to_tuple(outputs)
+        self._str = None  # formatted on first use by ``__str__``
 
         self._validate_unique_outputs()
         self._validate_inputs_dif_than_outputs()
 
+        self._hash = self._compute_hash()
+
+    def _copy(self, **overwrite_slots: Any) -> "Node":
+        """Create a copy of the node with some of its attributes replaced,
+        without validating it again. Only the attributes which do not change
+        the name, inputs or outputs of the node can be replaced.
+        """
+        copied = type(self).__new__(type(self))
+        # subclasses without ``__slots__`` keep their attributes in ``__dict__``
+        if hasattr(self, "__dict__"):
+            copied.__dict__.update(self.__dict__)
+        for slot in _all_slots(type(self)):
+            setattr(copied, slot, overwrite_slots.get(slot, getattr(self, slot)))
+        return copied
+
+    def __getstate__(self):
+        # string hashes vary between interpreters and decorated functions can
+        # rarely be pickled, so both are computed again after unpickling
+        state = dict(getattr(self, "__dict__", {}))
+        state.update(
+            (slot, getattr(self, slot))
+            for slot in _all_slots(type(self))
+            if slot not in ("_hash", "_composed_func")
+        )
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._composed_func = None
+        self._hash = self._compute_hash()
+
     def tag(self, tags: Iterable[str]) -> "Node":
         """Create a new ``Node`` which is an exact copy of the current one,
             but with more tags added to it.
@@ -134,24 +191,17 @@ class Node:
             A copy of the current ``Node`` object with the tags added.
 
         """
-        return Node(
-            self._func,
-            self._inputs,
-            self._outputs,
-            name=self._name,
-            tags=set(self._tags) | set(tags),
-            decorators=self._decorators,
-        )
+        return self._copy(_tags=self._tags | set(tags))
 
     @property
-    def tags(self) -> Set[str]:
+    def tags(self) -> FrozenSet[str]:
         """Return the tags assigned to the node.
 
         Returns:
             Return the set of all assigned tags to the node.
 
         """
-        return set(self._tags)
+        return self._tags
 
     @property
     def _logger(self):
@@ -229,14 +279,14 @@ class Node:
             >>> assert "output" in result
             >>> assert result['output'] == "f(g(fg(h(1))))"
         """
-        decorators = self._decorators + list(reversed(decorators))
-        return Node(
-            self._func,
-            self._inputs,
-            self._outputs,
-            name=self._name,
-            tags=self.tags,
-            decorators=decorators,
+        new_decorators = tuple(reversed(decorators))
+        composed_func = self._composed_func
+        if composed_func is not None:
+            # only wrap the function already composed for this node with the
+            # new decorators, instead of applying all of them again
+            composed_func = reduce(lambda g, f: f(g), new_decorators, composed_func)
+        return self._copy(
+            _decorators=self._decorators + new_decorators, _composed_func=composed_func,
         )
 
     @property
@@ -248,6 +298,43 @@ class Node:
         """
         return self._name if self._name else str(self)
 
+    @property
+    def batchable(self) -> bool:
+        """Whether the node function processes batches of inputs, as marked
+        by the ``kedro.pipeline.decorators.batchable`` decorator.
+
+        Returns:
+            True if the node function processes batches of inputs.
+
+        """
+        return getattr(self._func, "__kedro_batchable__", False)
+
+    @property
+    def streaming(self) -> bool:
+        """Whether the node function consumes the data sets streamed by a
+        ``StreamingRunner`` as iterators over their chunks, i.e. it is a
+        generator function or it is marked by the
+        ``kedro.pipeline.decorators.streaming`` decorator.
+
+        Returns:
+            True if the node function consumes iterators over chunks.
+
+        """
+        if self.batchable:
+            return False
+        return getattr(self._func, "__kedro_streaming__", False) or self._yields_chunks
+
+    @property
+    def _yields_chunks(self) -> bool:
+        """Whether the node function is a generator function, looking through
+        the decorators applied with ``functools.wraps``."""
+        if self.batchable:
+            return False
+        func = self._decorated_func
+        return inspect.isgeneratorfunction(func) or inspect.isgeneratorfunction(
+            inspect.unwrap(func)
+        )
+
     @property
     def inputs(self) -> List[str]:
         """Return node inputs as a list preserving the original order
@@ -257,7 +344,7 @@ class Node:
             Node input names as a list.
 
         """
-        return self._to_list(self._inputs)
+        return list(self._input_names)
 
     @property
     def outputs(self) -> List[str]:
@@ -268,22 +355,22 @@ class Node:
             Node output names as a list.
 
         """
-        return self._to_list(self._outputs)
+        return list(self._output_names)
 
     @staticmethod
-    def _to_list(element: Union[None, str, List[str], Dict[str, str]]) -> List:
-        """Make a list out of node inputs/outputs.
+    def _to_tuple(element: Union[None, str, List[str], Dict[str, str]]) -> Tuple:
+        """Make a tuple out of node inputs/outputs.
 
         Returns:
-            List[str]: Node input/output names as a list to standardise.
+            Tuple[str]: Node input/output names as a tuple to standardise.
         """
         if element is None:
-            return list()
+            return tuple()
         if isinstance(element, str):
-            return [element]
+            return (element,)
         if isinstance(element, dict):
-            return list(element.values())
-        return element
+            return tuple(element.values())
+        return tuple(element)
 
     def run(self, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
         """Run this node using the provided inputs and return its results
@@ -315,8 +402,6 @@ class Node:
         """
         self._logger.info("Running node: %s", str(self))
 
-        outputs = None
-
         if not (inputs is None or isinstance(inputs, dict)):
             raise ValueError(
                 "Node.run() expects a dictionary or None, "
@@ -324,26 +409,79 @@ class Node:
             )
 
         try:
-            inputs = dict() if inputs is None else inputs
-            if not self._inputs:
-                outputs = self._run_no_inputs(inputs)
-            elif isinstance(self._inputs, str):
-                outputs = self._run_one_input(inputs)
-            elif isinstance(self._inputs, list):
-                outputs = self._run_with_list(inputs)
-            elif isinstance(self._inputs, dict):
-                outputs = self._run_with_dict(inputs)
-
-            return self._outputs_to_dictionary(outputs)
+            return self._run(dict() if inputs is None else inputs)
 
         # purposely catch all exceptions
         except Exception as exc:
             self._logger.error("Node `%s` failed with error: \n%s", str(self), str(exc))
             raise exc
 
+    def _run(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the node function with a dictionary of inputs, without any
+        logging, and return its results in a dictionary.
+        """
+        if self.batchable:
+            # batchable functions always process lists of values, one per run
+            batch_inputs = {name: [value] for name, value in inputs.items()}
+            return self._run_batch(batch_inputs, 1)[0]
+        return self._call(inputs)
+
+    def _run_batch(self, inputs: Dict[str, List], size: int) -> List[Dict[str, Any]]:
+        """Run a batchable node function once for a batch of ``size`` runs,
+        with a list of values for every input, and return the results of
+        every run in a list of dictionaries.
+        """
+        outputs = self._call(inputs)
+        for name, values in outputs.items():
+            if len(values) != size:
+                raise ValueError(
+                    "Batchable node {} returned {} value(s) for output `{}`, "
+                    "whereas the batch has {} run(s).".format(
+                        str(self), len(values), name, size
+                    )
+                )
+        return [
+            {name: values[idx] for name, values in outputs.items()}
+            for idx in range(size)
+        ]
+
+    def _stream(self, inputs: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Run the node with a dictionary of inputs, without any logging.
+        If the node function is a generator, return an iterator over the
+        dictionaries of the chunks it yields and ``True``, otherwise the
+        dictionary of its results and ``False``.
+        """
+        if self.batchable:
+            return self._run(inputs), False
+        outputs = self._call_func(inputs)
+        if inspect.isgenerator(outputs):
+            return map(self._outputs_to_dictionary, outputs), True
+        return self._outputs_to_dictionary(outputs), False
+
+    def _call(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        return self._outputs_to_dictionary(self._call_func(inputs))
+
+    def _call_func(self, inputs: Dict[str, Any]) -> Any:
+        outputs = None
+
+        if not self._inputs:
+            outputs = self._run_no_inputs(inputs)
+        elif isinstance(self._inputs, str):
+            outputs = self._run_one_input(inputs)
+        elif isinstance(self._inputs, list):
+            outputs = self._run_with_list(inputs)
+        elif isinstance(self._inputs, dict):
+            outputs = self._run_with_dict(inputs)
+
+        return outputs
+
     @property
     def _decorated_func(self):
-        return reduce(lambda g, f: f(g), self._decorators, self._func)
+        if self._composed_func is None:
+            self._composed_func = reduce(
+                lambda g, f: f(g), self._decorators, self._func
+            )
+        return self._composed_func
 
     def _run_no_inputs(self, inputs: Dict[str, Any]):
         if inputs:
@@ -478,7 +616,7 @@ class Node:
         return args, kwargs
 
     def _validate_unique_outputs(self):
-        diff = Counter(self.outputs) - Counter(set(self.outputs))
+        diff = Counter(self._output_names) - Counter(set(self._output_names))
         if diff:
             raise ValueError(
                 "Failed to create node {} due to duplicate"
@@ -488,7 +626,7 @@ class Node:
             )
 
     def _validate_inputs_dif_than_outputs(self):
-        common_in_out = set(self.inputs).intersection(set(self.outputs))
+        common_in_out = set(self._input_names).intersection(self._output_names)
         if common_in_out:
             raise ValueError(
                 "Failed to create node {}.\n"
@@ -496,27 +634,51 @@ class Node:
                 "{}".format(str(self), common_in_out)
             )
 
-    def __str__(self):
+    def _to_str(self) -> str:
         def _sorted_set_to_str(xset):
             return "[" + ",".join([name for name in sorted(xset)]) + "]"
 
-        out_str = _sorted_set_to_str(self.outputs) if self._outputs else "None"
-        in_str = _sorted_set_to_str(self.inputs) if self._inputs else "None"
+        out_str = _sorted_set_to_str(self._output_names) if self._outputs else "None"
+        in_str = _sorted_set_to_str(self._input_names) if self._inputs else "None"
 
         prefix = self._name + ": " if self._name else ""
         return prefix + "{}({}) -> {}".format(self._func.__name__, in_str, out_str)
 
+    def _compute_hash(self) -> int:
+        return hash((self._input_names, self._output_names, self._name))
+
+    def __str__(self):
+        if self._str is None:
+            self._str = self._to_str()
+        return self._str
+
     def __repr__(self):  # pragma: no cover
         return "Node({}, {!r}, {!r}, {!r})".format(
             self._func.__name__, self._inputs, self._outputs, self._name
         )
 
     def __eq__(self, other):  # pragma: no cover
-        keys = {"_inputs", "_outputs", "_func", "_name"}
-        return all(self.__dict__[k] == other.__dict__[k] for k in keys)
+        if self is other:
+            return True
+        if not isinstance(other, Node):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self._name == other._name
+            and self._inputs == other._inputs
+            and self._outputs == other._outputs
+            and self._func == other._func
+        )
 
     def __hash__(self):
-        return hash((tuple(self.inputs), tuple(self.outputs), self._name))
+        return self._hash
+
+
+def _all_slots(cls: type) -> Tuple[str, ...]:
+    """All the slots of a ``Node`` class, including those of its bases."""
+    return tuple(
+        chain.from_iterable(getattr(klass, "__slots__", ()) for klass in cls.__mro__)
+    )
 
 
 def _node_error_message(msg) -> str:
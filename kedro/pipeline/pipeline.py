@@ -34,16 +34,17 @@ produced outputs and execution order.
 import copy
 import json
 import logging
+import marshal
+import sys
 from collections import Counter, defaultdict
 from itertools import chain
-from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
-
-from toposort import CircularDependencyError as ToposortCircleError
-from toposort import toposort
+from typing import Callable, FrozenSet, Iterable, List, Set, Tuple, Union
 
 import kedro
 from kedro.pipeline.node import Node
 
+_SNAPSHOT_FORMAT = 2
+
 
 class OutputNotUniqueError(Exception):
     """Raised when two or more nodes that are part of the same pipeline
@@ -113,42 +114,94 @@ class Pipeline:
 
         if name:
             nodes = [n.tag([name]) for n in nodes]
+        _validate_unique_outputs(nodes)
+
+        self._initialise(_topologically_sorted(nodes), name)
+
+    def _initialise(self, grouped_nodes: List[List[Node]], name: str = None):
+        """Build the indexes of the ``Pipeline`` from nodes which have already
+        been validated and topologically sorted.
+        """
         self._name = name
         self._logger = logging.getLogger(__name__)
-        self._nodes_by_name = {node.name: node for node in nodes}
-        _validate_unique_outputs(nodes)
+        self._topo_sorted_nodes = grouped_nodes
+        self._sorted_nodes = list(chain.from_iterable(grouped_nodes))
+        # node name: position of the node in the topological order
+        self._node_positions = {
+            node.name: idx for idx, node in enumerate(self._sorted_nodes)
+        }
+        self._nodes_by_name = {node.name: node for node in self._sorted_nodes}
 
         self._nodes_by_input = defaultdict(set)  # input: {nodes with input}
-        for node in nodes:
+        for node in self._sorted_nodes:
             for input_ in node.inputs:
                 self._nodes_by_input[input_].add(node)
 
         self._nodes_by_output = {}  # output: node
-        for node in nodes:
+        for node in self._sorted_nodes:
             for output in node.outputs:
                 self._nodes_by_output[output] = node
 
-        self._topo_sorted_nodes = _topologically_sorted(nodes)
+        # a ``Pipeline`` is immutable, so its data set names are computed once
+        self._all_inputs = frozenset(self._nodes_by_input)
+        self._all_outputs = frozenset(self._nodes_by_output)
+        self._inputs = self._all_inputs - self._all_outputs
+        self._outputs = self._all_outputs - self._all_inputs
+        self._data_sets = self._all_inputs | self._all_outputs
 
-    def all_inputs(self) -> Set[str]:
+    def _from_grouped_nodes(self, grouped_nodes: List[List[Node]]) -> "Pipeline":
+        """Create a new ``Pipeline`` from nodes which are known to be valid and
+        already grouped in topological order, skipping validation and sorting.
+        """
+        pipeline = Pipeline.__new__(Pipeline)
+        pipeline._initialise(grouped_nodes)  # pylint: disable=protected-access
+        return pipeline
+
+    def _sub_pipeline(self, nodes: Iterable[Node]) -> "Pipeline":
+        """Create a new ``Pipeline`` from a subset of the nodes of this one.
+        Since the nodes are already validated and sorted, the topological
+        groups of the subset are derived from the order of this ``Pipeline``
+        in time proportional to the size of the subset.
+        """
+        positions = self._node_positions
+        names = {node.name for node in nodes}
+        ordered = sorted(names, key=positions.__getitem__)
+
+        levels = {}  # node name: topological group index
+        grouped_nodes = []  # type: List[List[Node]]
+        for name in ordered:
+            node = self._nodes_by_name[name]
+            level = 0
+            for input_ in node.inputs:
+                producer = self._nodes_by_output.get(input_)
+                if producer is not None and producer.name in names:
+                    level = max(level, levels[producer.name] + 1)
+            levels[name] = level
+            if level == len(grouped_nodes):
+                grouped_nodes.append([])
+            grouped_nodes[level].append(node)
+
+        return self._from_grouped_nodes(grouped_nodes)
+
+    def all_inputs(self) -> FrozenSet[str]:
         """All inputs for all nodes in the pipeline.
 
         Returns:
-            All node input names as a Set.
+            All node input names as a FrozenSet.
 
         """
-        return set.union(set(), *[node.inputs for node in self.nodes])
+        return self._all_inputs
 
-    def all_outputs(self) -> Set[str]:
+    def all_outputs(self) -> FrozenSet[str]:
         """All outputs of all nodes in the pipeline.
 
         Returns:
             All node outputs.
 
         """
-        return set.union(set(), *[node.outputs for node in self.nodes])
+        return self._all_outputs
 
-    def inputs(self) -> Set[str]:
+    def inputs(self) -> FrozenSet[str]:
         """The names of free inputs that must be provided at runtime so that
         the pipeline is runnable. Does not include intermediate inputs which
         are produced and consumed by the inner pipeline nodes.
@@ -157,9 +210,9 @@ class Pipeline:
             The set of free input names needed by the pipeline.
 
         """
-        return self.all_inputs() - self.all_outputs()
+        return self._inputs
 
-    def outputs(self) -> Set[str]:
+    def outputs(self) -> FrozenSet[str]:
         """The names of outputs produced when the whole pipeline is run.
         Does not include intermediate outputs that are consumed by
         other pipeline nodes.
@@ -168,9 +221,9 @@ class Pipeline:
             The set of final pipeline outputs.
 
         """
-        return self.all_outputs() - self.all_inputs()
+        return self._outputs
 
-    def data_sets(self) -> Set[str]:
+    def data_sets(self) -> FrozenSet[str]:
         """The names of all data sets used by the ``Pipeline``,
         including inputs and outputs.
 
@@ -178,7 +231,7 @@ class Pipeline:
             The set of all pipeline data sets.
 
         """
-        return self.all_outputs() | self.all_inputs()
+        return self._data_sets
 
     def describe(self, names_only: bool = True) -> str:
         """Obtain the order of execution and expected free input variables in
@@ -263,7 +316,7 @@ class Pipeline:
             The list of all pipeline nodes in topological order.
 
         """
-        return copy.copy(list(chain.from_iterable(self._topo_sorted_nodes)))
+        return copy.copy(self._sorted_nodes)
 
     @property
     def grouped_nodes(self) -> List[List[Node]]:
@@ -301,7 +354,7 @@ class Pipeline:
             )
 
         nodes = [self._nodes_by_name[name] for name in node_names]
-        return Pipeline(nodes)
+        return self._sub_pipeline(nodes)
 
     def only_nodes_with_inputs(self, *inputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -333,7 +386,7 @@ class Pipeline:
             chain.from_iterable(self._nodes_by_input[input_] for input_ in starting)
         )
 
-        return Pipeline(nodes)
+        return self._sub_pipeline(nodes)
 
     def from_inputs(self, *inputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -375,7 +428,7 @@ class Pipeline:
             if not nodes:
                 break
 
-        return Pipeline(all_nodes)
+        return self._sub_pipeline(all_nodes)
 
     def only_nodes_with_outputs(self, *outputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -408,7 +461,7 @@ class Pipeline:
             if output in self._nodes_by_output
         }
 
-        return Pipeline(nodes)
+        return self._sub_pipeline(nodes)
 
     def to_outputs(self, *outputs: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -451,7 +504,7 @@ class Pipeline:
             if not nodes:
                 break
 
-        return Pipeline(all_nodes)
+        return self._sub_pipeline(all_nodes)
 
     def from_nodes(self, *node_names: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -471,8 +524,9 @@ class Pipeline:
         """
 
         res = self.only_nodes(*node_names)
-        res += self.from_inputs(*res.all_outputs())
-        return res
+        return self._sub_pipeline(
+            res.nodes + self.from_inputs(*res.all_outputs()).nodes
+        )
 
     def to_nodes(self, *node_names: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes required directly
@@ -492,8 +546,7 @@ class Pipeline:
         """
 
         res = self.only_nodes(*node_names)
-        res += self.to_outputs(*res.all_inputs())
-        return res
+        return self._sub_pipeline(res.nodes + self.to_outputs(*res.all_inputs()).nodes)
 
     def only_nodes_with_tags(self, *tags: str) -> "Pipeline":
         """Create a new ``Pipeline`` object with the nodes which contain *any*
@@ -509,8 +562,8 @@ class Pipeline:
                 of the tags provided are being copied.
         """
         tags = set(tags)
-        nodes = [node for node in self.nodes if tags & node.tags]
-        return Pipeline(nodes)
+        nodes = [node for node in self._sorted_nodes if tags & node.tags]
+        return self._sub_pipeline(nodes)
 
     @property
     def node_dependencies(self) -> Set[Tuple[Node, Node]]:
@@ -542,8 +595,13 @@ class Pipeline:
             provided decorators.
 
         """
-        nodes = [node.decorate(*decorators) for node in self.nodes]
-        return Pipeline(nodes)
+        # decorating does not change the inputs or outputs of the nodes, so
+        # the topological order of this ``Pipeline`` still holds
+        grouped_nodes = [
+            [node.decorate(*decorators) for node in group]
+            for group in self._topo_sorted_nodes
+        ]
+        return self._from_grouped_nodes(grouped_nodes)
 
     def __repr__(self):  # pragma: no cover
         reprs = [repr(node) for node in self.nodes]
@@ -567,12 +625,174 @@ class Pipeline:
 
         return json.dumps(pipeline_versioned)
 
+    def to_snapshot(self, source_hash: str = None) -> bytes:
+        """Return a compact binary snapshot of the structure of the pipeline,
+        including its topological order, which ``from_snapshot`` loads
+        without importing the node functions.
+
+        Args:
+            source_hash: A hash of the source code the pipeline was created
+                from, which ``from_snapshot`` checks before loading it.
+
+        Returns:
+            The snapshot of the pipeline.
+
+        """
+
+        def _interned(names):
+            # marshal writes repeated interned strings as references
+            return tuple(sys.intern(name) for name in names)
+
+        grouped_nodes = []
+        for group in self._topo_sorted_nodes:
+            grouped_nodes.append([])
+            for node in group:
+                func = node._func  # pylint: disable=protected-access
+                grouped_nodes[-1].append(
+                    (
+                        node._name,  # pylint: disable=protected-access
+                        _interned(
+                            [
+                                func.__name__,
+                                str(getattr(func, "__module__", None)),
+                                getattr(func, "__qualname__", func.__name__),
+                            ]
+                        ),
+                        _interned(node.inputs),
+                        _interned(node.outputs),
+                        _interned(sorted(node.tags)),
+                    )
+                )
+        return marshal.dumps(
+            (
+                _SNAPSHOT_FORMAT,
+                kedro.__version__,
+                _python_version(),
+                source_hash,
+                self._name,
+                grouped_nodes,
+            )
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes, source_hash: str = None) -> "Pipeline":
+        """Load a pipeline from a snapshot created by ``to_snapshot``, skipping
+        validation and sorting. Node functions are not imported, so the
+        nodes of the pipeline describe its structure but cannot be run.
+
+        Args:
+            snapshot: The snapshot of a pipeline.
+            source_hash: The hash of the source code the snapshot must have
+                been created from.
+
+        Raises:
+            ValueError: When the snapshot is invalid, was created by another
+                version of Kedro or Python, with another snapshot format or
+                from source code with a different hash.
+
+        Returns:
+            The pipeline described by the snapshot.
+
+        """
+        regenerate = "The snapshot must be regenerated with `Pipeline.to_snapshot`."
+        try:
+            (
+                snapshot_format,
+                version,
+                python_version,
+                snapshot_hash,
+                name,
+                grouped_nodes,
+            ) = marshal.loads(snapshot)
+        except (EOFError, TypeError, ValueError):
+            raise ValueError(
+                "Invalid pipeline snapshot. It is either corrupt or was written "
+                "with a different snapshot format or Python version. " + regenerate
+            )
+        current = (_SNAPSHOT_FORMAT, kedro.__version__, _python_version())
+        if (snapshot_format, version, python_version) != current:
+            raise ValueError(
+                "Pipeline snapshot was written with snapshot format {} by "
+                "Kedro {} on Python {}, whereas this is snapshot format {}, "
+                "Kedro {} on Python {}. {}".format(
+                    snapshot_format, version, python_version, *current, regenerate
+                )
+            )
+        if snapshot_hash != source_hash:
+            raise ValueError(
+                "Pipeline snapshot was created from source code with hash "
+                "`{}`, whereas `{}` was expected.".format(snapshot_hash, source_hash)
+            )
+
+        # the nodes were validated when the snapshot was written, so they are
+        # restored like unpickled nodes rather than created again
+        grouped_nodes = [
+            [
+                _snapshot_node(
+                    name,
+                    _SnapshotFunction(func_name, "{}.{}".format(module, qualname)),
+                    inputs,
+                    outputs,
+                    tags,
+                )
+                for name, (func_name, module, qualname), inputs, outputs, tags in group
+            ]
+            for group in grouped_nodes
+        ]
+        pipeline = cls.__new__(cls)
+        pipeline._initialise(grouped_nodes, name)  # pylint: disable=protected-access
+        return pipeline
+
     def __add__(self, other):
         if not isinstance(other, Pipeline):
             return NotImplemented
         return Pipeline(set(self.nodes + other.nodes))
 
 
+def _python_version() -> str:
+    return "{}.{}".format(*sys.version_info[:2])
+
+
+def _snapshot_node(
+    name: str,
+    func: Callable,
+    inputs: Tuple[str, ...],
+    outputs: Tuple[str, ...],
+    tags: Tuple[str, ...],
+) -> Node:
+    node = Node.__new__(Node)
+    node.__setstate__(
+        dict(
+            _func=func,
+            _inputs=list(inputs),
+            _outputs=list(outputs),
+            _name=name,
+            _tags=frozenset(tags),
+            _decorators=(),
+            _input_names=inputs,
+            _output_names=outputs,
+            _str=None,
+        )
+    )
+    return node
+
+
+class _SnapshotFunction:
+    """Stands for the function of a node loaded from a pipeline snapshot,
+    which is not imported.
+    """
+
+    def __init__(self, name: str, qualname: str):
+        self.__name__ = name
+        self._qualname = qualname
+
+    def __call__(self, *args, **kwargs):
+        raise ValueError(
+            "Node function `{}` was not imported from the pipeline snapshot. "
+            "Create the pipeline from its source code to run it.".format(self._qualname)
+        )
+
+
 def _validate_no_node_list(nodes: Iterable[Node]):
     if nodes is None:
         raise ValueError(
@@ -606,9 +826,11 @@ def _validate_unique_outputs(nodes: List[Node]) -> None:
         )
 
 
-def _topologically_sorted(nodes) -> List[List[Node]]:
+def _topologically_sorted(nodes: List[Node]) -> List[List[Node]]:
     """Topologically group and sort (order) nodes such that no node depends on
-    a node that appears in the same or a later group.
+    a node that appears in the same or a later group. Nodes are grouped with
+    Kahn's algorithm: each group holds the nodes whose dependencies are all in
+    earlier groups, in the order they were provided.
 
     Raises:
         CircularDependencyError: When it is not possible to topologically order
@@ -618,36 +840,72 @@ def _topologically_sorted(nodes) -> List[List[Node]]:
         The list of nodes in order of execution.
 
     """
-
-    def _circle_error_message(error_data: Dict[str, str]) -> str:
-        """Error messages provided by the toposort library will
-        refer to indices that are used as an intermediate step.
-        This method can be used to replace that message with
-        one that refers to the nodes' string representations.
-        """
-        indices = error_data.keys()
-        circular = [str(nodes[int(index)]) for index in indices]
-        return "Circular dependencies exist among these items: {}".format(circular)
-
     output_to_node = dict()
     for node_id, node in enumerate(nodes):
-        for output_id in node.outputs:
-            output_to_node[output_id] = node_id
+        for output in node.outputs:
+            output_to_node[output] = node_id
 
-    toposort_ready = dict()
-    for node_id, node in enumerate(nodes):
-        toposort_ready[node_id] = set()
-        for input_id in node.inputs:
-            if input_id in output_to_node:
-                toposort_ready[node_id].add(output_to_node[input_id])
-
-    try:
-        toposorted = list(toposort(toposort_ready))
-    except ToposortCircleError as error:
-        message = _circle_error_message(error.data)
-        raise CircularDependencyError(message) from error
-
-    return [[nodes[idx] for idx in sorted(group)] for group in toposorted]
+    # adjacency lists of node indices, in both directions
+    parents = [
+        sorted(
+            {
+                output_to_node[input_]
+                for input_ in node.inputs
+                if input_ in output_to_node
+            }
+        )
+        for node in nodes
+    ]
+    children = [[] for _ in nodes]  # type: List[List[int]]
+    for node_id, node_parents in enumerate(parents):
+        for parent in node_parents:
+            children[parent].append(node_id)
+
+    in_degree = [len(node_parents) for node_parents in parents]
+    group = [node_id for node_id, degree in enumerate(in_degree) if not degree]
+    groups = []
+    while group:
+        groups.append(group)
+        next_group = []
+        for node_id in group:
+            for child in children[node_id]:
+                in_degree[child] -= 1
+                if not in_degree[child]:
+                    next_group.append(child)
+        group = sorted(next_group)
+
+    if sum(len(group) for group in groups) < len(nodes):
+        circular = _circular_nodes(in_degree, parents, children)
+        raise CircularDependencyError(
+            "Circular dependencies exist among these items: {}".format(
+                [str(nodes[node_id]) for node_id in circular]
+            )
+        )
+
+    return [[nodes[node_id] for node_id in group] for group in groups]
+
+
+def _circular_nodes(
+    in_degree: List[int], parents: List[List[int]], children: List[List[int]]
+) -> List[int]:
+    """Find the nodes left unsorted by Kahn's algorithm which are part of a
+    circular dependency, discarding those which only depend on one.
+    """
+    remaining = {node_id for node_id, degree in enumerate(in_degree) if degree}
+    out_degree = {
+        node_id: sum(child in remaining for child in children[node_id])
+        for node_id in remaining
+    }
+    sinks = [node_id for node_id, degree in out_degree.items() if not degree]
+    while sinks:
+        node_id = sinks.pop()
+        remaining.discard(node_id)
+        for parent in parents[node_id]:
+            if parent in remaining:
+                out_degree[parent] -= 1
+                if not out_degree[parent]:
+                    sinks.append(parent)
+    return sorted(remaining)
 
 
 class CircularDependencyError(Exception):
@@ -0,0 +1,111 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Functions to cache the structure of a ``Pipeline`` in a binary snapshot,
+which is reloaded while the source code of the pipeline is unchanged.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Union
+
+from kedro.pipeline.pipeline import Pipeline
+
+
+def source_hash(path: Union[str, Path]) -> str:
+    """Hash a Python source file, or all the Python source files in a
+    directory and its subdirectories.
+
+    Args:
+        path: The path of a source file or of a directory.
+
+    Returns:
+        The hexadecimal SHA-256 digest of the names and contents of the files.
+
+    """
+    path = Path(path)
+    filepaths = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+    digest = hashlib.sha256()
+    for filepath in filepaths:
+        digest.update(filepath.relative_to(path).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(filepath.read_bytes())
+    return digest.hexdigest()
+
+
+def cached_pipeline(
+    filepath: Union[str, Path],
+    source_path: Union[str, Path],
+    create_pipeline: Callable[[], Pipeline],
+) -> Pipeline:
+    """Load a pipeline from its snapshot, unless the snapshot is missing or
+    the source code has changed since it was saved, in which case the
+    pipeline is created and its snapshot saved. Since loading a snapshot
+    does not import the node functions, the nodes of the pipeline can only
+    be inspected when it is loaded from its snapshot, not run.
+
+    Example:
+    ::
+
+        >>> from kedro.pipeline.snapshot import cached_pipeline
+        >>>
+        >>> def create():
+        >>>     from my_project.pipeline import create_pipeline
+        >>>     return create_pipeline()
+        >>>
+        >>> pipeline = cached_pipeline(".pipeline_snapshot", "src/my_project",
+        >>>                            create)
+        >>> print(pipeline.describe())
+
+    Args:
+        filepath: The path of the snapshot.
+        source_path: The path of the source file or directory the pipeline
+            is created from.
+        create_pipeline: A function creating the pipeline, importing its
+            node functions.
+
+    Returns:
+        The pipeline, loaded from its snapshot or created.
+
+    """
+    filepath = Path(filepath)
+    current_hash = source_hash(source_path)
+    logger = logging.getLogger(__name__)
+
+    try:
+        return Pipeline.from_snapshot(filepath.read_bytes(), current_hash)
+    except (OSError, ValueError) as exc:
+        logger.debug("Not loading pipeline snapshot `%s`: %s", str(filepath), exc)
+
+    pipeline = create_pipeline()
+    try:
+        filepath.write_bytes(pipeline.to_snapshot(current_hash))
+    except OSError as exc:
+        logger.warning("Failed to save pipeline snapshot `%s`: %s", str(filepath), exc)
+    return pipeline
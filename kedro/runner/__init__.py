@@ -30,6 +30,8 @@
 to execute ``Pipeline`` instances.
 """
 
+from .compiled_pipeline import CompiledPipeline  # NOQA
 from .parallel_runner import ParallelRunner  # NOQA
 from .runner import AbstractRunner, run_node  # NOQA
 from .sequential_runner import SequentialRunner  # NOQA
+from .streaming_runner import StreamingRunner  # NOQA
@@ -0,0 +1,286 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``CompiledPipeline`` runs a ``Pipeline`` in-process with an execution plan
+computed once, for applications which run the same pipeline many times, such
+as serving a model per request.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+
+class CompiledPipeline:
+    """``CompiledPipeline`` is a callable running a ``Pipeline`` with low
+    overhead. The order of the nodes, the data sets each node loads and saves,
+    and the point after which each intermediate result is no longer needed are
+    all computed once when the pipeline is compiled. Every call then passes
+    intermediate results between the nodes in a plain dictionary, without
+    copying them, and without validating the pipeline or logging each step.
+
+    Unlike runners, a ``CompiledPipeline`` does not copy the catalog or create
+    ``MemoryDataSet`` objects for the intermediate results, so the functions
+    of the nodes must not modify their inputs in place. Calls do not share any
+    state other than the data sets of the catalog, so a ``CompiledPipeline``
+    can be called from several threads as long as these data sets can.
+
+    ``run_batch`` runs the pipeline for many feed dictionaries at once, calling
+    the nodes marked with the ``kedro.pipeline.decorators.batchable`` decorator
+    once for the whole batch.
+
+    Example:
+    ::
+
+        >>> from kedro.io import DataCatalog, MemoryDataSet
+        >>> from kedro.pipeline import Pipeline, node
+        >>> from kedro.runner import CompiledPipeline
+        >>>
+        >>> pipeline = Pipeline([
+        >>>     node(lambda x, y: x + y, ["x", "params:y"], "z"),
+        >>>     node(lambda z: z * 2, "z", "result"),
+        >>> ])
+        >>> catalog = DataCatalog({"params:y": MemoryDataSet(2)})
+        >>> run = CompiledPipeline(pipeline, catalog)
+        >>>
+        >>> run({"x": 1})
+        {'result': 6}
+    """
+
+    def __init__(self, pipeline: Pipeline, catalog: DataCatalog = None):
+        """Compile a ``Pipeline`` into an execution plan.
+
+        Args:
+            pipeline: The ``Pipeline`` to compile.
+            catalog: The ``DataCatalog`` holding the data sets the pipeline
+                loads and saves. Inputs of the pipeline which are not in the
+                catalog must be provided on every call. Outputs which are not
+                in the catalog are returned by every call. Intermediate
+                results are passed on to the next nodes directly, and only
+                stored when they are in the catalog.
+
+        """
+        catalog = catalog or DataCatalog()
+        all_data_sets = catalog._data_sets  # pylint: disable=protected-access
+        self._data_sets = {
+            name: all_data_sets[name]
+            for name in pipeline.data_sets()
+            if name in all_data_sets
+        }
+        self._inputs = pipeline.inputs().difference(self._data_sets)
+        self._outputs = tuple(sorted(pipeline.outputs().difference(self._data_sets)))
+        self._plan = self._compile(pipeline)
+
+    def _compile(self, pipeline: Pipeline) -> Tuple[tuple, ...]:
+        nodes = pipeline.nodes
+
+        last_use = {}  # data set name: index of the last node using it
+        for idx, node in enumerate(nodes):
+            for name in node.inputs:
+                last_use[name] = idx
+        release = [[] for _ in nodes]
+        for name, idx in last_use.items():
+            release[idx].append(name)
+
+        plan = []
+        available = set(self._inputs)
+        for idx, node in enumerate(nodes):
+            loads = tuple(
+                (name, self._data_sets[name])
+                for name in node.inputs
+                if name not in available
+            )
+            saves = tuple(
+                (name, self._data_sets[name])
+                for name in node.outputs
+                if name in self._data_sets
+            )
+            available.update(node.inputs, node.outputs)
+            plan.append((node, tuple(node.inputs), loads, saves, tuple(release[idx])))
+        return tuple(plan)
+
+    @property
+    def _logger(self):
+        return logging.getLogger(__name__)
+
+    @property
+    def inputs(self) -> FrozenSet[str]:
+        """The names of the pipeline inputs which must be provided on
+        every call, because they are not in the catalog.
+
+        Returns:
+            The set of names of the inputs to provide.
+
+        """
+        return self._inputs
+
+    @property
+    def outputs(self) -> FrozenSet[str]:
+        """The names of the pipeline outputs returned by every call, because
+        they are not in the catalog.
+
+        Returns:
+            The set of names of the returned outputs.
+
+        """
+        return frozenset(self._outputs)
+
+    def __call__(self, feed_dict: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run the compiled pipeline.
+
+        Args:
+            feed_dict: The data of the pipeline inputs, by name. Data
+                provided for a data set of the catalog is used instead of
+                loading it.
+
+        Raises:
+            ValueError: When data for some of the pipeline inputs which are
+                not in the catalog is not provided.
+
+        Returns:
+            The outputs of the pipeline which are not in the catalog, by name.
+
+        """
+        data = dict(feed_dict) if feed_dict else {}
+        self._check_inputs(data)
+
+        for node, inputs, loads, saves, release in self._plan:
+            for name, data_set in loads:
+                if name not in data:
+                    data[name] = data_set.load()
+            try:
+                outputs = _run_node(node, inputs, data)
+            except Exception as exc:
+                self._logger.error("Node `%s` failed with error: \n%s", node, exc)
+                raise
+            for name, data_set in saves:
+                data_set.save(outputs[name])
+            data.update(outputs)
+            for name in release:
+                del data[name]
+
+        return {name: data[name] for name in self._outputs}
+
+    def run_batch(
+        self, feed_dicts: Iterable[Dict[str, Any]], max_workers: int = None
+    ) -> List[Dict[str, Any]]:
+        """Run the compiled pipeline for many feed dictionaries at once.
+        Nodes whose function is marked as ``batchable`` are called once for
+        the whole batch, with a list of values for every input. The other
+        nodes are called once per feed dictionary, concurrently in a pool of
+        threads. The data sets of the catalog are loaded once per batch, and
+        the outputs which are in the catalog are saved once per feed
+        dictionary, in order, like a sequence of calls would save them.
+
+        Args:
+            feed_dicts: The data of the pipeline inputs of every run, by name.
+            max_workers: The maximum number of threads running the nodes which
+                are not batchable. Defaults to the number of processors plus
+                four, up to 32, like ``concurrent.futures.ThreadPoolExecutor``.
+
+        Raises:
+            ValueError: When data for some of the pipeline inputs which are
+                not in the catalog is not provided, or when a batchable node
+                does not return one value per run for each of its outputs.
+
+        Returns:
+            The outputs of the pipeline which are not in the catalog, by name,
+            for every feed dictionary in order.
+
+        """
+        batch = [dict(feed_dict) if feed_dict else {} for feed_dict in feed_dicts]
+        for data in batch:
+            self._check_inputs(data)
+        if not batch:
+            return []
+
+        # the runs are split in one chunk per thread, rather than one task each
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        chunk_size = -(-len(batch) // max_workers)
+        chunks = [
+            batch[start : start + chunk_size]
+            for start in range(0, len(batch), chunk_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for node, inputs, loads, saves, release in self._plan:
+                for name, data_set in loads:
+                    if any(name not in data for data in batch):
+                        loaded = data_set.load()
+                        for data in batch:
+                            data.setdefault(name, loaded)
+                try:
+                    if node.batchable:
+                        batch_inputs = {
+                            name: [data[name] for data in batch] for name in inputs
+                        }
+                        outputs = node._run_batch(  # pylint: disable=protected-access
+                            batch_inputs, len(batch)
+                        )
+                    else:
+                        run_chunk = partial(_run_node_chunk, node, inputs)
+                        outputs = list(chain.from_iterable(pool.map(run_chunk, chunks)))
+                except Exception as exc:
+                    self._logger.error("Node `%s` failed with error: \n%s", node, exc)
+                    raise
+                for name, data_set in saves:
+                    for output in outputs:
+                        data_set.save(output[name])
+                for data, output in zip(batch, outputs):
+                    data.update(output)
+                    for name in release:
+                        del data[name]
+
+        return [{name: data[name] for name in self._outputs} for data in batch]
+
+    def _check_inputs(self, data: Dict[str, Any]) -> None:
+        missing = self._inputs.difference(data)
+        if missing:
+            raise ValueError(
+                "Pipeline input(s) {} not found in the DataCatalog "
+                "or `feed_dict`".format(sorted(missing))
+            )
+
+
+def _run_node(node: Node, inputs: Tuple[str, ...], data: Dict[str, Any]):
+    return node._run(  # pylint: disable=protected-access
+        {name: data[name] for name in inputs}
+    )
+
+
+def _run_node_chunk(
+    node: Node, inputs: Tuple[str, ...], chunk: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    return [_run_node(node, inputs, data) for data in chunk]
@@ -127,9 +127,10 @@ class ParallelRunner(AbstractRunner):
             )
 
         memory_data_sets = []
+        pipeline_outputs = pipeline.all_outputs()
         for name, data_set in data_sets.items():
             if (
-                name in pipeline.all_outputs()
+                name in pipeline_outputs
                 and isinstance(data_set, MemoryDataSet)
                 and not isinstance(data_set, BaseProxy)
             ):
@@ -158,7 +159,7 @@ class ParallelRunner(AbstractRunner):
         self._validate_catalog(catalog, pipeline)
         self._validate_nodes(pipeline.nodes)
 
-        done_inputs = pipeline.inputs()
+        done_inputs = set(pipeline.inputs())
         todo_nodes = set(pipeline.nodes)
         futures = set()
         with ProcessPoolExecutor() as pool:
@@ -31,9 +31,11 @@ implementations.
 
 import logging
 from abc import ABC, abstractmethod
+from collections import Counter
+from itertools import chain
 from typing import Any, Dict
 
-from kedro.io import AbstractDataSet, DataCatalog
+from kedro.io import AbstractDataSet, DataCatalog, DataSetError
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
 
@@ -76,16 +78,24 @@ class AbstractRunner(ABC):
 
         free_outputs = pipeline.outputs() - set(catalog.list())
         unregistered_ds = pipeline.data_sets() - set(catalog.list())
+        load_counts = Counter(chain.from_iterable(n.inputs for n in pipeline.nodes))
         for ds_name in unregistered_ds:
-            num_loads = len(pipeline.only_nodes_with_inputs(ds_name).nodes)
-            num_loads = num_loads if num_loads > 0 else None
+            num_loads = load_counts[ds_name] or None
             catalog.add(ds_name, self.create_default_data_set(ds_name, num_loads))
 
-        self._run(pipeline, catalog)
-
-        self._logger.info("Pipeline execution completed successfully.")
-
-        return {ds_name: catalog.load(ds_name) for ds_name in free_outputs}
+        try:
+            self._run(pipeline, catalog)
+            self._logger.info("Pipeline execution completed successfully.")
+            outputs = {ds_name: catalog.load(ds_name) for ds_name in free_outputs}
+        except BaseException:
+            # failing to release the data sets must not hide why the run failed
+            try:
+                catalog.release()
+            except DataSetError as exc:
+                self._logger.error("Failed to release the catalog:\n%s", exc)
+            raise
+        catalog.release()
+        return outputs
 
     def run_only_missing(
         self, pipeline: Pipeline, catalog: DataCatalog
@@ -0,0 +1,365 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""``StreamingRunner`` is an ``AbstractRunner`` implementation. It runs
+every node of a ``Pipeline`` in its own thread and streams the chunks yielded
+by generator nodes to the nodes and data sets consuming them.
+"""
+
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
+from threading import Event
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+import pandas as pd
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.runner import AbstractRunner
+
+_END = object()
+_SAVER = object()
+
+
+def _collect(chunks: Iterable[Any]) -> Any:
+    """Collect the chunks of a streamed data set for the nodes and data sets
+    which cannot process them one at a time. Data frames are concatenated,
+    and any other chunks are returned as a list.
+    """
+    chunks = list(chunks)
+    if chunks and all(isinstance(chunk, pd.DataFrame) for chunk in chunks):
+        return pd.concat(chunks)
+    return chunks
+
+
+class _Aborted(Exception):
+    """Raised in the threads of a run to stop them, after a node failed."""
+
+    pass
+
+
+class _Stream:
+    """Bounded queues carrying the chunks of a streamed data set, one queue
+    for every consumer of the data set.
+    """
+
+    def __init__(self, consumers: Iterable[Any], queue_size: int, abort: Event):
+        self._queues = {consumer: Queue(maxsize=queue_size) for consumer in consumers}
+        self._released = set()
+        self._abort = abort
+
+    def put(self, chunk: Any) -> None:
+        """Put a chunk in the queue of every consumer, blocking while any of
+        the queues is full.
+        """
+        for consumer, queue in self._queues.items():
+            self._wait(consumer, queue.put, chunk)
+
+    def close(self) -> None:
+        """Mark the end of the stream for every consumer."""
+        self.put(_END)
+
+    def iterate(self, consumer: Any) -> Iterator[Any]:
+        """Iterate over the chunks in the queue of a consumer."""
+        queue = self._queues[consumer]
+        while True:
+            chunk = self._wait(consumer, queue.get)
+            if chunk is _END:
+                return
+            yield chunk
+
+    def release(self, consumer: Any) -> None:
+        """Stop queueing chunks for a consumer which has finished running."""
+        self._released.add(consumer)
+
+    def _wait(self, consumer: Any, method: Callable, *args) -> Any:
+        while consumer not in self._released:
+            try:
+                return method(*args, timeout=0.1)
+            except (Empty, Full):
+                if self._abort.is_set():
+                    raise _Aborted()
+        return _END
+
+
+class _StreamingRun:
+    """The state of a single run of a ``StreamingRunner``, shared by the
+    threads running its nodes and saving its streamed data sets.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        queue_size: int,
+        logger: logging.Logger,
+    ):
+        self._catalog = catalog
+        self._queue_size = queue_size
+        self._logger = logger
+        self._consumers = defaultdict(list)  # type: Dict[str, list]
+        for node in pipeline.nodes:
+            for name in node.inputs:
+                self._consumers[name].append(node)
+        self._streams = {}  # type: Dict[str, _Stream]
+        self._checked = set()  # generator nodes checked before the run
+        self.abort = Event()
+        self.events = Queue()  # type: Queue
+
+    def task(self, func: Callable, *args) -> Callable[[], None]:
+        """Wrap a function running in a thread so that it reports its
+        completion, or the exception it raised, as an event.
+        """
+
+        def _task():
+            try:
+                func(*args)
+                self.events.put(("done", None))
+            except _Aborted:
+                self.events.put(("done", None))
+            except Exception as exc:  # pylint: disable=broad-except
+                self.events.put(("failed", exc))
+
+        return _task
+
+    def check(self, pipeline: Pipeline) -> None:
+        """Check the generator nodes of the pipeline before running any node,
+        see ``_check_streamed_once``.
+        """
+        for node in pipeline.nodes:
+            if node._yields_chunks:  # pylint: disable=protected-access
+                self._check_streamed_once(node)
+                self._checked.add(node)
+
+    def run_node(self, node: Node) -> None:
+        """Run a node, passing on the chunks of its outputs if its function
+        is a generator, or saving its outputs to the catalog otherwise.
+        """
+        try:
+            inputs = {name: self._load(node, name) for name in node.inputs}
+            self._logger.info("Running node: %s", str(node))
+            outputs, streamed = node._stream(inputs)  # pylint: disable=protected-access
+            if streamed:
+                self._stream_outputs(node, outputs)
+            else:
+                for name, data in outputs.items():
+                    self._catalog.save(name, data)
+                self.events.put(("available", node.outputs))
+        except _Aborted:
+            raise
+        except Exception as exc:
+            self._logger.error("Node `%s` failed with error: \n%s", str(node), str(exc))
+            raise
+        finally:
+            for name in node.inputs:
+                if name in self._streams:
+                    self._streams[name].release(node)
+
+    def save_stream(self, name: str) -> None:
+        """Save the chunks of a streamed data set to the catalog, collecting
+        them first unless the data set saves chunks one at a time.
+        """
+        chunks = self._streams[name].iterate(_SAVER)
+        if not self._saves_chunks(name):
+            chunks = _collect(chunks)
+        self._catalog.save(name, chunks)
+
+    def _load(self, node: Node, name: str) -> Any:
+        if name not in self._streams:
+            return self._catalog.load(name)
+        chunks = self._streams[name].iterate(node)
+        return chunks if node.streaming else _collect(chunks)
+
+    def _check_streamed_once(self, node: Node) -> None:
+        """Check that no node consumes several data sets computed from the
+        chunks of ``node``. Such a node reads them at different paces, so
+        the queue of one of them fills up and blocks ``node`` while it
+        waits for the chunks of the other, and the run would never end.
+        """
+        derived = set(node.outputs)
+        descendants = []
+        pending = list(node.outputs)
+        while pending:
+            for consumer in self._consumers[pending.pop()]:
+                if consumer not in descendants:
+                    descendants.append(consumer)
+                    derived.update(consumer.outputs)
+                    pending.extend(consumer.outputs)
+        for consumer in descendants:
+            inputs = sorted(derived.intersection(consumer.inputs))
+            if len(inputs) > 1:
+                raise ValueError(
+                    "Node `{}` consumes data sets {}, which are all computed "
+                    "from the chunks streamed by node `{}`. StreamingRunner "
+                    "cannot run it, because these data sets would be read at "
+                    "different paces and block each other.".format(
+                        str(consumer), inputs, str(node)
+                    )
+                )
+
+    def _stream_outputs(self, node: Node, chunks: Iterator[Dict[str, Any]]) -> None:
+        if node not in self._checked:
+            # e.g. a function returning a generator without being one
+            self._check_streamed_once(node)
+        node_streams = {}
+        for name in node.outputs:
+            readers = list(self._consumers[name])
+            # chunks are collected in memory only when nothing consumes them
+            if not (readers and self._is_memory_data_set(name)):
+                readers.append(_SAVER)
+                self.events.put(("save", name))
+            node_streams[name] = self._streams[name] = _Stream(
+                readers, self._queue_size, self.abort
+            )
+        self.events.put(("available", node.outputs))
+        for chunk in chunks:
+            for name, data in chunk.items():
+                node_streams[name].put(data)
+        for stream in node_streams.values():
+            stream.close()
+
+    def _is_memory_data_set(self, name: str) -> bool:
+        data_sets = self._catalog._data_sets  # pylint: disable=protected-access
+        return isinstance(data_sets.get(name), MemoryDataSet)
+
+    def _saves_chunks(self, name: str) -> bool:
+        data_sets = self._catalog._data_sets  # pylint: disable=protected-access
+        return getattr(data_sets.get(name), "_SAVES_CHUNKS", False)
+
+
+class StreamingRunner(AbstractRunner):
+    """``StreamingRunner`` is an ``AbstractRunner`` implementation. It
+    runs every node in its own thread, as soon as its inputs are available.
+
+    The chunks yielded by nodes whose function is a generator are passed on
+    through bounded queues, one chunk at a time, so that a chain of nodes can
+    process data sets which do not fit in memory. A node consuming a streamed
+    data set receives an iterator over its chunks if it is a generator itself
+    or if it is marked by the ``kedro.pipeline.decorators.streaming``
+    decorator. Any other node receives the list of chunks, or their
+    concatenation if they are pandas data frames, once all of them have been
+    yielded. Streamed data sets are saved in the same way, except for
+    ``CSVLocalDataSet``, ``ParquetLocalDataSet`` and
+    ``JSONLinesLocalDataSet``, which save the chunks one at a time. A
+    streamed ``MemoryDataSet`` is only saved if no node of the pipeline
+    consumes it.
+
+    A node cannot consume several data sets computed from the chunks of the
+    same generator node, e.g. a streamed data set together with the result
+    of another node consuming it, because it would wait for one of them
+    while the generator is blocked by the full queue of the other. The run
+    fails with a ``ValueError`` before any node runs.
+    """
+
+    def __init__(self, queue_size: int = 8):
+        """Instantiates the runner.
+
+        Args:
+            queue_size: The maximum number of chunks queued for every
+                consumer of a streamed data set. A node yielding chunks
+                blocks while any of its consumers falls this far behind.
+
+        Raises:
+            ValueError: when ``queue_size`` is not positive.
+
+        """
+        if queue_size <= 0:
+            raise ValueError("`queue_size` of StreamingRunner must be positive.")
+        self._queue_size = queue_size
+
+    def create_default_data_set(self, ds_name: str, max_loads: int) -> AbstractDataSet:
+        """Factory method for creating the default data set for the runner.
+
+        Args:
+            ds_name: Name of the missing data set
+            max_loads: Maximum number of times ``load`` method of the
+                default data set is allowed to be invoked. Any number of
+                calls is allowed if the argument is not set.
+
+        Returns:
+            An instance of an implementation of AbstractDataSet to be used
+            for all unregistered data sets.
+
+        """
+        return MemoryDataSet(max_loads=max_loads)
+
+    def _run(self, pipeline: Pipeline, catalog: DataCatalog) -> None:
+        """The method implementing streaming pipeline running.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+
+        Raises:
+            ValueError: when a node consumes several data sets computed from
+                the chunks of the same generator node.
+            Exception: the first exception raised by a node or a data set,
+                after all the other running nodes have been stopped.
+
+        """
+        run = _StreamingRun(pipeline, catalog, self._queue_size, self._logger)
+        run.check(pipeline)
+        available = set(pipeline.inputs())
+        todo_nodes = set(pipeline.nodes)
+        running = 0
+        error = None
+
+        # every node and every saved stream may need a thread of its own
+        max_workers = len(todo_nodes) + len(pipeline.all_outputs()) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while True:
+                if error is None:
+                    ready = {n for n in todo_nodes if available.issuperset(n.inputs)}
+                    todo_nodes -= ready
+                    for node in ready:
+                        running += 1
+                        pool.submit(run.task(run.run_node, node))
+                if not running:
+                    break
+                kind, value = run.events.get()
+                if kind == "available":
+                    available.update(value)
+                elif kind == "save":
+                    running += 1
+                    pool.submit(run.task(run.save_stream, value))
+                else:
+                    running -= 1
+                    if kind == "failed" and error is None:
+                        error = value
+                        run.abort.set()
+
+        if error is not None:
+            raise error
+        if todo_nodes:
+            raise RuntimeError(
+                "Unable to schedule new tasks although some nodes have not "
+                "been run: {}".format(sorted(str(node) for node in todo_nodes))
+            )
@@ -33,6 +33,7 @@ import os
 import shutil
 import subprocess
 import sys
+from datetime import timedelta
 from pathlib import Path
 
 import click
@@ -79,6 +80,19 @@ with --runner."""
 RUNNER_ARG_HELP = """Specify a runner that you want to run the pipeline with.
 This option cannot be used together with --parallel."""
 
+KEEP_LAST_ARG_HELP = """Keep this number of most recent versions of each
+versioned data set."""
+
+KEEP_DAYS_ARG_HELP = """Keep the versions created in this number of days."""
+
+LOAD_VERSION_ARG_HELP = """Keep a specific version of a data set, given as
+`data_set_name:version`. Option can be used multiple times."""
+
+DRY_RUN_ARG_HELP = """List the versions which would be deleted without
+deleting them."""
+
+PIPELINE_SNAPSHOT_PATH = PROJ_PATH / ".pipeline_snapshot"
+
 
 def __get_kedro_context__():
     """Used to provide this project's context to plugins."""
@@ -109,6 +123,76 @@ def run(tag, env, parallel, runner):
     main(tags=tag, env=env, runner=runner)
 
 
+@cli.group()
+def catalog():
+    """Commands for working with the project data catalog."""
+
+
+@catalog.command("gc")
+@click.option("--keep-last", type=click.IntRange(min=1), default=None, help=KEEP_LAST_ARG_HELP)
+@click.option("--keep-days", type=float, default=None, help=KEEP_DAYS_ARG_HELP)
+@click.option("--load-version", "-lv", type=str, multiple=True, help=LOAD_VERSION_ARG_HELP)
+@click.option("--env", "-e", type=str, default=None, multiple=False, help=ENV_ARG_HELP)
+@click.option("--dry-run", is_flag=True, multiple=False, help=DRY_RUN_ARG_HELP)
+def catalog_gc(keep_last, keep_days, load_version, env, dry_run):
+    """Delete old versions of the versioned data sets."""
+    from {{cookiecutter.python_package}}.run import create_catalog, get_config
+    if keep_last is None and keep_days is None:
+        raise KedroCliError("At least one of --keep-last and --keep-days must be specified.")
+    if keep_days is not None and keep_days <= 0:
+        raise KedroCliError("--keep-days must be a positive number of days.")
+
+    load_versions = {}
+    for entry in load_version:
+        name, _, version = entry.partition(":")
+        if not name or not version:
+            raise KedroCliError(
+                "Expected --load-version in the form `data_set_name:version`, "
+                "got `{}`.".format(entry)
+            )
+        load_versions[name] = version
+
+    conf = get_config(project_path=str(Path.cwd()), env=env)
+    data_catalog = create_catalog(config=conf)
+    max_age = timedelta(days=keep_days) if keep_days is not None else None
+    pruned = data_catalog.prune_versions(keep_last, max_age, load_versions, dry_run)
+
+    action = "Would delete" if dry_run else "Deleted"
+    for name, versions in sorted(pruned.items()):
+        secho("{} {} versions of `{}`:".format(action, len(versions), name), fg="green")
+        for version in versions:
+            secho("  " + version)
+    if not pruned:
+        secho("No versions to delete.")
+
+
+@cli.group()
+def pipeline():
+    """Commands for inspecting the project pipeline."""
+
+
+@pipeline.command("describe")
+@click.option("--tag", "-t", type=str, default=None, multiple=True, help=TAG_ARG_HELP)
+def pipeline_describe(tag):
+    """Describe the pipeline, listing its nodes in execution order. While the
+    source code is unchanged, the pipeline is loaded from a snapshot of its
+    structure, without importing the node modules."""
+    from kedro.pipeline.snapshot import cached_pipeline
+
+    def _create_pipeline():
+        from {{cookiecutter.python_package}}.pipeline import create_pipeline
+        return create_pipeline()
+
+    project_pipeline = cached_pipeline(
+        PIPELINE_SNAPSHOT_PATH,
+        PROJ_PATH / "src" / "{{cookiecutter.python_package}}",
+        _create_pipeline,
+    )
+    if tag:
+        project_pipeline = project_pipeline.only_nodes_with_tags(*tag)
+    secho(project_pipeline.describe())
+
+
 @forward_command(cli, forward_help=True)
 def test(args):
     """Run the test suite."""
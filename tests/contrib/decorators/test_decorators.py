@@ -25,11 +25,22 @@
 #
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+# pylint: disable=protected-access
+
+import gc
+
 import pandas as pd
 import pytest
 from pyspark.sql import SparkSession
 
-from kedro.contrib.decorators import pandas_to_spark, retry, spark_to_pandas
+from kedro.contrib.decorators import (
+    clear_conversion_cache,
+    pandas_to_spark,
+    retry,
+    spark_to_pandas,
+)
+from kedro.contrib.decorators.decorators import ARROW_ENABLED, _TO_SPARK_CACHE
 from kedro.pipeline import node
 
 
@@ -38,6 +49,12 @@ def spark():
     return SparkSession.builder.getOrCreate()
 
 
+@pytest.fixture(autouse=True)
+def cleanup_conversion_cache():
+    yield
+    clear_conversion_cache()
+
+
 @pytest.fixture()
 def pandas_df():
     return pd.DataFrame(
@@ -80,6 +97,129 @@ def test_spark_to_pandas(three_arg_node, pandas_df, inputs):
         assert res[output].equals(pandas_df)
 
 
+def test_pandas_to_spark_kwargs(spark, pandas_df, inputs):
+    kwargs_node = node(
+        lambda arg1, arg2: [arg1, arg2],
+        {"arg1": "input1", "arg2": "input2"},
+        ["output1", "output2"],
+    )
+    res = kwargs_node.decorate(pandas_to_spark(spark)).run(inputs)
+    for output in ["output1", "output2"]:
+        assert res[output].toPandas().equals(pandas_df)
+
+
+def test_spark_to_pandas_kwargs(pandas_df, inputs):
+    kwargs_node = node(
+        lambda arg1, arg2: [arg1, arg2],
+        {"arg1": "input1", "arg2": "input2"},
+        ["output1", "output2"],
+    )
+    res = kwargs_node.decorate(spark_to_pandas()).run(inputs)
+    for output in ["output1", "output2"]:
+        assert res[output].equals(pandas_df)
+
+
+def test_pandas_to_spark_schema(three_arg_node, spark, inputs):
+    schema = {"arg1": "Name string, Age long, member string"}
+    res = three_arg_node.decorate(pandas_to_spark(spark, schema=schema)).run(inputs)
+    assert res["output1"].schema.simpleString() == (
+        "struct<Name:string,Age:bigint,member:string>"
+    )
+
+
+def test_pandas_to_spark_cache(mocker, spark, pandas_df):
+    create_data_frame = mocker.spy(spark, "createDataFrame")
+    decorator = pandas_to_spark(spark, cache=True)
+    first = node(lambda data: data, "input1", "output1").decorate(decorator)
+    second = node(lambda data: data, "input1", "output2").decorate(decorator)
+
+    res1 = first.run({"input1": pandas_df})
+    res2 = second.run({"input1": pandas_df})
+    assert res1["output1"] is res2["output2"]
+    assert create_data_frame.call_count == 1
+
+    second.run({"input1": pandas_df.copy()})
+    assert create_data_frame.call_count == 2
+
+
+def test_pandas_to_spark_no_cache(mocker, spark, pandas_df):
+    create_data_frame = mocker.spy(spark, "createDataFrame")
+    decorated = node(lambda data: data, "input1", "output1").decorate(
+        pandas_to_spark(spark)
+    )
+    decorated.run({"input1": pandas_df})
+    decorated.run({"input1": pandas_df})
+    assert create_data_frame.call_count == 2
+
+
+def test_spark_to_pandas_cache(mocker, spark_df, pandas_df):
+    to_pandas = mocker.spy(type(spark_df), "toPandas")
+
+    def _mutate(data):
+        data["Age"] = 0
+        return data
+
+    decorator = spark_to_pandas(cache=True)
+    mutating = node(_mutate, "input", "output1").decorate(decorator)
+    reading = node(lambda data: data, "input", "output2").decorate(decorator)
+
+    mutating.run({"input": spark_df})
+    res = reading.run({"input": spark_df})
+    assert to_pandas.call_count == 1
+    assert res["output2"].equals(pandas_df)
+
+
+def test_cache_dropped_with_source(spark, pandas_df):
+    decorated = node(lambda data: data, "input1", "output1").decorate(
+        pandas_to_spark(spark, cache=True)
+    )
+    source = pandas_df.copy()
+    decorated.run({"input1": source})
+    assert len(_TO_SPARK_CACHE._entries) == 1
+
+    del source
+    gc.collect()
+    assert not _TO_SPARK_CACHE._entries
+
+
+def test_cache_bounded_by_size(mocker, spark, pandas_df):
+    mocker.patch.object(
+        _TO_SPARK_CACHE, "_max_bytes", pandas_df.memory_usage(index=True).sum()
+    )
+    decorated = node(lambda data: data, "input1", "output1").decorate(
+        pandas_to_spark(spark, cache=True)
+    )
+    first, second = pandas_df.copy(), pandas_df.copy()
+    decorated.run({"input1": first})
+    decorated.run({"input1": second})
+    assert _TO_SPARK_CACHE.get(first, (id(spark), "None")) is None
+    assert _TO_SPARK_CACHE.get(second, (id(spark), "None")) is not None
+
+
+@pytest.mark.parametrize("previous", ["false", "true"])
+def test_arrow_conf_restored(mocker, three_arg_node, spark, inputs, previous):
+    spark.conf.set(ARROW_ENABLED, previous)
+    arrow_enabled = []
+    to_pandas = mocker.patch(
+        "pyspark.sql.DataFrame.toPandas",
+        side_effect=lambda: arrow_enabled.append(spark.conf.get(ARROW_ENABLED)),
+    )
+    decorated = three_arg_node.decorate(
+        pandas_to_spark(spark, arrow=True), spark_to_pandas(arrow=True)
+    )
+    decorated.run(inputs)
+    assert to_pandas.called
+    assert set(arrow_enabled) == {"true"}
+    assert spark.conf.get(ARROW_ENABLED) == previous
+
+
+def test_arrow_conf_untouched(mocker, three_arg_node, spark, inputs):
+    conf_set = mocker.spy(type(spark.conf), "set")
+    decorated = three_arg_node.decorate(pandas_to_spark(spark), spark_to_pandas())
+    decorated.run(inputs)
+    conf_set.assert_not_called()
+
+
 def test_retry():
     def _bigger(obj):
         obj["value"] += 1
@@ -0,0 +1,113 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This file contains an in-memory stand-in for azure's ``BlockBlobService``,
+which the azure data set tests run against, like a local storage emulator.
+"""
+import threading
+from hashlib import md5
+
+import pytest
+from azure.common import AzureHttpError, AzureMissingResourceHttpError
+from azure.storage.blob.models import Blob
+
+
+class FakeBlockBlobService:
+    """Keeps committed blobs and uncommitted blocks in memory and checks
+    the ETag conditions of ranged reads."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.blocks = {}
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def _record(self, request):
+        with self._lock:
+            self.requests.append(request)
+
+    def _commit(self, container_name, blob_name, content):
+        self.blobs[(container_name, blob_name)] = bytes(content)
+
+    def _get(self, container_name, blob_name):
+        try:
+            return self.blobs[(container_name, blob_name)]
+        except KeyError:
+            raise AzureMissingResourceHttpError("The blob does not exist.", 404)
+
+    def get_blob_properties(self, container_name, blob_name, **kwargs):
+        self._record(("get_blob_properties", kwargs))
+        content = self._get(container_name, blob_name)
+        blob = Blob()
+        blob.properties.content_length = len(content)
+        blob.properties.etag = md5(content).hexdigest()
+        return blob
+
+    # pylint: disable=too-many-arguments
+    def get_blob_to_bytes(
+        self, container_name, blob_name, start_range, end_range, if_match, **kwargs
+    ):
+        self._record(("get_blob_to_bytes", kwargs))
+        content = self._get(container_name, blob_name)
+        if md5(content).hexdigest() != if_match:
+            raise AzureHttpError("The condition specified was not met.", 412)
+        return Blob(content=content[start_range : end_range + 1])
+
+    def create_blob_from_bytes(self, container_name, blob_name, blob, **kwargs):
+        self._record(("create_blob_from_bytes", kwargs))
+        self._commit(container_name, blob_name, blob)
+
+    def put_block(self, container_name, blob_name, block, block_id, **kwargs):
+        self._record(("put_block", kwargs))
+        with self._lock:
+            self.blocks[(container_name, blob_name, block_id)] = bytes(block)
+
+    def put_block_list(self, container_name, blob_name, block_list, **kwargs):
+        self._record(("put_block_list", kwargs))
+        content = b"".join(
+            self.blocks.pop((container_name, blob_name, block.id))
+            for block in block_list
+        )
+        self._commit(container_name, blob_name, content)
+
+    def count(self, request_name):
+        return sum(1 for name, _ in self.requests if name == request_name)
+
+
+@pytest.fixture
+def fake_blob_service():
+    return FakeBlockBlobService()
+
+
+@pytest.fixture
+def blob_service(mocker, fake_blob_service):
+    mocker.patch(
+        "kedro.contrib.io.azure.csv_blob.BlockBlobService",
+        return_value=fake_blob_service,
+    )
+    return fake_blob_service
@@ -0,0 +1,207 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=protected-access
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from azure.common import AzureHttpError
+
+from kedro.contrib.io.azure.blob_transfer import BlobBlockReader, BlobBlockWriter
+
+CONTAINER = "test_container"
+BLOB = "test.bin"
+CONTENT = bytes(range(256)) * 40
+
+
+class TestBlobBlockWriter:
+    def test_small_content(self, fake_blob_service):
+        """Test that content smaller than a block is sent in one request"""
+        with BlobBlockWriter(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024
+        ) as blob:
+            blob.write(b"some data")
+        assert fake_blob_service.blobs[(CONTAINER, BLOB)] == b"some data"
+        assert fake_blob_service.count("create_blob_from_bytes") == 1
+        assert fake_blob_service.count("put_block") == 0
+
+    @pytest.mark.parametrize("write_size", [100, 1024, 3000])
+    def test_blocks(self, fake_blob_service, write_size):
+        """Test that the content is uploaded in blocks of ``block_size``"""
+        with BlobBlockWriter(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024, max_concurrency=3
+        ) as blob:
+            for start in range(0, len(CONTENT), write_size):
+                blob.write(CONTENT[start : start + write_size])
+        assert fake_blob_service.blobs[(CONTAINER, BLOB)] == CONTENT
+        assert fake_blob_service.count("put_block") == 10
+        assert all(len(block) == 1024 for block in fake_blob_service.blocks.values())
+
+    def test_block_args(self, fake_blob_service):
+        """Test that only the arguments supported by ``put_block`` are
+        passed to it"""
+        with BlobBlockWriter(
+            fake_blob_service,
+            CONTAINER,
+            BLOB,
+            block_size=1024,
+            lease_id="lease",
+            metadata={},
+        ) as blob:
+            blob.write(CONTENT)
+        assert ("put_block", {"lease_id": "lease"}) in fake_blob_service.requests
+        assert ("put_block_list", {"lease_id": "lease", "metadata": {}}) in (
+            fake_blob_service.requests
+        )
+
+    def test_error_leaves_blob_unchanged(self, fake_blob_service):
+        """Test that nothing is committed if an error is raised"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = b"old"
+        with pytest.raises(ValueError, match="failure"):
+            with BlobBlockWriter(
+                fake_blob_service, CONTAINER, BLOB, block_size=1024
+            ) as blob:
+                blob.write(CONTENT)
+                raise ValueError("failure")
+        assert fake_blob_service.blobs[(CONTAINER, BLOB)] == b"old"
+        assert fake_blob_service.count("put_block_list") == 0
+
+    def test_commit_error(self, fake_blob_service, mocker):
+        """Test that the writer is closed if the block list cannot be
+        committed, so that closing it again does not write anything"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = b"old"
+        mocker.patch.object(
+            fake_blob_service, "put_block_list", side_effect=AzureHttpError("", 500)
+        )
+        blob = BlobBlockWriter(fake_blob_service, CONTAINER, BLOB, block_size=1024)
+        blob.write(CONTENT[:2048])
+        with pytest.raises(AzureHttpError):
+            blob.close()
+        assert blob.closed
+
+        blob.close()
+        assert fake_blob_service.blobs[(CONTAINER, BLOB)] == b"old"
+        assert fake_blob_service.count("put_block") == 2
+        assert fake_blob_service.count("create_blob_from_bytes") == 0
+
+    def test_block_error(self, fake_blob_service, mocker):
+        """Test that the writer is closed if a block cannot be uploaded"""
+        mocker.patch.object(
+            fake_blob_service, "put_block", side_effect=AzureHttpError("", 500)
+        )
+        blob = BlobBlockWriter(fake_blob_service, CONTAINER, BLOB, block_size=1024)
+        blob.write(CONTENT)
+        with pytest.raises(AzureHttpError):
+            blob.close()
+        assert blob.closed
+        assert (CONTAINER, BLOB) not in fake_blob_service.blobs
+        assert fake_blob_service.count("create_blob_from_bytes") == 0
+
+    def test_close_twice(self, fake_blob_service):
+        """Test that closing a closed writer does not upload the content
+        again"""
+        blob = BlobBlockWriter(fake_blob_service, CONTAINER, BLOB)
+        blob.write(b"some data")
+        blob.close()
+        blob.close()
+        assert fake_blob_service.count("create_blob_from_bytes") == 1
+
+    def test_write_closed(self, fake_blob_service):
+        blob = BlobBlockWriter(fake_blob_service, CONTAINER, BLOB)
+        blob.close()
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            blob.write(b"data")
+
+    @pytest.mark.parametrize(
+        "transfer_args,pattern",
+        [
+            ({"block_size": 0}, r"`block_size` must be between 1 and \d+ bytes"),
+            ({"max_concurrency": 0}, r"`max_concurrency` must be a positive"),
+        ],
+    )
+    def test_invalid_args(self, fake_blob_service, transfer_args, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            BlobBlockWriter(fake_blob_service, CONTAINER, BLOB, **transfer_args)
+
+
+class TestBlobBlockReader:
+    @pytest.mark.parametrize("read_size", [100, 1024, 5000, -1])
+    def test_read(self, fake_blob_service, read_size):
+        """Test that the blob is read in ranges of ``block_size``"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = CONTENT
+        with BlobBlockReader(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024, max_concurrency=3
+        ) as blob:
+            if read_size < 0:
+                content = blob.read()
+            else:
+                content = b"".join(iter(lambda: blob.read(read_size), b""))
+        assert content == CONTENT
+        assert fake_blob_service.count("get_blob_to_bytes") == 10
+
+    def test_empty_blob(self, fake_blob_service):
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = b""
+        with BlobBlockReader(fake_blob_service, CONTAINER, BLOB) as blob:
+            assert blob.read() == b""
+        assert fake_blob_service.count("get_blob_to_bytes") == 0
+
+    def test_bounded_prefetch(self, fake_blob_service):
+        """Test that at most ``max_concurrency`` ranges are read ahead"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = CONTENT
+        with BlobBlockReader(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024, max_concurrency=2
+        ) as blob:
+            blob.read(10)
+            blob._executor.shutdown(wait=True)
+            assert fake_blob_service.count("get_blob_to_bytes") == 3
+
+    def test_concurrent_overwrite(self, fake_blob_service):
+        """Test that the read fails if the blob changes while it is read"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = CONTENT
+        with BlobBlockReader(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024, max_concurrency=1
+        ) as blob:
+            blob.read(1024)
+            fake_blob_service.blobs[(CONTAINER, BLOB)] = CONTENT[::-1]
+            with pytest.raises(AzureHttpError, match="condition"):
+                blob.read()
+
+    def test_parallel_ranges(self, fake_blob_service, mocker):
+        """Test that ranges are submitted to a pool of ``max_concurrency``
+        threads"""
+        fake_blob_service.blobs[(CONTAINER, BLOB)] = CONTENT
+        executor = mocker.patch(
+            "kedro.contrib.io.azure.blob_transfer.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        )
+        with BlobBlockReader(
+            fake_blob_service, CONTAINER, BLOB, block_size=1024, max_concurrency=4
+        ) as blob:
+            assert blob.read() == CONTENT
+        executor.assert_called_once_with(max_workers=4)
@@ -83,54 +83,32 @@ def test_pass_credentials_save(blob_service, blob_csv_data_set, dummy_dataframe)
     )
 
 
-@patch("kedro.contrib.io.azure.csv_blob.BlockBlobService.get_blob_to_text")
-def test_load_blob_args(get_blob_mock, blob_csv_data_set):
-    try:
-        blob_csv_data_set().load()
-    except DataSetError:
-        pass
-
-    get_blob_mock.assert_called_with(
-        container_name=TEST_CONTAINER_NAME, blob_name=TEST_FILE_NAME, to_extra=42
+def test_load_blob_args(blob_service, blob_csv_data_set):
+    blob_service.blobs[(TEST_CONTAINER_NAME, TEST_FILE_NAME)] = b"name,age\ntom,3"
+    blob_csv_data_set().load()
+    assert ("get_blob_properties", {"to_extra": 42}) in blob_service.requests
+    assert ("get_blob_to_bytes", {"max_connections": 1, "to_extra": 42}) in (
+        blob_service.requests
     )
 
 
-class BlobMock:
-    def __init__(self):
-        self._content = "name,age\ntom,3\nbob,4"
-
-    @property
-    def content(self):
-        return self._content
-
-
-def mock_load_func():
-    def mocked(*args, **kwargs):
-        return BlobMock()
-
-    return mocked
-
-
-@patch(
-    "kedro.contrib.io.azure.csv_blob.BlockBlobService.get_blob_to_text",
-    new_callable=mock_load_func,
-)
-def test_load(get_blob_mock, blob_csv_data_set):
+def test_load(blob_service, blob_csv_data_set):
+    blob_service.blobs[
+        (TEST_CONTAINER_NAME, TEST_FILE_NAME)
+    ] = b"name,age\ntom,3\nbob,4"
     result = blob_csv_data_set().load()[["name", "age"]]
     expected = pd.DataFrame({"name": ["tom", "bob"], "age": [3, 4]})
     expected = expected[["name", "age"]]
     assert result.equals(expected)
 
 
-@patch("kedro.contrib.io.azure.csv_blob.BlockBlobService.create_blob_from_text")
-def test_save_blob_args(blob_from_mock, blob_csv_data_set, dummy_dataframe):
+def test_save_blob_args(blob_service, blob_csv_data_set, dummy_dataframe):
     blob_csv_data_set().save(dummy_dataframe)
-    blob_from_mock.assert_called_with(
-        container_name=TEST_CONTAINER_NAME,
-        blob_name=TEST_FILE_NAME,
-        text=dummy_dataframe.to_csv(index=False),
-        from_extra=42,
-    )
+    assert blob_service.requests == [
+        ("create_blob_from_bytes", {"max_connections": 1, "from_extra": 42})
+    ]
+    content = blob_service.blobs[(TEST_CONTAINER_NAME, TEST_FILE_NAME)]
+    assert content.decode("utf-8") == dummy_dataframe.to_csv(index=False)
 
 
 # pylint: disable=protected-access
@@ -154,3 +132,65 @@ def test_str_representation(blob_csv_data_set):
     assert "CSVBlobDataSet" in str(data_set)
     assert TEST_CREDENTIALS["account_name"] not in str(data_set)
     assert TEST_CREDENTIALS["account_key"] not in str(data_set)
+
+
+@pytest.fixture
+def large_dataframe():
+    return pd.DataFrame({"col1": range(10000), "col2": ["value"] * 10000})
+
+
+def make_block_data_set(**kwargs):
+    return CSVBlobDataSet(
+        filepath=TEST_FILE_NAME,
+        container_name=TEST_CONTAINER_NAME,
+        credentials=TEST_CREDENTIALS,
+        transfer_args={"block_size": 1024, "max_concurrency": 4},
+        **kwargs
+    )
+
+
+def test_block_transfer(blob_service, large_dataframe):
+    """Test that large blobs are uploaded and downloaded in blocks"""
+    data_set = make_block_data_set()
+    data_set.save(large_dataframe)
+    size = len(large_dataframe.to_csv(index=False).encode("utf-8"))
+    expected_blocks = -(-size // 1024)
+    assert blob_service.count("put_block") == expected_blocks
+    assert blob_service.count("put_block_list") == 1
+    assert not blob_service.blocks
+
+    reloaded = data_set.load()
+    assert blob_service.count("get_blob_to_bytes") == expected_blocks
+    assert reloaded.equals(large_dataframe)
+
+
+def test_text_args_encoding(blob_service):
+    """Test that the encoding of the text arguments applies to the blob"""
+    data = pd.DataFrame({"name": ["b\u00e9b\u00e9"]})
+    data_set = make_block_data_set(
+        blob_to_text_args={"encoding": "latin-1"},
+        blob_from_text_args={"encoding": "latin-1", "max_connections": 2},
+    )
+    data_set.save(data)
+    assert blob_service.blobs[(TEST_CONTAINER_NAME, TEST_FILE_NAME)] == (
+        "name\nb\u00e9b\u00e9\n".encode("latin-1")
+    )
+    assert data_set.load().equals(data)
+
+
+def test_load_missing_blob(blob_service):
+    pattern = r"Failed while loading data from data set CSVBlobDataSet\(.+\)"
+    with pytest.raises(DataSetError, match=pattern):
+        make_block_data_set().load()
+
+
+def test_invalid_transfer_args(blob_service, dummy_dataframe):
+    data_set = CSVBlobDataSet(
+        filepath=TEST_FILE_NAME,
+        container_name=TEST_CONTAINER_NAME,
+        credentials=TEST_CREDENTIALS,
+        transfer_args={"max_concurrency": 0},
+    )
+    pattern = r"`max_concurrency` must be a positive integer, got 0\."
+    with pytest.raises(DataSetError, match=pattern):
+        data_set.save(dummy_dataframe)
@@ -26,8 +26,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+from Bio import SeqIO
+
 from kedro.contrib.io.bioinformatics import BioSequenceLocalDataSet
 
+ORCHID_FASTA = "tests/contrib/io/bioinformatics/ls_orchid.fasta"
+
 
 def test_save_load_sequence_file():
     ifile = "tests/contrib/io/bioinformatics/ls_orchid.fasta"
@@ -55,3 +60,65 @@ def test_save_sequence_file_to_missing_directory(tmp_path):
     reloaded = data_set.load()
     assert reloaded == []
     assert directory.is_dir()
+
+
+@pytest.fixture
+def orchid_records():
+    return list(SeqIO.parse(ORCHID_FASTA, "fasta"))
+
+
+def test_load_iterator(orchid_records):
+    """Test that the records are loaded lazily in iterator mode"""
+    data_set = BioSequenceLocalDataSet(
+        filepath=ORCHID_FASTA, load_args={"format": "fasta"}, load_mode="iterator"
+    )
+    records = data_set.load()
+    assert not isinstance(records, list)
+    assert [record.id for record in records] == [r.id for r in orchid_records]
+
+
+def test_load_batches(orchid_records):
+    """Test loading lists of ``chunksize`` records"""
+    data_set = BioSequenceLocalDataSet(
+        filepath=ORCHID_FASTA, load_args={"format": "fasta", "chunksize": 40}
+    )
+    batches = list(data_set.load())
+    assert [len(batch) for batch in batches] == [40, 40, 14]
+    assert [r.id for batch in batches for r in batch] == [r.id for r in orchid_records]
+
+
+def test_load_index(orchid_records):
+    """Test random access to records by id in index mode"""
+    data_set = BioSequenceLocalDataSet(
+        filepath=ORCHID_FASTA, load_args={"format": "fasta"}, load_mode="index"
+    )
+    index = data_set.load()
+    assert len(index) == len(orchid_records)
+    record = orchid_records[42]
+    assert str(index[record.id].seq) == str(record.seq)
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_save_generator(tmp_path, orchid_records, batched):
+    """Test saving generators of records and of lists of records"""
+    data_set = BioSequenceLocalDataSet(
+        filepath=str(tmp_path / "orchid.fasta"),
+        load_args={"format": "fasta"},
+        save_args={"format": "fasta"},
+    )
+    source = BioSequenceLocalDataSet(
+        filepath=ORCHID_FASTA,
+        load_args={"format": "fasta", "chunksize": 10}
+        if batched
+        else {"format": "fasta"},
+        load_mode="iterator",
+    )
+    data_set.save(source.load())
+    assert [r.id for r in data_set.load()] == [r.id for r in orchid_records]
+
+
+def test_invalid_load_mode():
+    """Check the error when an unknown load mode is selected"""
+    pattern = r"load_mode should be one of \['list', 'iterator', 'index'\], got all"
+    with pytest.raises(ValueError, match=pattern):
+        BioSequenceLocalDataSet(filepath=ORCHID_FASTA, load_mode="all")
@@ -32,6 +32,7 @@ from os.path import exists, join
 
 import pandas as pd
 import pytest
+from pyspark import StorageLevel
 from pyspark.sql import SparkSession
 from pyspark.sql.functions import col  # pylint: disable=no-name-in-module
 from pyspark.sql.types import IntegerType, StringType, StructField, StructType
@@ -198,8 +199,7 @@ def test_exists(file_format):
 
 
 def test_exists_raises_error(monkeypatch):
-    # exists should raise all errors except for
-    # AnalysisExceptions clearly indicating a missing file
+    # exists should raise the errors of the Spark session
     def faulty_get_spark():
         raise AnalysisException("Other Exception", [])
 
@@ -216,3 +216,90 @@ def test_cant_pickle():
 
     with pytest.raises(pickle.PicklingError):
         pickle.dumps(SparkDataSet("bob"))
+
+
+def test_load_persist(tmpdir):
+    temp_path = str(tmpdir.join("data"))
+    SparkDataSet(filepath=temp_path).save(_get_sample_spark_data_frame())
+
+    spark_df = SparkDataSet(
+        filepath=temp_path, load_args={"persist": "MEMORY_ONLY"}
+    ).load()
+    assert spark_df.is_cached
+    assert spark_df.storageLevel == StorageLevel.MEMORY_ONLY
+    spark_df.unpersist()
+
+    spark_df = SparkDataSet(filepath=temp_path, load_args={"persist": True}).load()
+    assert spark_df.storageLevel == StorageLevel.MEMORY_AND_DISK
+    spark_df.unpersist()
+
+
+def test_invalid_persist():
+    pattern = r"`persist` should be True or the name of a pyspark StorageLevel"
+    with pytest.raises(ValueError, match=pattern):
+        SparkDataSet(filepath="data", load_args={"persist": "NOWHERE"})
+
+
+@pytest.mark.parametrize(
+    "load_args,expected_partitions",
+    [
+        ({"repartition": 3}, 3),
+        ({"repartition": {"numPartitions": 2, "cols": ["name"]}}, 2),
+        ({"repartition": 3, "coalesce": 1}, 1),
+    ],
+)
+def test_load_partitions(tmpdir, load_args, expected_partitions):
+    temp_path = str(tmpdir.join("data"))
+    SparkDataSet(filepath=temp_path).save(_get_sample_spark_data_frame())
+
+    spark_df = SparkDataSet(filepath=temp_path, load_args=load_args).load()
+    assert spark_df.rdd.getNumPartitions() == expected_partitions
+    assert spark_df.count() == 4
+
+
+def test_save_coalesce(tmpdir):
+    temp_path = str(tmpdir.join("data"))
+    spark_data_set = SparkDataSet(
+        filepath=temp_path, save_args={"coalesce": 1, "compression": "none"}
+    )
+    spark_data_set.save(_get_sample_spark_data_frame().repartition(4))
+
+    parts = [f for f in listdir(temp_path) if f.startswith("part")]
+    assert len(parts) == 1
+
+
+def test_save_bucket_by(tmpdir):
+    temp_path = str(tmpdir.join("data"))
+    spark_data_set = SparkDataSet(
+        filepath=temp_path,
+        save_args={
+            "mode": "overwrite",
+            "bucketBy": {"numBuckets": 2, "cols": ["name"]},
+            "sortBy": ["age"],
+            "tableName": "test_bucketed",
+        },
+    )
+    spark_data_set.save(_get_sample_spark_data_frame())
+
+    spark = SparkSession.builder.getOrCreate()
+    assert spark.table("test_bucketed").count() == 4
+    assert SparkDataSet(filepath=temp_path).load().count() == 4
+    spark.sql("DROP TABLE test_bucketed")
+
+
+def test_bucket_by_without_table_name():
+    pattern = r"`bucketBy` requires `tableName` to be set\."
+    with pytest.raises(ValueError, match=pattern):
+        SparkDataSet(
+            filepath="data", save_args={"bucketBy": {"numBuckets": 2, "cols": ["a"]}}
+        )
+
+
+def test_exists_does_not_read(tmpdir, mocker):
+    temp_path = str(tmpdir.join("data"))
+    SparkDataSet(filepath=temp_path).save(_get_sample_spark_data_frame())
+    read = mocker.patch.object(SparkSession, "read")
+
+    assert SparkDataSet(filepath=temp_path).exists()
+    assert not SparkDataSet(filepath=str(tmpdir.join("missing"))).exists()
+    read.assert_not_called()
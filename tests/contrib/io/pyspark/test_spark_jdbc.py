@@ -26,6 +26,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import date
 from unittest import mock
 
 import pytest
@@ -134,6 +135,96 @@ def test_load_args(spark_jdbc_args_save_load):
     )
 
 
+def test_save_write_options(spark_jdbc_args_save_load):
+    spark_jdbc_args_save_load["save_args"] = {
+        "properties": {"driver": "dummy_driver"},
+        "mode": "append",
+        "batchsize": 10000,
+        "numPartitions": 4,
+    }
+    data = mock_save(spark_jdbc_args_save_load)
+    data.write.jdbc.assert_called_with(
+        "dummy_url",
+        "dummy_table",
+        mode="append",
+        properties={
+            "driver": "dummy_driver",
+            "batchsize": "10000",
+            "numPartitions": "4",
+        },
+    )
+
+
+@mock.patch("kedro.contrib.io.pyspark.spark_jdbc.SparkSession.builder.getOrCreate")
+def mock_partitioned_load(mock_get_or_create, load_args, bounds):
+    spark = mock_get_or_create.return_value
+    spark.read.jdbc.return_value.collect.return_value = [bounds]
+    data_set = SparkJDBCDataSet(
+        url="dummy_url", table="dummy_table", load_args=load_args
+    )
+    data_set.load()
+    return spark
+
+
+def test_load_partitioned_numeric():
+    # pylint: disable=no-value-for-parameter
+    spark = mock_partitioned_load(
+        load_args={"column": "id", "numPartitions": 4}, bounds=(1, 1000)
+    )
+    bounds_query = spark.read.jdbc.call_args_list[0][0][1]
+    assert "MIN(id)" in bounds_query
+    assert "MAX(id)" in bounds_query
+    assert "FROM dummy_table" in bounds_query
+    spark.read.jdbc.assert_called_with(
+        "dummy_url",
+        "dummy_table",
+        column="id",
+        lowerBound=1,
+        upperBound=1000,
+        numPartitions=4,
+    )
+
+
+def test_load_partitioned_date():
+    # pylint: disable=no-value-for-parameter
+    spark = mock_partitioned_load(
+        load_args={"column": "day", "numPartitions": 3},
+        bounds=(date(2019, 1, 1), date(2019, 1, 10)),
+    )
+    spark.read.jdbc.assert_called_with(
+        "dummy_url",
+        "dummy_table",
+        predicates=[
+            "day < '2019-01-04' OR day IS NULL",
+            "day >= '2019-01-04' AND day < '2019-01-07'",
+            "day >= '2019-01-07'",
+        ],
+    )
+
+
+def test_load_partitioned_empty_table():
+    # pylint: disable=no-value-for-parameter
+    spark = mock_partitioned_load(
+        load_args={"column": "id", "numPartitions": 4}, bounds=(None, None)
+    )
+    spark.read.jdbc.assert_called_with("dummy_url", "dummy_table")
+
+
+def test_load_explicit_bounds():
+    load_args = {"column": "id", "numPartitions": 4, "lowerBound": 0, "upperBound": 10}
+    # pylint: disable=no-value-for-parameter
+    spark = mock_partitioned_load(load_args=load_args, bounds=(1, 1000))
+    spark.read.jdbc.assert_called_once_with("dummy_url", "dummy_table", **load_args)
+
+
+@pytest.mark.parametrize("bound", ["lowerBound", "upperBound"])
+def test_single_bound(bound):
+    load_args = {"column": "id", "numPartitions": 4, bound: 10}
+    pattern = r"`lowerBound` and `upperBound` must be set together"
+    with pytest.raises(DataSetError, match=pattern):
+        SparkJDBCDataSet(url="dummy_url", table="dummy_table", load_args=load_args)
+
+
 def test_cant_pickle():
     import pickle
 
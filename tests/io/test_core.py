@@ -0,0 +1,352 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=protected-access
+
+import os
+import pickle
+import shutil
+from datetime import timedelta
+from pathlib import Path
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from kedro.io import DataSetError, FilepathVersionMixIn, S3PathVersionMixIn, Version
+from kedro.io.core import generate_current_version, select_versions_to_prune
+
+BUCKET_NAME = "test_bucket"
+FILENAME = "test.txt"
+AWS_CREDENTIALS = dict(
+    aws_access_key_id="FAKE_ACCESS_KEY", aws_secret_access_key="FAKE_SECRET_KEY"
+)
+
+
+class S3VersionedDataSet(S3PathVersionMixIn):
+    def __init__(self, client, version):
+        self._client = client
+        self._bucket_name = BUCKET_NAME
+        self._filepath = FILENAME
+        self._version = version
+
+    def load_path(self):
+        return self._get_load_path(self._client, BUCKET_NAME, FILENAME, self._version)
+
+    def save(self, data):
+        save_path = self._get_save_path(
+            self._client, BUCKET_NAME, FILENAME, self._version
+        )
+        self._client.put_object(Bucket=BUCKET_NAME, Key=save_path, Body=data)
+        return save_path
+
+    def __str__(self):
+        return "S3VersionedDataSet()"
+
+
+class LocalVersionedDataSet(FilepathVersionMixIn):
+    def __init__(self, filepath, version):
+        self._filepath = filepath
+        self._version = version
+
+    def load_path(self):
+        return self._get_load_path(self._filepath, self._version)
+
+    def save(self, data):
+        save_path = Path(self._get_save_path(self._filepath, self._version))
+        save_path.parent.mkdir(parents=True)
+        save_path.write_text(data)
+        return str(save_path)
+
+    def __str__(self):
+        return "LocalVersionedDataSet()"
+
+
+@pytest.fixture
+def local_filepath(tmp_path):
+    return str(tmp_path / FILENAME)
+
+
+@pytest.fixture
+def mocked_s3_bucket():
+    """Create a bucket for testing using moto."""
+    with mock_s3():
+        conn = boto3.client("s3", region_name="us-east-1", **AWS_CREDENTIALS)
+        conn.create_bucket(Bucket=BUCKET_NAME)
+        yield conn
+
+
+@pytest.fixture
+def list_spy(mocker):
+    return mocker.spy(S3PathVersionMixIn, "_list_objects")
+
+
+def _versioned_key(version):
+    return "{0}/{1}/{0}".format(FILENAME, version)
+
+
+def _make_local_version(filepath, version, create_file=True):
+    path = Path(filepath) / version / FILENAME
+    path.parent.mkdir(parents=True)
+    if create_file:
+        path.write_text("data")
+    return str(path)
+
+
+class TestSelectVersionsToPrune:
+    VERSIONS = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 6)]
+
+    def test_keep_last(self):
+        pruned = select_versions_to_prune(self.VERSIONS, keep_last=3)
+        assert pruned == ["2019-01-02T00.00.00.000Z", "2019-01-01T00.00.00.000Z"]
+
+    def test_max_age(self):
+        recent = generate_current_version()
+        pruned = select_versions_to_prune(
+            self.VERSIONS + [recent, "not_a_timestamp"], max_age=timedelta(days=1)
+        )
+        assert pruned == sorted(self.VERSIONS, reverse=True)
+
+    def test_combined_and_pinned(self):
+        pruned = select_versions_to_prune(
+            self.VERSIONS,
+            keep_last=2,
+            max_age=timedelta(days=1),
+            pinned=["2019-01-01T00.00.00.000Z"],
+        )
+        assert pruned == ["2019-01-03T00.00.00.000Z", "2019-01-02T00.00.00.000Z"]
+
+    def test_latest_always_kept(self):
+        pruned = select_versions_to_prune(self.VERSIONS, max_age=timedelta(days=1))
+        assert pruned == sorted(self.VERSIONS[:-1], reverse=True)
+
+    def test_non_versions_ignored(self):
+        """Names which are not timestamps sort after them, but must neither
+        count as the most recent versions nor be deleted."""
+        pruned = select_versions_to_prune(self.VERSIONS + ["backup"], keep_last=1)
+        assert pruned == sorted(self.VERSIONS[:-1], reverse=True)
+
+    @pytest.mark.parametrize(
+        "kwargs,pattern",
+        [
+            ({}, "Either `keep_last` or `max_age` must be specified"),
+            ({"keep_last": 0}, "`keep_last` must be a positive integer"),
+            ({"max_age": timedelta(0)}, "`max_age` must be a positive duration"),
+            ({"max_age": timedelta(days=-1)}, "`max_age` must be a positive duration"),
+        ],
+    )
+    def test_invalid_policy(self, kwargs, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            select_versions_to_prune(self.VERSIONS, **kwargs)
+
+
+class TestFilepathVersionMixIn:
+    def test_no_versions(self, local_filepath):
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        with pytest.raises(DataSetError, match="Did not find any versions"):
+            data_set.load_path()
+
+    def test_latest_complete_version(self, local_filepath):
+        """Check that version directories without the file are skipped."""
+        expected = _make_local_version(local_filepath, "2019-01-01T00.00.00.000Z")
+        _make_local_version(local_filepath, "2019-01-02T00.00.00.000Z", False)
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        assert data_set.load_path() == expected
+
+    def test_latest_version_cached(self, local_filepath, mocker):
+        expected = _make_local_version(local_filepath, "2019-01-01T00.00.00.000Z")
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        scandir = mocker.spy(os, "scandir")
+
+        for _ in range(3):
+            assert data_set.load_path() == expected
+        assert scandir.call_count == 1
+
+    def test_cached_version_deleted(self, local_filepath):
+        """Check that the versions are scanned again when the cached
+        latest version is deleted by someone else."""
+        expected = _make_local_version(local_filepath, "2019-01-01T00.00.00.000Z")
+        deleted = _make_local_version(local_filepath, "2019-01-02T00.00.00.000Z")
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        assert data_set.load_path() == deleted
+
+        shutil.rmtree(str(Path(deleted).parent))
+        assert data_set.load_path() == expected
+        shutil.rmtree(str(Path(expected).parent))
+        with pytest.raises(DataSetError, match="Did not find any versions"):
+            data_set.load_path()
+
+    def test_save_refreshes_cache(self, local_filepath):
+        _make_local_version(local_filepath, "2019-01-01T00.00.00.000Z")
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        data_set.load_path()
+
+        save_path = data_set.save("new data")
+        assert data_set.load_path() == save_path
+
+    def test_refresh_keeps_latest(self, local_filepath):
+        """Check that saving a version older than the cached one does
+        not change the version loaded."""
+        expected = _make_local_version(local_filepath, "2019-01-02T00.00.00.000Z")
+        data_set = LocalVersionedDataSet(
+            local_filepath, Version(None, "2019-01-01T00.00.00.000Z")
+        )
+        assert data_set.load_path() == expected
+        data_set.save("old data")
+        assert data_set.load_path() == expected
+
+    def test_prune_versions(self, local_filepath):
+        versions = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 5)]
+        for version in versions:
+            _make_local_version(local_filepath, version)
+        (Path(local_filepath) / "incomplete").mkdir()
+        data_set = LocalVersionedDataSet(local_filepath, Version(versions[0], None))
+        assert data_set.load_path()
+
+        pruned = data_set.prune_versions(keep_last=2)
+
+        assert pruned == [versions[1]]
+        assert sorted(data_set._list_versions()) == [versions[0]] + versions[2:]
+        assert (Path(local_filepath) / "incomplete").is_dir()
+        assert not data_set._version_cache
+
+    def test_prune_stray_directory(self, local_filepath):
+        versions = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 4)]
+        for version in versions + ["backup"]:
+            _make_local_version(local_filepath, version)
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+
+        pruned = data_set.prune_versions(keep_last=1)
+
+        assert pruned == versions[1::-1]
+        assert (Path(local_filepath) / versions[2]).is_dir()
+        assert (Path(local_filepath) / "backup").is_dir()
+
+    def test_prune_no_versions(self, local_filepath):
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        assert data_set.prune_versions(keep_last=1) == []
+
+    def test_prune_invalid_policy(self, local_filepath):
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            data_set.prune_versions(keep_last=0)
+
+    def test_prune_fails(self, local_filepath, mocker):
+        versions = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 3)]
+        for version in versions:
+            _make_local_version(local_filepath, version)
+        mocker.patch("shutil.rmtree", side_effect=OSError("Permission denied"))
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        pattern = r"Failed while pruning versions of data set .*\nPermission denied"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.prune_versions(keep_last=1)
+
+    def test_prune_unversioned(self, local_filepath):
+        data_set = LocalVersionedDataSet(local_filepath, None)
+        with pytest.raises(DataSetError, match="is not versioned"):
+            data_set.prune_versions(keep_last=1)
+
+    def test_cache_not_pickled(self, local_filepath):
+        _make_local_version(local_filepath, "2019-01-01T00.00.00.000Z")
+        data_set = LocalVersionedDataSet(local_filepath, Version(None, None))
+        data_set.load_path()
+        assert data_set._version_cache
+        assert not pickle.loads(pickle.dumps(data_set))._version_cache
+
+
+class TestS3PathVersionMixIn:
+    def test_no_versions(self, mocked_s3_bucket):
+        data_set = S3VersionedDataSet(mocked_s3_bucket, Version(None, None))
+        with pytest.raises(DataSetError, match="Did not find any versions"):
+            data_set.load_path()
+
+    def test_latest_version_cached(self, mocked_s3_bucket, list_spy):
+        for version in ["2019-01-01T00.00.00.000Z", "2019-01-02T00.00.00.000Z"]:
+            mocked_s3_bucket.put_object(
+                Bucket=BUCKET_NAME, Key=_versioned_key(version), Body=b"data"
+            )
+        data_set = S3VersionedDataSet(mocked_s3_bucket, Version(None, None))
+
+        for _ in range(3):
+            assert data_set.load_path() == _versioned_key("2019-01-02T00.00.00.000Z")
+        assert list_spy.call_count == 1
+
+    def test_save_refreshes_cache(self, mocked_s3_bucket, list_spy):
+        old_key = _versioned_key("2019-01-01T00.00.00.000Z")
+        mocked_s3_bucket.put_object(Bucket=BUCKET_NAME, Key=old_key, Body=b"data")
+        data_set = S3VersionedDataSet(mocked_s3_bucket, Version(None, None))
+        assert data_set.load_path() == old_key
+
+        save_path = data_set.save(b"new data")
+        assert data_set.load_path() == save_path
+
+        # the refresh only lists the keys after the previously cached one
+        assert list_spy.call_args_list[-1][0][-1] == old_key
+
+    def test_refresh_keeps_latest(self, mocked_s3_bucket):
+        """Check that saving a version older than the cached one does
+        not change the version loaded."""
+        new_key = _versioned_key("2019-01-02T00.00.00.000Z")
+        mocked_s3_bucket.put_object(Bucket=BUCKET_NAME, Key=new_key, Body=b"data")
+        data_set = S3VersionedDataSet(
+            mocked_s3_bucket, Version(None, "2019-01-01T00.00.00.000Z")
+        )
+        assert data_set.load_path() == new_key
+        data_set.save(b"old data")
+        assert data_set.load_path() == new_key
+
+    def test_cache_not_pickled(self, mocked_s3_bucket):
+        key = _versioned_key("2019-01-01T00.00.00.000Z")
+        mocked_s3_bucket.put_object(Bucket=BUCKET_NAME, Key=key, Body=b"data")
+        data_set = S3VersionedDataSet(None, Version(None, None))
+        data_set._client = mocked_s3_bucket
+        data_set.load_path()
+        assert data_set._version_cache
+
+        data_set._client = None
+        assert not pickle.loads(pickle.dumps(data_set))._version_cache
+
+    def test_prune_versions(self, mocked_s3_bucket, mocker):
+        versions = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 6)]
+        for version in versions:
+            mocked_s3_bucket.put_object(
+                Bucket=BUCKET_NAME, Key=_versioned_key(version), Body=b"data"
+            )
+        mocked_s3_bucket.put_object(
+            Bucket=BUCKET_NAME, Key=_versioned_key("2018") + ".bak", Body=b"data"
+        )
+        mocker.patch("kedro.io.core.MAX_DELETE_BATCH_SIZE", 2)
+        delete_spy = mocker.spy(mocked_s3_bucket, "delete_objects")
+        data_set = S3VersionedDataSet(mocked_s3_bucket, Version(None, None))
+
+        pruned = data_set.prune_versions(keep_last=2)
+
+        assert pruned == versions[2::-1]
+        assert delete_spy.call_count == 2
+        assert sorted(data_set._list_versions()) == versions[3:]
+        assert data_set.load_path() == _versioned_key(versions[-1])
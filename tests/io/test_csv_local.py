@@ -68,6 +68,18 @@ class TestCSVLocalDataSet:
         csv_data_set.save(dummy_dataframe)
         assert csv_data_set.exists()
 
+    def test_save_chunks(self, csv_data_set, dummy_dataframe):
+        """Test that chunks saved from an iterable are reloaded as one
+        data frame, with a single header."""
+        chunks = (dummy_dataframe.iloc[[idx]] for idx in range(len(dummy_dataframe)))
+        csv_data_set.save(chunks)
+        assert_frame_equal(csv_data_set.load(), dummy_dataframe)
+
+    def test_save_no_chunks(self, csv_data_set):
+        """Test that saving an empty iterable creates an empty file."""
+        csv_data_set.save(iter([]))
+        assert csv_data_set.exists()
+
 
 class TestCSVLocalDataSetVersioned:
     def test_save_and_load(
@@ -232,6 +232,57 @@ class TestCSVS3DataSet:
         ).load()
         assert mock.call_args_list[0][1] == {"custom": 42}
 
+    @pytest.mark.usefixtures("mocked_s3_bucket")
+    def test_multipart_save_and_load(self):
+        """Test that a file spanning several transfer parts is uploaded
+        and downloaded correctly."""
+        data = pd.DataFrame({"col1": range(1000000)})
+        data_set = CSVS3DataSet(
+            filepath=FILENAME,
+            bucket_name=BUCKET_NAME,
+            credentials=AWS_CREDENTIALS,
+            transfer_args={"part_size": 5 * 1024 ** 2, "max_concurrency": 2},
+        )
+        data_set.save(data)
+        assert_frame_equal(data_set.load(), data)
+
+    @pytest.mark.usefixtures("mocked_s3_object")
+    def test_save_error_aborts_upload(self, mocker, s3_data_set, dummy_dataframe):
+        """Test that a save failing after some parts were uploaded does not
+        complete the upload and leaves the object unchanged."""
+
+        def _to_csv(data, text_file, **kwargs):
+            text_file.write("x" * 11 * 1024 ** 2)
+            raise ValueError("Failed to write csv")
+
+        mocker.patch.object(pd.DataFrame, "to_csv", _to_csv)
+        pattern = r"Failed to write csv"
+        with pytest.raises(DataSetError, match=pattern):
+            s3_data_set.save(dummy_dataframe)
+        mocker.stopall()
+        assert_frame_equal(s3_data_set.load(), dummy_dataframe)
+
+    def test_transfer_args(self):
+        """Test overriding the default transfer arguments."""
+        data_set = CSVS3DataSet(
+            filepath=FILENAME,
+            bucket_name=BUCKET_NAME,
+            transfer_args={"max_concurrency": 4},
+        )
+        assert data_set._transfer_args["max_concurrency"] == 4
+        assert data_set._transfer_args["part_size"] == 8 * 1024 ** 2
+
+    def test_unknown_transfer_args(self):
+        """Check the error when creating the data set with an unknown
+        transfer argument."""
+        pattern = r"Unknown `transfer_args` \['concurrency'\]"
+        with pytest.raises(DataSetError, match=pattern):
+            CSVS3DataSet(
+                filepath=FILENAME,
+                bucket_name=BUCKET_NAME,
+                transfer_args={"concurrency": 4},
+            )
+
 
 @pytest.mark.usefixtures("mocked_s3_bucket")
 class TestCSVS3DataSetVersioned:
@@ -41,6 +41,8 @@ from kedro.io import (
     LambdaDataSet,
     MemoryDataSet,
     ParquetLocalDataSet,
+    TextLocalDataSet,
+    Version,
 )
 from kedro.io.core import generate_current_version
 
@@ -211,6 +213,39 @@ class TestDataCatalog:
         with pytest.raises(DataSetError, match=pattern):
             data_catalog.exists("wrong_key")
 
+    def test_release(self, multi_catalog, mocker):
+        """Test that releasing the catalog releases every data set"""
+        releases = [
+            mocker.patch.object(data_set, "release")
+            for data_set in multi_catalog._data_sets.values()
+        ]
+        multi_catalog.release()
+        for release in releases:
+            release.assert_called_once_with()
+
+    def test_release_error(self, data_catalog, mocker):
+        """Check the error when a data set fails to release its resources"""
+        data_set = data_catalog._data_sets["test"]
+        mocker.patch.object(data_set, "_release", side_effect=OSError("Busy"))
+        pattern = r"Failed while releasing data set .*\nBusy"
+        with pytest.raises(DataSetError, match=pattern):
+            data_catalog.release()
+
+    def test_release_error_all_released(self, multi_catalog, mocker):
+        """Check that every data set is released even if some fail to"""
+        releases = [
+            mocker.patch.object(
+                data_set, "_release", side_effect=OSError("Busy {}".format(name))
+            )
+            for name, data_set in multi_catalog._data_sets.items()
+        ]
+        with pytest.raises(DataSetError) as exc_info:
+            multi_catalog.release()
+        assert "Busy abc" in str(exc_info.value)
+        assert "Busy xyz" in str(exc_info.value)
+        for release in releases:
+            release.assert_called_once_with()
+
     def test_multi_catalog_list(self, multi_catalog):
         """Test data catalog which contains multiple data sets"""
         entries = multi_catalog.list()
@@ -337,3 +372,41 @@ class TestDataCatalogVersioned:
             "configuration since it is a reserved word and cannot be "
             "directly specified" in log_record.message
         )
+
+
+class TestDataCatalogPruneVersions:
+    @pytest.fixture
+    def versioned_catalog(self, tmp_path):
+        filepath = str(tmp_path / "test.txt")
+        versions = ["2019-01-0{}T00.00.00.000Z".format(day) for day in range(1, 5)]
+        for version in versions:
+            TextLocalDataSet(filepath, version=Version(None, version)).save("data")
+        return DataCatalog(
+            {
+                "versioned": TextLocalDataSet(filepath, version=Version(None, None)),
+                "unversioned": TextLocalDataSet(str(tmp_path / "other.txt")),
+                "memory": MemoryDataSet(data=42),
+            }
+        )
+
+    def test_prune(self, versioned_catalog):
+        pruned = versioned_catalog.prune_versions(
+            keep_last=2, load_versions={"versioned": "2019-01-01T00.00.00.000Z"}
+        )
+        assert pruned == {"versioned": ["2019-01-02T00.00.00.000Z"]}
+        assert versioned_catalog.load("versioned") == "data"
+        assert versioned_catalog.prune_versions(keep_last=2) == {
+            "versioned": ["2019-01-01T00.00.00.000Z"]
+        }
+
+    def test_dry_run(self, versioned_catalog):
+        expected = {
+            "versioned": ["2019-01-02T00.00.00.000Z", "2019-01-01T00.00.00.000Z"]
+        }
+        pruned = versioned_catalog.prune_versions(keep_last=2, dry_run=True)
+        assert pruned == expected
+        assert versioned_catalog.prune_versions(keep_last=2, dry_run=True) == expected
+
+    def test_no_policy(self, versioned_catalog):
+        with pytest.raises(ValueError, match="Either `keep_last` or `max_age`"):
+            versioned_catalog.prune_versions()
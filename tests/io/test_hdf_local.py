@@ -26,6 +26,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
 import pytest
 from pandas.util.testing import assert_frame_equal
 
@@ -89,6 +90,90 @@ class TestHDFLocalDataSet:
         assert_frame_equal(reloaded_df, dummy_dataframe.T)
 
 
+@pytest.fixture
+def daily_slices():
+    return [
+        pd.DataFrame(
+            {"day": [day] * 3, "value": [day * 10 + i for i in range(3)]},
+            index=range(day * 3, day * 3 + 3),
+        )
+        for day in range(3)
+    ]
+
+
+@pytest.fixture
+def appendable_hdf_data_set(filepath_hdf):
+    return HDFLocalDataSet(
+        filepath=filepath_hdf,
+        key="test_hdf",
+        save_args=dict(append=True, data_columns=["day"]),
+    )
+
+
+class TestHDFLocalDataSetTable:
+    def test_append(self, appendable_hdf_data_set, daily_slices):
+        """Test that saves append to the existing table."""
+        for daily_slice in daily_slices:
+            appendable_hdf_data_set.save(daily_slice)
+        assert_frame_equal(appendable_hdf_data_set.load(), pd.concat(daily_slices))
+
+    def test_where_and_columns(
+        self, filepath_hdf, appendable_hdf_data_set, daily_slices
+    ):
+        """Test loading selected rows and columns of a table."""
+        for daily_slice in daily_slices:
+            appendable_hdf_data_set.save(daily_slice)
+
+        data_set = HDFLocalDataSet(
+            filepath=filepath_hdf,
+            key="test_hdf",
+            load_args=dict(where="day >= 1", columns=["value"]),
+        )
+        expected = pd.concat(daily_slices[1:])[["value"]]
+        assert_frame_equal(data_set.load(), expected)
+
+    def test_chunked_load(self, filepath_hdf, appendable_hdf_data_set, daily_slices):
+        """Test that setting ``chunksize`` loads an iterator of data frames
+        and closes the file once it is exhausted."""
+        appendable_hdf_data_set.save(pd.concat(daily_slices))
+
+        data_set = HDFLocalDataSet(
+            filepath=filepath_hdf,
+            key="test_hdf",
+            load_args=dict(chunksize=4, where="day < 2"),
+        )
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        assert_frame_equal(pd.concat(chunks), pd.concat(daily_slices[:2]))
+
+        # the file is closed and can be written to again
+        appendable_hdf_data_set.save(daily_slices[0])
+        assert len(appendable_hdf_data_set.load()) == 12
+
+    def test_chunked_load_missing_key(
+        self, filepath_hdf, hdf_data_set, dummy_dataframe
+    ):
+        """Check the error when loading chunks of a missing key."""
+        hdf_data_set.save(dummy_dataframe)
+        data_set = HDFLocalDataSet(
+            filepath=filepath_hdf, key="missing", load_args=dict(chunksize=2)
+        )
+        pattern = r"Failed while loading data from data set HDFLocalDataSet\(.+\)"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.load()
+
+    def test_append_versioned(self, filepath_hdf):
+        """Check the error when appending to a versioned data set."""
+        pattern = r"Appending is not supported for versioned `HDFLocalDataSet`"
+        with pytest.raises(DataSetError, match=pattern):
+            HDFLocalDataSet(
+                filepath=filepath_hdf,
+                key="test_hdf",
+                save_args=dict(append=True),
+                version=Version(None, None),
+            )
+
+
 class TestHDFLocalDataSetVersioned:
     def test_save_and_load(self, versioned_hdf_data_set, dummy_dataframe):
         """Test that saved and reloaded data matches the original one for
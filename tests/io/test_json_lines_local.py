@@ -0,0 +1,192 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from importlib import reload
+
+import pandas as pd
+import pytest
+from pandas.util.testing import assert_frame_equal
+
+import kedro.io.json_lines_local
+from kedro.io import DataSetError, JSONLinesLocalDataSet
+from kedro.io.core import Version
+
+RECORDS = [{"id": i, "value": "value_{}".format(i)} for i in range(10)]
+
+
+@pytest.fixture
+def filepath_jsonl(tmp_path):
+    return str(tmp_path / "test.jsonl")
+
+
+@pytest.fixture(params=["json", "orjson"])
+def jsonl_data_set(filepath_jsonl, request):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    return JSONLinesLocalDataSet(
+        filepath=filepath_jsonl, backend=request.param, save_args=dict(buffer_size=3),
+    )
+
+
+@pytest.fixture
+def versioned_jsonl_data_set(filepath_jsonl, load_version, save_version):
+    return JSONLinesLocalDataSet(
+        filepath=filepath_jsonl, version=Version(load_version, save_version)
+    )
+
+
+def records_generator():
+    yield from RECORDS
+
+
+class TestJSONLinesLocalDataSet:
+    def test_save_and_load(self, jsonl_data_set):
+        """Test saving records from a generator and reloading them lazily."""
+        jsonl_data_set.save(records_generator())
+        reloaded = jsonl_data_set.load()
+        assert not isinstance(reloaded, list)
+        assert list(reloaded) == RECORDS
+
+    def test_buffered_writes(self, mocker, jsonl_data_set):
+        """Test that records are encoded in batches of ``buffer_size``."""
+        encode = mocker.spy(jsonl_data_set, "_encode_records")
+        jsonl_data_set.save(records_generator())
+        assert [len(call[0][0]) for call in encode.call_args_list] == [3, 3, 3, 1]
+
+    def test_save_data_frames(self, jsonl_data_set):
+        """Test saving a data frame and an iterable of data frames."""
+        data = pd.DataFrame(RECORDS)
+        jsonl_data_set.save(data)
+        assert list(jsonl_data_set.load()) == RECORDS
+
+        jsonl_data_set.save(data.iloc[i : i + 4] for i in range(0, 10, 4))
+        assert list(jsonl_data_set.load()) == RECORDS
+
+    def test_load_chunks(self, filepath_jsonl, jsonl_data_set):
+        """Test loading data frames of ``chunksize`` records."""
+        jsonl_data_set.save(RECORDS)
+        chunked_data_set = JSONLinesLocalDataSet(
+            filepath=filepath_jsonl, load_args=dict(chunksize=4)
+        )
+        chunks = list(chunked_data_set.load())
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert_frame_equal(pd.concat(chunks, ignore_index=True), pd.DataFrame(RECORDS))
+
+    def test_skip_blank_lines(self, filepath_jsonl, jsonl_data_set):
+        """Test that blank lines are ignored when loading."""
+        with open(filepath_jsonl, "w") as local_file:
+            local_file.write('{"id": 1}\n\n{"id": 2}\n')
+        assert list(jsonl_data_set.load()) == [{"id": 1}, {"id": 2}]
+
+    def test_load_missing_file(self, jsonl_data_set):
+        """Check the error when trying to load missing file."""
+        pattern = r"No such file: `.+`"
+        with pytest.raises(DataSetError, match=pattern):
+            jsonl_data_set.load()
+
+    def test_file_opened_lazily(self, mocker, jsonl_data_set):
+        """Test that the file is only opened once the records are iterated,
+        so that it is not left open by an iterator which is never used."""
+        jsonl_data_set.save(RECORDS)
+        mocked_open = mocker.patch(
+            "kedro.io.json_lines_local.open", create=True, side_effect=open
+        )
+        records = jsonl_data_set.load()
+        mocked_open.assert_not_called()
+        assert list(records) == RECORDS
+        mocked_open.assert_called_once()
+
+    def test_exists(self, jsonl_data_set):
+        """Test `exists` method invocation."""
+        assert not jsonl_data_set.exists()
+
+        jsonl_data_set.save(RECORDS)
+        assert jsonl_data_set.exists()
+
+    def test_auto_backend(self, mocker, filepath_jsonl):
+        """Test that the json library is used when orjson is not installed."""
+        mocker.patch.object(kedro.io.json_lines_local, "orjson", None)
+        data_set = JSONLinesLocalDataSet(filepath=filepath_jsonl)
+        data_set.save(RECORDS)
+        assert list(data_set.load()) == RECORDS
+
+    def test_invalid_backend(self, filepath_jsonl):
+        """Check the error when an unknown backend is selected."""
+        pattern = r"backend should be one of \['auto', 'json', 'orjson'\], got invalid"
+        with pytest.raises(ValueError, match=pattern):
+            JSONLinesLocalDataSet(filepath=filepath_jsonl, backend="invalid")
+
+    def test_orjson_not_installed(self, mocker, filepath_jsonl):
+        """Check the error if 'orjson' module is not installed."""
+        mocker.patch.dict("sys.modules", orjson=None)
+        reload(kedro.io.json_lines_local)
+        try:
+            # creating a json-based data set should be fine
+            JSONLinesLocalDataSet(filepath=filepath_jsonl, backend="json")
+
+            # creating an orjson-based data set should fail
+            pattern = (
+                r"selected backend \'orjson\' could not be imported\. "
+                r"Make sure it is installed\."
+            )
+            with pytest.raises(ImportError, match=pattern):
+                JSONLinesLocalDataSet(filepath=filepath_jsonl, backend="orjson")
+        finally:
+            mocker.stopall()
+            reload(kedro.io.json_lines_local)
+
+
+class TestJSONLinesLocalDataSetVersioned:
+    def test_save_and_load(self, versioned_jsonl_data_set):
+        """Test that saved and reloaded data matches the original one for
+        the versioned data set."""
+        versioned_jsonl_data_set.save(records_generator())
+        assert list(versioned_jsonl_data_set.load()) == RECORDS
+
+    def test_exists(self, versioned_jsonl_data_set):
+        """Test `exists` method invocation for versioned data set."""
+        assert not versioned_jsonl_data_set.exists()
+
+        versioned_jsonl_data_set.save(RECORDS)
+        assert versioned_jsonl_data_set.exists()
+
+    def test_no_versions(self, versioned_jsonl_data_set):
+        """Check the error if no versions are available for load."""
+        pattern = r"Did not find any versions for JSONLinesLocalDataSet\(.+\)"
+        with pytest.raises(DataSetError, match=pattern):
+            versioned_jsonl_data_set.load()
+
+    def test_prevent_overwrite(self, versioned_jsonl_data_set):
+        """Check the error when attempting to override the data set if the
+        corresponding file for a given save version already exists."""
+        versioned_jsonl_data_set.save(RECORDS)
+        pattern = (
+            r"Save path \`.+\` for JSONLinesLocalDataSet\(.+\) must "
+            r"not exist if versioning is enabled\."
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            versioned_jsonl_data_set.save(RECORDS)
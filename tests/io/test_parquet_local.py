@@ -29,6 +29,7 @@ from random import randint
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 from pandas.util.testing import assert_frame_equal
 
@@ -124,6 +125,51 @@ class TestParquetLocalDataSet:
         loaded_data = parquet_data_set.load()
         assert_frame_equal(loaded_data, input_data)
 
+    @pytest.mark.parametrize(
+        "parquet_data_set", [dict(save_args={"compression": "GZIP"})], indirect=True
+    )
+    def test_save_chunks(self, parquet_data_set, input_data):
+        """Test that chunks saved from an iterable are written as row groups
+        and reloaded as one data frame."""
+        chunks = (input_data.iloc[idx : idx + 2] for idx in range(0, 4, 2))
+        parquet_data_set.save(chunks)
+        assert pq.ParquetFile(parquet_data_set._filepath).num_row_groups == 2
+        assert_frame_equal(parquet_data_set.load(), input_data)
+
+    def test_save_no_chunks(self, parquet_data_set):
+        """Test that saving an empty iterable of chunks writes an empty
+        data frame."""
+        parquet_data_set.save(iter([]))
+        assert parquet_data_set.load().empty
+
+    def test_save_chunks_cast(self, parquet_data_set):
+        """Test that chunks are cast to the schema of the first chunk."""
+        chunks = [pd.DataFrame({"col": [0.5]}), pd.DataFrame({"col": [1]})]
+        parquet_data_set.save(iter(chunks))
+        reloaded = parquet_data_set.load()
+        assert reloaded["col"].tolist() == [0.5, 1.0]
+        assert reloaded["col"].dtype == "float64"
+
+    def test_save_chunks_schema_mismatch(self, parquet_data_set):
+        """Check the error when a chunk cannot be cast to the schema of the
+        first chunk."""
+        chunks = [pd.DataFrame({"col": [1]}), pd.DataFrame({"other": ["a"]})]
+        pattern = (
+            r"Chunk 1 does not match the schema of the first chunk "
+            r"\(col: int64\) and cannot be cast to it"
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            parquet_data_set.save(iter(chunks))
+
+    @pytest.mark.parametrize(
+        "parquet_data_set", [dict(engine="fastparquet")], indirect=True
+    )
+    def test_save_chunks_fastparquet(self, parquet_data_set, input_data):
+        """Check the error when saving chunks with the `fastparquet` engine."""
+        pattern = r"Saving data frames in chunks requires the `pyarrow` engine"
+        with pytest.raises(DataSetError, match=pattern):
+            parquet_data_set.save(iter([input_data]))
+
     def test_save_none(self, parquet_data_set):
         """Check the error when trying to save None."""
         pattern = r"Saving `None` to a `DataSet` is not allowed"
@@ -174,6 +174,40 @@ class TestPickleS3DataSet:
     def test_serializable(self, s3_data_set):
         ForkingPickler.dumps(s3_data_set)
 
+    def test_unknown_transfer_args(self):
+        """Check the error when creating the data set with an unknown
+        transfer argument."""
+        pattern = r"Unknown `transfer_args` \['concurrency'\]"
+        with pytest.raises(DataSetError, match=pattern):
+            PickleS3DataSet(
+                filepath=FILENAME,
+                bucket_name=BUCKET_NAME,
+                transfer_args={"concurrency": 4},
+            )
+
+    @pytest.mark.usefixtures("mocked_s3_bucket")
+    def test_multipart_save_and_load(self):
+        """Test that an object spanning several transfer parts is uploaded
+        and downloaded correctly."""
+        data = {"key": b"x" * 11 * 1024 ** 2}
+        s3_data_set = PickleS3DataSet(
+            filepath=FILENAME,
+            bucket_name=BUCKET_NAME,
+            credentials=AWS_CREDENTIALS,
+            transfer_args={"part_size": 5 * 1024 ** 2, "max_concurrency": 2},
+        )
+        s3_data_set.save(data)
+        assert s3_data_set.load() == data
+
+    @pytest.mark.usefixtures("mocked_s3_object")
+    def test_save_error_aborts_upload(self, s3_data_set):
+        """Test that a save failing after some parts were uploaded does not
+        complete the upload and leaves the object unchanged."""
+        data = {"key": b"x" * 11 * 1024 ** 2, "func": lambda: None}
+        with pytest.raises(DataSetError, match=r"pickle"):
+            s3_data_set.save(data)
+        assert s3_data_set.load() == DUMMY_PICKABLE_OBJECT
+
 
 @pytest.mark.usefixtures("mocked_s3_bucket")
 class TestPickleS3DataSetVersioned:
@@ -0,0 +1,200 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=no-member,protected-access
+
+from array import array
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from kedro.io import DataSetError
+from kedro.io.s3_transfer import (
+    MIN_PART_SIZE,
+    S3MultipartWriter,
+    get_transfer_args,
+    read_s3_object,
+)
+
+BUCKET_NAME = "test_bucket"
+KEY = "test.bin"
+AWS_CREDENTIALS = dict(
+    aws_access_key_id="FAKE_ACCESS_KEY", aws_secret_access_key="FAKE_SECRET_KEY"
+)
+TRANSFER_ARGS = dict(part_size=MIN_PART_SIZE, max_concurrency=2)
+
+
+@pytest.fixture
+def mocked_s3_bucket():
+    """Create a bucket for testing using moto."""
+    with mock_s3():
+        conn = boto3.client("s3", region_name="us-east-1", **AWS_CREDENTIALS)
+        conn.create_bucket(Bucket=BUCKET_NAME)
+        yield conn
+
+
+@pytest.fixture
+def large_content():
+    """Content spanning two full parts and a partial last one."""
+    return bytes(range(256)) * (MIN_PART_SIZE * 2 // 256) + b"tail"
+
+
+def _list_keys(client):
+    return [
+        obj["Key"]
+        for obj in client.list_objects_v2(Bucket=BUCKET_NAME).get("Contents", [])
+    ]
+
+
+class TestS3MultipartWriter:
+    def test_small_content(self, mocked_s3_bucket, mocker):
+        """Content smaller than a part is uploaded with a single request."""
+        spy = mocker.spy(mocked_s3_bucket, "create_multipart_upload")
+        with S3MultipartWriter(mocked_s3_bucket, BUCKET_NAME, KEY) as s3_file:
+            s3_file.write(b"small")
+
+        body = mocked_s3_bucket.get_object(Bucket=BUCKET_NAME, Key=KEY)["Body"]
+        assert body.read() == b"small"
+        assert spy.call_count == 0
+
+    def test_multipart_upload(self, mocked_s3_bucket, large_content, mocker):
+        spy = mocker.spy(mocked_s3_bucket, "upload_part")
+        with S3MultipartWriter(
+            mocked_s3_bucket, BUCKET_NAME, KEY, **TRANSFER_ARGS
+        ) as s3_file:
+            for start in range(0, len(large_content), 1024 ** 2):
+                s3_file.write(large_content[start : start + 1024 ** 2])
+
+        body = mocked_s3_bucket.get_object(Bucket=BUCKET_NAME, Key=KEY)["Body"]
+        assert body.read() == large_content
+        assert spy.call_count == 3
+
+    def test_single_large_write(self, mocked_s3_bucket, large_content, mocker):
+        """Check that a write larger than a part is split without buffering
+        all of it."""
+        spy = mocker.spy(mocked_s3_bucket, "upload_part")
+        with S3MultipartWriter(
+            mocked_s3_bucket, BUCKET_NAME, KEY, **TRANSFER_ARGS
+        ) as s3_file:
+            s3_file.write(b"head")
+            assert s3_file.write(memoryview(large_content)) == len(large_content)
+            assert len(s3_file._buffer) < MIN_PART_SIZE
+
+        body = mocked_s3_bucket.get_object(Bucket=BUCKET_NAME, Key=KEY)["Body"]
+        assert body.read() == b"head" + large_content
+        part_sizes = sorted(len(call[1]["Body"]) for call in spy.call_args_list)
+        assert part_sizes == [8, MIN_PART_SIZE, MIN_PART_SIZE]
+
+    def test_write_typed_buffer(self, mocked_s3_bucket):
+        content = array("i", range(10))
+        with S3MultipartWriter(mocked_s3_bucket, BUCKET_NAME, KEY) as s3_file:
+            assert s3_file.write(content) == len(content.tobytes())
+
+        body = mocked_s3_bucket.get_object(Bucket=BUCKET_NAME, Key=KEY)["Body"]
+        assert body.read() == content.tobytes()
+
+    def test_abort_on_error(self, mocked_s3_bucket, large_content):
+        """Check that nothing is written if an error is raised while writing."""
+        with pytest.raises(RuntimeError, match="boom"):
+            with S3MultipartWriter(
+                mocked_s3_bucket, BUCKET_NAME, KEY, **TRANSFER_ARGS
+            ) as s3_file:
+                s3_file.write(large_content)
+                raise RuntimeError("boom")
+
+        assert _list_keys(mocked_s3_bucket) == []
+        uploads = mocked_s3_bucket.list_multipart_uploads(Bucket=BUCKET_NAME)
+        assert not uploads.get("Uploads")
+
+    def test_write_after_close(self, mocked_s3_bucket):
+        s3_file = S3MultipartWriter(mocked_s3_bucket, BUCKET_NAME, KEY)
+        s3_file.close()
+        with pytest.raises(ValueError, match="closed file"):
+            s3_file.write(b"data")
+
+    @pytest.mark.parametrize(
+        "transfer_args,pattern",
+        [
+            (dict(part_size=1024), "`part_size` must be at least"),
+            (dict(max_concurrency=0), "`max_concurrency` must be a positive"),
+        ],
+    )
+    def test_invalid_transfer_args(self, transfer_args, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            S3MultipartWriter(None, BUCKET_NAME, KEY, **transfer_args)
+
+
+class TestReadS3Object:
+    def test_small_object(self, mocked_s3_bucket):
+        mocked_s3_bucket.put_object(Bucket=BUCKET_NAME, Key=KEY, Body=b"small")
+        assert read_s3_object(mocked_s3_bucket, BUCKET_NAME, KEY) == b"small"
+
+    def test_ranged_read(self, mocked_s3_bucket, large_content, mocker):
+        mocked_s3_bucket.put_object(Bucket=BUCKET_NAME, Key=KEY, Body=large_content)
+        spy = mocker.spy(mocked_s3_bucket, "get_object")
+
+        content = read_s3_object(mocked_s3_bucket, BUCKET_NAME, KEY, **TRANSFER_ARGS)
+
+        assert content == large_content
+        ranges = {call[1]["Range"] for call in spy.call_args_list}
+        assert ranges == {
+            "bytes=0-{}".format(MIN_PART_SIZE - 1),
+            "bytes={}-{}".format(MIN_PART_SIZE, 2 * MIN_PART_SIZE - 1),
+            "bytes={}-{}".format(2 * MIN_PART_SIZE, len(large_content) - 1),
+        }
+
+    def test_missing_object(self, mocked_s3_bucket):
+        pattern = r"Not Found|404"
+        with pytest.raises(Exception, match=pattern):
+            read_s3_object(mocked_s3_bucket, BUCKET_NAME, KEY)
+
+
+class TestGetTransferArgs:
+    def test_defaults(self):
+        assert get_transfer_args(None) == {
+            "part_size": 8 * 1024 ** 2,
+            "max_concurrency": 10,
+        }
+        assert get_transfer_args({"max_concurrency": 2})["max_concurrency"] == 2
+
+    @pytest.mark.parametrize(
+        "transfer_args,pattern",
+        [
+            (
+                dict(part_sise=MIN_PART_SIZE),
+                r"Unknown `transfer_args` \['part_sise'\], the supported options "
+                r"are \['max_concurrency', 'part_size'\]",
+            ),
+            (dict(part_size=1024), "`part_size` must be at least"),
+            (dict(max_concurrency=0), "`max_concurrency` must be a positive"),
+        ],
+    )
+    def test_invalid(self, transfer_args, pattern):
+        with pytest.raises(DataSetError, match=pattern):
+            get_transfer_args(transfer_args)
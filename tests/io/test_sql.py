@@ -28,13 +28,22 @@
 
 # pylint: disable=no-member
 
+import shutil
+from pathlib import Path
 from typing import Any
 
 import pandas as pd
 import pytest
 import sqlalchemy
+from pandas.util.testing import assert_frame_equal
 
-from kedro.io import DataSetError, SQLQueryDataSet, SQLTableDataSet
+from kedro.io import (
+    DataSetError,
+    SQLIncrementalDataSet,
+    SQLQueryDataSet,
+    SQLTableDataSet,
+)
+from kedro.io.sql import dispose_engines, get_engine, postgresql_copy_insert
 
 TABLE_NAME = "table_a"
 CONNECTION = "sqlite:///kedro.db"
@@ -45,6 +54,12 @@ ERROR_PREFIX = (
 )
 
 
+@pytest.fixture(autouse=True)
+def cleanup_engines():
+    yield
+    dispose_engines()
+
+
 @pytest.fixture(params=[dict()])
 def table_data_set(request):
     kwargs = dict(table_name=TABLE_NAME, credentials=dict(con=CONNECTION))
@@ -52,6 +67,26 @@ def table_data_set(request):
     return SQLTableDataSet(**kwargs)
 
 
+@pytest.fixture
+def sqlite_con(tmp_path):
+    return "sqlite:///{}".format(tmp_path / "kedro.db")
+
+
+@pytest.fixture
+def large_dataframe():
+    return pd.DataFrame({"col1": range(2500), "col2": ["value"] * 2500})
+
+
+def insert_rows(table, conn, keys, data_iter):
+    """Custom insertion method used in tests."""
+    insert_rows.calls += 1
+    rows = [dict(zip(keys, row)) for row in data_iter]
+    conn.execute(table.table.insert(), rows)
+
+
+insert_rows.calls = 0
+
+
 @pytest.fixture(params=[dict()])
 def query_data_set(request):
     kwargs = dict(sql=SQL_QUERY, credentials=dict(con=CONNECTION))
@@ -62,7 +97,9 @@ def query_data_set(request):
 class TestSQLTableDataSetLoad:
     @staticmethod
     def _assert_pd_called_once():
-        pd.read_sql_table.assert_called_once_with(table_name=TABLE_NAME, con=CONNECTION)
+        pd.read_sql_table.assert_called_once_with(
+            table_name=TABLE_NAME, con=get_engine(CONNECTION)
+        )
 
     def test_empty_table_name(self):
         """Check the error when instantiating with an empty table"""
@@ -134,7 +171,9 @@ class TestSQLTableDataSetSave:
 
     @staticmethod
     def _assert_to_sql_called_once(df: Any, index: bool = False):
-        df.to_sql.assert_called_once_with(name=TABLE_NAME, con=CONNECTION, index=index)
+        df.to_sql.assert_called_once_with(
+            name=TABLE_NAME, con=get_engine(CONNECTION), index=index
+        )
 
     def test_save_default_index(self, mocker, table_data_set, dummy_dataframe):
         """Test `save` method invocation"""
@@ -177,6 +216,7 @@ class TestSQLTableDataSetSave:
         """Test that if an unknown module/driver is encountered by SQLAlchemy
         then the error should contain the original error message"""
         _err = ImportError("No module named 'unknown_module'")
+        mocker.patch("kedro.io.sql.create_engine")
         mocker.patch.object(dummy_dataframe, "to_sql", side_effect=_err)
         pattern = r"No module named \'unknown_module\'"
         with pytest.raises(DataSetError, match=pattern):
@@ -195,6 +235,112 @@ class TestSQLTableDataSetSave:
         self._assert_to_sql_called_once(dummy_dataframe)
 
 
+class TestSQLTableDataSetBulkSave:
+    @pytest.mark.parametrize(
+        "method", ["executemany", "multi", "tests.io.test_sql.insert_rows"]
+    )
+    def test_save_and_load(self, sqlite_con, large_dataframe, method):
+        """Test the insert methods against a local SQLite database"""
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            save_args=dict(method=method, chunksize=100),
+        )
+        data_set.save(large_dataframe)
+        assert_frame_equal(data_set.load(), large_dataframe)
+
+    def test_default_method(self, sqlite_con, dummy_dataframe, mocker):
+        """Test that `method=None` selects the pandas default"""
+        mocker.patch.object(dummy_dataframe, "to_sql")
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            save_args=dict(method=None),
+        )
+        data_set.save(dummy_dataframe)
+        _, kwargs = dummy_dataframe.to_sql.call_args
+        assert kwargs["method"] is None
+
+    def test_invalid_method_type(self, sqlite_con, dummy_dataframe):
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            save_args=dict(method=42),
+        )
+        pattern = r"Insert method must be a string or a callable, not `int`"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.save(dummy_dataframe)
+
+    def test_custom_method_called_per_chunk(self, sqlite_con, large_dataframe):
+        insert_rows.calls = 0
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            save_args=dict(method=insert_rows, chunksize=1000),
+        )
+        data_set.save(large_dataframe)
+        assert insert_rows.calls == 3
+
+    @pytest.mark.parametrize("method", ["unknown", "kedro.io.sql.unknown"])
+    def test_unknown_method(self, sqlite_con, dummy_dataframe, method):
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            save_args=dict(method=method),
+        )
+        pattern = r"Unknown insert method `{}`".format(method)
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.save(dummy_dataframe)
+
+    def test_postgresql_copy_insert(self, mocker):
+        """Test the statement and data sent by the PostgreSQL COPY method"""
+        table = mocker.Mock(schema="my_schema")
+        table.name = "my_table"
+        conn = mocker.MagicMock()
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+
+        postgresql_copy_insert(table, conn, ["a", 'b"c'], iter([(1, "x"), (2, "y")]))
+
+        _, kwargs = cursor.copy_expert.call_args
+        assert kwargs["sql"] == (
+            'COPY "my_schema"."my_table" ("a", "b""c") FROM STDIN WITH CSV'
+        )
+        assert kwargs["file"].getvalue().splitlines() == ["1,x", "2,y"]
+
+
+class TestSQLChunkedLoad:
+    def test_table_chunks(self, sqlite_con, large_dataframe):
+        large_dataframe.to_sql(TABLE_NAME, sqlite_con, index=False)
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            load_args=dict(chunksize=1000),
+        )
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+        assert_frame_equal(pd.concat(chunks, ignore_index=True), large_dataframe)
+
+    def test_query_chunks(self, sqlite_con, large_dataframe):
+        large_dataframe.to_sql(TABLE_NAME, sqlite_con, index=False)
+        data_set = SQLQueryDataSet(
+            sql=SQL_QUERY,
+            credentials=dict(con=sqlite_con),
+            load_args=dict(chunksize=1000),
+        )
+        chunks = list(data_set.load())
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+    def test_chunks_unknown_sql(self):
+        data_set = SQLQueryDataSet(
+            sql=SQL_QUERY,
+            credentials=dict(con=FAKE_CONN_STR),
+            load_args=dict(chunksize=1000),
+        )
+        pattern = r"The SQL dialect in your connection is not supported"
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.load()
+
+
 class TestSQLTableDataSet:
     @staticmethod
     def _assert_sqlalchemy_called_once(*args):
@@ -239,7 +385,7 @@ class TestSQLQueryDataSet:
     @staticmethod
     def _assert_pd_called_once():
         _callable = pd.read_sql_query
-        _callable.assert_called_once_with(sql=SQL_QUERY, con=CONNECTION)
+        _callable.assert_called_once_with(sql=SQL_QUERY, con=get_engine(CONNECTION))
 
     def test_empty_query_error(self):
         """Check the error when instantiating with empty query"""
@@ -311,3 +457,340 @@ class TestSQLQueryDataSet:
         str_repr = str(query_data_set)
         assert "SQLQueryDataSet(sql={})".format(SQL_QUERY) in str_repr
         assert CONNECTION not in str_repr
+
+
+class TestSharedEngines:
+    def test_engine_shared_between_data_sets(self, mocker, sqlite_con):
+        """Check that data sets with the same connection string and engine
+        options reuse a single engine"""
+        create_engine = mocker.patch(
+            "kedro.io.sql.create_engine", wraps=sqlalchemy.create_engine
+        )
+        table = SQLTableDataSet(table_name=TABLE_NAME, credentials=dict(con=sqlite_con))
+        query = SQLQueryDataSet(sql=SQL_QUERY, credentials=dict(con=sqlite_con))
+
+        table.save(pd.DataFrame({"col1": [1, 2]}))
+        assert_frame_equal(table.load(), query.load())
+        assert table.exists()
+        create_engine.assert_called_once_with(sqlite_con)
+
+    def test_engine_args(self, mocker, sqlite_con):
+        """Check that engine options are passed to SQLAlchemy and that
+        different options give different engines"""
+        create_engine = mocker.patch(
+            "kedro.io.sql.create_engine", wraps=sqlalchemy.create_engine
+        )
+        engine_args = dict(pool_recycle=3600)
+        data_set = SQLTableDataSet(
+            table_name=TABLE_NAME,
+            credentials=dict(con=sqlite_con),
+            engine_args=engine_args,
+        )
+        assert not data_set.exists()
+        create_engine.assert_called_once_with(sqlite_con, pool_recycle=3600)
+        assert get_engine(sqlite_con, engine_args) is not get_engine(sqlite_con)
+        assert "engine_args={'pool_recycle': 3600}" in str(data_set)
+
+    def test_dispose_engines(self, mocker, sqlite_con):
+        """Check that disposing the engines closes their pools and that
+        new engines are created afterwards"""
+        engine = get_engine(sqlite_con)
+        mocker.patch.object(engine, "dispose")
+        dispose_engines()
+        engine.dispose.assert_called_once_with()
+        assert get_engine(sqlite_con) is not engine
+
+    def test_dispose_engines_of_connection(self, mocker, sqlite_con):
+        engine = get_engine(sqlite_con)
+        other = get_engine("sqlite:///other.db")
+        mocker.patch.object(engine, "dispose")
+        dispose_engines("sqlite:///other.db")
+        engine.dispose.assert_not_called()
+        assert get_engine(sqlite_con) is engine
+        assert get_engine("sqlite:///other.db") is not other
+
+    @pytest.mark.parametrize(
+        "data_set_class,args",
+        [
+            (SQLTableDataSet, dict(table_name=TABLE_NAME)),
+            (SQLQueryDataSet, dict(sql=SQL_QUERY)),
+            (
+                SQLIncrementalDataSet,
+                dict(sql=SQL_QUERY, watermark_column="id", filepath="a.parquet"),
+            ),
+        ],
+    )
+    def test_release(self, mocker, sqlite_con, data_set_class, args):
+        """Check that releasing a data set disposes the engines of its
+        connection string"""
+        dispose = mocker.patch("kedro.io.sql.dispose_engines")
+        data_set_class(credentials=dict(con=sqlite_con), **args).release()
+        dispose.assert_called_once_with(sqlite_con)
+
+
+@pytest.fixture
+def events_con(sqlite_con):
+    events = pd.DataFrame(
+        {
+            "event_id": [1, 2, 3],
+            "created": pd.to_datetime(["2019-01-01", "2019-01-02", "2019-01-03"]),
+            "value": ["a", "b", "c"],
+        }
+    )
+    events.to_sql("events", sqlite_con, index=False)
+    return sqlite_con
+
+
+def add_events(con, event_ids, created):
+    pd.DataFrame(
+        {
+            "event_id": event_ids,
+            "created": pd.to_datetime(created),
+            "value": ["new"] * len(event_ids),
+        }
+    ).to_sql("events", con, index=False, if_exists="append")
+
+
+@pytest.fixture(params=[dict()])
+def incremental_data_set(request, events_con, tmp_path):
+    kwargs = dict(
+        sql="SELECT * FROM events",
+        watermark_column="event_id",
+        filepath=str(tmp_path / "events.parquet"),
+        credentials=dict(con=events_con),
+    )
+    kwargs.update(request.param)
+    return SQLIncrementalDataSet(**kwargs)
+
+
+class TestSQLIncrementalDataSet:
+    def test_empty_watermark_column(self, sqlite_con):
+        """Check the error when instantiating without a watermark column"""
+        pattern = r"`watermark_column` argument cannot be empty\."
+        with pytest.raises(DataSetError, match=pattern):
+            SQLIncrementalDataSet(
+                sql=SQL_QUERY,
+                watermark_column="",
+                filepath="events.parquet",
+                credentials=dict(con=sqlite_con),
+            )
+
+    def test_empty_sql(self, sqlite_con):
+        """Check the error when instantiating with an empty query"""
+        pattern = r"`sql` argument cannot be empty\. Please provide a sql query"
+        with pytest.raises(DataSetError, match=pattern):
+            SQLIncrementalDataSet(
+                sql="",
+                watermark_column="event_id",
+                filepath="events.parquet",
+                credentials=dict(con=sqlite_con),
+            )
+
+    def test_empty_con(self):
+        """Check the error when instantiating with an empty connection string"""
+        pattern = r"`con` argument cannot be empty\. Please provide a SQLAlchemy"
+        with pytest.raises(DataSetError, match=pattern):
+            SQLIncrementalDataSet(
+                sql=SQL_QUERY,
+                watermark_column="event_id",
+                filepath="events.parquet",
+                credentials=dict(con=""),
+            )
+
+    def test_load_driver_missing(self, mocker, incremental_data_set):
+        """Check the error when the sql driver is missing"""
+        mocker.patch(
+            "pandas.read_sql_query",
+            side_effect=ImportError("No module named 'mysqldb'"),
+        )
+        with pytest.raises(DataSetError, match=ERROR_PREFIX + "mysqlclient"):
+            incremental_data_set.load()
+
+    def test_load_unknown_sql(self, tmp_path):
+        """Check the error when unknown SQL dialect is provided
+        in the connection string"""
+        data_set = SQLIncrementalDataSet(
+            sql=SQL_QUERY,
+            watermark_column="event_id",
+            filepath=str(tmp_path / "events.parquet"),
+            credentials=dict(con=FAKE_CONN_STR),
+        )
+        pattern = (
+            r"The SQL dialect in your connection is not supported " r"by SQLAlchemy"
+        )
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.load()
+
+    def test_first_load(self, incremental_data_set, tmp_path):
+        """Check that the first load reads the whole query result and
+        stores it locally"""
+        assert not incremental_data_set.exists()
+        data = incremental_data_set.load()
+        assert data["event_id"].tolist() == [1, 2, 3]
+        assert incremental_data_set.exists()
+        assert_frame_equal(pd.read_parquet(str(tmp_path / "events.parquet")), data)
+
+    def test_empty_first_load(self, sqlite_con, tmp_path):
+        """Check that an empty result is returned without being stored"""
+        data_set = SQLIncrementalDataSet(
+            sql="SELECT * FROM events",
+            watermark_column="event_id",
+            filepath=str(tmp_path / "events.parquet"),
+            credentials=dict(con=sqlite_con),
+        )
+        pd.DataFrame({"event_id": [1]}).iloc[:0].to_sql(
+            "events", sqlite_con, index=False
+        )
+        assert data_set.load().empty
+        assert not data_set.exists()
+
+    def test_incremental_load(self, mocker, incremental_data_set, events_con):
+        """Check that later loads only read the new rows"""
+        incremental_data_set.load()
+        add_events(events_con, [4, 5], ["2019-01-04", "2019-01-05"])
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+
+        data = incremental_data_set.load()
+        assert data["event_id"].tolist() == [1, 2, 3, 4, 5]
+        assert data["value"].tolist()[-2:] == ["new", "new"]
+        assert len(read_sql_query.spy_return) == 2
+
+    def test_new_rows_written_to_new_part(self, incremental_data_set, events_con):
+        """Check that the rows read by every load are written to a new file,
+        leaving the rows read before untouched"""
+        incremental_data_set.load()
+        add_events(events_con, [4, 5], ["2019-01-04", "2019-01-05"])
+        incremental_data_set.load()
+
+        parts = sorted(Path(incremental_data_set._filepath).iterdir())
+        assert [part.name for part in parts] == [
+            "part-00000.parquet",
+            "part-00001.parquet",
+        ]
+        assert pd.read_parquet(str(parts[1]))["event_id"].tolist() == [4, 5]
+
+    def test_interrupted_write(self, mocker, incremental_data_set, events_con):
+        """Check that rows are read again when a load is interrupted before
+        its file is complete"""
+        incremental_data_set.load()
+        add_events(events_con, [4], ["2019-01-04"])
+        mocker.patch("os.replace", side_effect=KeyboardInterrupt)
+        with pytest.raises(KeyboardInterrupt):
+            incremental_data_set.load()
+        mocker.stopall()
+
+        assert incremental_data_set.load()["event_id"].tolist() == [1, 2, 3, 4]
+
+    def test_watermark_column_changed(self, incremental_data_set, events_con):
+        """Check that the watermark is computed from the local copy when the
+        watermark column changes"""
+        incremental_data_set.load()
+        data_set = SQLIncrementalDataSet(
+            sql="SELECT * FROM events",
+            watermark_column="created",
+            filepath=incremental_data_set._filepath,
+            credentials=dict(con=events_con),
+            load_args=dict(parse_dates=["created"]),
+        )
+        add_events(events_con, [4], ["2019-01-04"])
+        assert data_set.load()["event_id"].tolist() == [1, 2, 3, 4]
+        assert len(data_set._list_parts()) == 2
+
+    def test_watermark_metadata_missing(self, incremental_data_set, tmp_path):
+        """Check that the watermark is computed from the local copy when
+        its files were not written by the data set"""
+        directory = tmp_path / "events.parquet"
+        directory.mkdir()
+        pd.DataFrame({"event_id": [1, 2]}).to_parquet(
+            str(directory / "part-00000.parquet")
+        )
+        assert incremental_data_set.load()["event_id"].tolist() == [1, 2, 3]
+        assert len(incremental_data_set._list_parts()) == 2
+
+    @pytest.mark.parametrize(
+        "local_copy", [{"value": ["a"]}, {"event_id": [None], "value": ["a"]}]
+    )
+    def test_watermark_not_found(self, incremental_data_set, tmp_path, local_copy):
+        """Check the error when the local copy lacks values of the watermark
+        column, leaving the local copy untouched"""
+        directory = tmp_path / "events.parquet"
+        directory.mkdir()
+        part = directory / "part-00000.parquet"
+        pd.DataFrame(local_copy).to_parquet(str(part))
+        pattern = r"Cannot find the high-watermark of the local copy"
+        with pytest.raises(DataSetError, match=pattern):
+            incremental_data_set.load()
+        assert part.is_file()
+
+    def test_parts_sorted_by_index(self, incremental_data_set, events_con, tmp_path):
+        """Check that the parts are ordered by index beyond the zero-padded
+        width of their names"""
+        directory = tmp_path / "events.parquet"
+        directory.mkdir()
+        for index, event_ids in [(99999, [1, 2]), (100000, [3])]:
+            pd.DataFrame({"event_id": event_ids}).to_parquet(
+                str(directory / "part-{:05d}.parquet".format(index))
+            )
+        add_events(events_con, [4], ["2019-01-04"])
+
+        data = incremental_data_set.load()
+        assert data["event_id"].tolist() == [1, 2, 3, 4]
+        assert incremental_data_set._list_parts()[-1].name == "part-100001.parquet"
+
+    def test_chunksize_rejected(self, events_con):
+        """Check the error when ``chunksize`` is given in ``load_args``"""
+        pattern = r"`chunksize` is not supported in `load_args`"
+        with pytest.raises(DataSetError, match=pattern):
+            SQLIncrementalDataSet(
+                sql=SQL_QUERY,
+                watermark_column="event_id",
+                filepath="events.parquet",
+                credentials=dict(con=events_con),
+                load_args=dict(chunksize=10),
+            )
+
+    def test_no_new_rows(self, incremental_data_set):
+        """Check that the local copy is returned when there are no new rows"""
+        first = incremental_data_set.load()
+        assert_frame_equal(incremental_data_set.load(), first)
+
+    @pytest.mark.parametrize(
+        "incremental_data_set",
+        [{"watermark_column": "created", "load_args": dict(parse_dates=["created"])}],
+        indirect=True,
+    )
+    def test_datetime_watermark(self, mocker, incremental_data_set, events_con):
+        """Check that datetime high-watermarks are persisted and compared"""
+        incremental_data_set.load()
+        add_events(events_con, [4], ["2019-01-04"])
+        read_sql_query = mocker.spy(pd, "read_sql_query")
+
+        data = incremental_data_set.load()
+        assert data["event_id"].tolist() == [1, 2, 3, 4]
+        assert read_sql_query.spy_return["event_id"].tolist() == [4]
+
+    def test_missing_local_copy(self, incremental_data_set, events_con, tmp_path):
+        """Check that the whole result is read again when the local copy
+        is removed"""
+        incremental_data_set.load()
+        shutil.rmtree(str(tmp_path / "events.parquet"))
+        add_events(events_con, [4], ["2019-01-04"])
+        assert incremental_data_set.load()["event_id"].tolist() == [1, 2, 3, 4]
+
+    def test_watermark_column_not_in_result(self, sqlite_con, events_con, tmp_path):
+        """Check the error when the query result lacks the watermark column"""
+        data_set = SQLIncrementalDataSet(
+            sql="SELECT value FROM events",
+            watermark_column="event_id",
+            filepath=str(tmp_path / "events.parquet"),
+            credentials=dict(con=events_con),
+        )
+        pattern = r"Watermark column `event_id` is not in the result of the query\."
+        with pytest.raises(DataSetError, match=pattern):
+            data_set.load()
+
+    def test_save_error(self, incremental_data_set, dummy_dataframe):
+        """Check the error when trying to save to the data set"""
+        pattern = r"`save` is not supported on SQLIncrementalDataSet"
+        with pytest.raises(DataSetError, match=pattern):
+            incremental_data_set.save(dummy_dataframe)
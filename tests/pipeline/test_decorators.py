@@ -29,7 +29,8 @@
 import logging
 from time import sleep
 
-from kedro.pipeline.decorators import log_time, mem_profile
+from kedro.pipeline import node
+from kedro.pipeline.decorators import batchable, log_time, mem_profile, streaming
 
 
 def sleeping_identity(inp):
@@ -87,3 +88,39 @@ def test_mem_profile(caplog):
         sleeping_identity.__qualname__,
     )
     assert expected in message
+
+
+def test_batchable():
+    @batchable
+    def add_one(values):
+        return [value + 1 for value in values]
+
+    assert node(add_one, "x", "y").batchable
+    assert not node(sleeping_identity, "x", "y").batchable
+    assert node(log_time(add_one), "x", "y").batchable
+
+
+def test_streaming():
+    @streaming
+    def total(chunks):
+        return sum(chunks)  # pragma: no cover
+
+    def numbers(limit):
+        yield from range(limit)  # pragma: no cover
+
+    assert node(total, "x", "y").streaming
+    assert node(log_time(total), "x", "y").streaming
+    assert node(numbers, "x", "y").streaming
+    assert node(numbers, "x", "y").decorate(log_time).streaming
+    assert not node(sleeping_identity, "x", "y").streaming
+    assert not node(batchable(numbers), "x", "y").streaming
+
+
+def test_batchable_single_run():
+    """Batchable functions run with batches of one outside of batch runs"""
+
+    @batchable
+    def add_one(values):
+        return [value + 1 for value in values]
+
+    assert node(add_one, "x", "y").run(dict(x=1)) == dict(y=2)
@@ -0,0 +1,176 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pytest
+
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, map_node, node
+from kedro.pipeline.map_node import MapNode
+from kedro.runner import ParallelRunner, SequentialRunner
+
+
+def identity(arg):
+    return arg
+
+
+def scale(partition, factor):
+    return partition * factor
+
+
+def split(partition):
+    return [partition, -partition]
+
+
+@pytest.fixture
+def partitions():
+    return {"a": 1, "b": 2, "c": 3}
+
+
+class TestMapNode:
+    def test_map(self, partitions):
+        dummy_node = map_node(scale, ["partitions", "factor"], "scaled")
+        result = dummy_node.run(dict(partitions=partitions, factor=10))
+        assert result == {"scaled": {"a": 10, "b": 20, "c": 30}}
+
+    def test_partitioned_input(self, partitions):
+        dummy_node = map_node(
+            scale,
+            dict(partition="parts", factor="factor"),
+            "scaled",
+            partitioned="parts",
+        )
+        assert dummy_node.partitioned == "parts"
+        result = dummy_node.run(dict(parts=partitions, factor=2))
+        assert result == {"scaled": {"a": 2, "b": 4, "c": 6}}
+
+    def test_multiple_outputs(self, partitions):
+        dummy_node = map_node(split, "partitions", ["positive", "negative"])
+        result = dummy_node.run(dict(partitions=partitions))
+        assert result == {
+            "positive": {"a": 1, "b": 2, "c": 3},
+            "negative": {"a": -1, "b": -2, "c": -3},
+        }
+
+    def test_lazy_partitions(self):
+        loaded = []
+
+        def _loader(value):
+            def _load():
+                loaded.append(value)
+                return value
+
+            return _load
+
+        dummy_node = map_node(identity, "partitions", "result")
+        result = dummy_node.run(dict(partitions={"a": _loader(1), "b": _loader(2)}))
+        assert result == {"result": {"a": 1, "b": 2}}
+        assert sorted(loaded) == [1, 2]
+
+    def test_max_workers(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def _track(partition):
+            with lock:
+                running.append(partition)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(partition)
+            return partition
+
+        dummy_node = map_node(_track, "partitions", "result", max_workers=2)
+        partitions = {i: i for i in range(6)}
+        assert dummy_node.run(dict(partitions=partitions)) == {"result": partitions}
+        assert max(peak) == 2
+
+    def test_not_partitioned(self):
+        dummy_node = map_node(identity, "partitions", "result", name="map")
+        pattern = r"expected a dictionary of partitions for input `partitions`"
+        with pytest.raises(ValueError, match=pattern):
+            dummy_node.run(dict(partitions=[1, 2]))
+
+    def test_tag_and_decorate(self, partitions):
+        def _negate(func):
+            def _wrapper(*args):
+                return -func(*args)
+
+            return _wrapper
+
+        dummy_node = map_node(identity, "partitions", "result", max_workers=1)
+        dummy_node = dummy_node.tag(["tag"]).decorate(_negate)
+        assert isinstance(dummy_node, MapNode)
+        assert dummy_node.tags == {"tag"}
+        result = dummy_node.run(dict(partitions=partitions))
+        assert result == {"result": {"a": -1, "b": -2, "c": -3}}
+
+    def test_in_pipeline(self, partitions):
+        pipeline = Pipeline(
+            [
+                map_node(scale, ["partitions", "factor"], "scaled"),
+                node(lambda scaled: sum(scaled.values()), "scaled", "total"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict=dict(partitions=partitions, factor=2))
+        assert SequentialRunner().run(pipeline, catalog) == {"total": 12}
+
+    def test_not_streaming(self):
+        """Map nodes neither stream their outputs nor consume streams, even
+        for generator functions"""
+
+        def numbers(partition):
+            yield partition
+
+        dummy_node = map_node(numbers, "partitions", "numbers")
+        assert not dummy_node.streaming
+        assert not dummy_node._yields_chunks  # pylint: disable=protected-access
+
+    def test_parallel_runner(self, partitions):
+        pipeline = Pipeline([map_node(scale, ["partitions", "factor"], "scaled")])
+        catalog = DataCatalog(feed_dict=dict(partitions=partitions, factor=2))
+        result = ParallelRunner().run(pipeline, catalog)
+        assert result == {"scaled": {"a": 2, "b": 4, "c": 6}}
+
+
+class TestInvalidMapNode:
+    def test_no_inputs(self):
+        with pytest.raises(ValueError, match=r"must have a partitioned input"):
+            map_node(lambda: None, None, "result")
+
+    def test_unknown_partitioned_input(self):
+        pattern = r"partitioned input `other` is not an input of the node"
+        with pytest.raises(ValueError, match=pattern):
+            map_node(identity, "partitions", "result", partitioned="other")
+
+    def test_bad_max_workers(self):
+        with pytest.raises(ValueError, match=r"`max_workers` .* must be positive"):
+            map_node(identity, "partitions", "result", max_workers=0)
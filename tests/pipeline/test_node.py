@@ -25,12 +25,14 @@
 #
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
 from functools import wraps
 from typing import Callable
 
 import pytest
 
 from kedro.pipeline import node
+from kedro.pipeline.node import Node
 
 
 # Different dummy func based on the number of arguments
@@ -50,6 +52,14 @@ def triconcat(input1: str, input2: str, input3: str):
     return input1 + input2 + input3  # pragma: no cover
 
 
+class AnnotatedNode(Node):
+    """A ``Node`` subclass without ``__slots__``"""
+
+    def __init__(self, *args, owner: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.owner = owner
+
+
 @pytest.fixture
 def simple_tuple_node_list():
     return [
@@ -144,6 +154,62 @@ class TestValidNode:
         )
         assert dummy_node.outputs == ["output2", "output1", "last node"]
 
+    def test_node_not_equals(self):
+        first = node(identity, "input1", "output1", name="a node")
+        assert first != node(identity, "input1", "output2", name="a node")
+        assert first != node(identity, "input1", "output1", name="another node")
+        assert first != node(identity, dict(input1="input1"), "output1", name="a node")
+        assert first != "a node"
+
+    def test_node_hash(self):
+        first = node(identity, "input1", "output1", name="a node")
+        second = node(identity, "input1", "output1", name="a node")
+        assert hash(first) == hash(second)
+        assert len({first, second, first.tag(["tag"])}) == 1
+
+    def test_definition_copied(self):
+        """Changing the inputs or outputs a node was created with does not
+        alter the node"""
+        inputs = ["input1", "input2"]
+        outputs = dict(result="output")
+        dummy_node = node(biconcat, inputs, outputs)
+        node_hash = hash(dummy_node)
+        inputs.append("input3")
+        outputs["other"] = "output2"
+        dummy_node.inputs.append("input4")
+
+        assert dummy_node.inputs == ["input1", "input2"]
+        assert dummy_node.outputs == ["output"]
+        assert hash(dummy_node) == node_hash
+
+    def test_slots(self):
+        dummy_node = node(identity, "input1", "output1")
+        assert not hasattr(dummy_node, "__dict__")
+        with pytest.raises(AttributeError):
+            dummy_node.new_attribute = 1  # pylint: disable=assigning-non-slot
+
+    def test_pickle(self):
+        dummy_node = node(identity, "input1", "output1", name="a node", tags=["tag"])
+        unpickled = pickle.loads(pickle.dumps(dummy_node))
+        assert unpickled == dummy_node
+        assert hash(unpickled) == hash(dummy_node)
+        assert unpickled.tags == {"tag"}
+        assert str(unpickled) == str(dummy_node)
+
+    def test_subclass_attributes_kept(self):
+        """Attributes of subclasses without ``__slots__`` are kept by copies
+        and pickling"""
+        dummy_node = AnnotatedNode(identity, "input1", "output1", owner="team")
+        copies = [
+            dummy_node.tag(["tag"]),
+            dummy_node.decorate(apply_f),
+            pickle.loads(pickle.dumps(dummy_node)),
+        ]
+        for copied in copies:
+            assert isinstance(copied, AnnotatedNode)
+            assert copied.owner == "team"
+            assert copied.run(dict(input1=1))["output1"] in (1, "f(1)")
+
 
 def bad_input_type_node():
     return lambda x: None, ("A", "D"), "B"
@@ -290,12 +356,46 @@ class TestTagDecorator:
         assert "output" in result
         assert result["output"] == "f(g(ij(h(1))))"
 
+    def test_decorators_applied_once(self, mocker):
+        applied = mocker.Mock(side_effect=apply_f)
+        dummy_node = node(identity, "input", "output").decorate(applied)
+
+        for _ in range(3):
+            assert dummy_node.run(dict(input=1))["output"] == "f(1)"
+        applied.assert_called_once_with(identity)
+
+    def test_decorate_composed_node(self, mocker):
+        """Decorating a node which already ran only applies the new
+        decorators"""
+        applied = mocker.Mock(side_effect=apply_h)
+        old_node = node(apply_g(decorated_identity), "input", "output").decorate(
+            applied
+        )
+        assert old_node.run(dict(input=1))["output"] == "f(g(h(1)))"
+
+        new_node = old_node.decorate(apply_ij)
+        assert new_node.run(dict(input=1))["output"] == "f(g(h(ij(1))))"
+        assert old_node.run(dict(input=1))["output"] == "f(g(h(1)))"
+        applied.assert_called_once()
+
+    def test_pickle_decorated_node(self):
+        dummy_node = node(identity, "input", "output").decorate(apply_f)
+        dummy_node.run(dict(input=1))
+        unpickled = pickle.loads(pickle.dumps(dummy_node))
+        assert unpickled.run(dict(input=1))["output"] == "f(1)"
+
     def test_tag_nodes(self):
         tagged_node = node(identity, "input", "output", tags=["hello"]).tag(["world"])
         assert "hello" in tagged_node.tags
         assert "world" in tagged_node.tags
         assert len(tagged_node.tags) == 2
 
+    def test_tags_immutable(self):
+        tagged_node = node(identity, "input", "output", tags=["hello"])
+        with pytest.raises(AttributeError):
+            tagged_node.tags.add("world")  # pylint: disable=no-member
+        assert tagged_node.tags == {"hello"}
+
     def test_tag_and_decorate(self):
         tagged_node = node(identity, "input", "output", tags=["hello"])
         tagged_node = tagged_node.decorate(apply_f)
@@ -26,6 +26,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import marshal
 from functools import wraps
 from itertools import chain
 from typing import Callable
@@ -36,6 +37,7 @@ from pytest import fixture
 import kedro
 from kedro.io import DataCatalog
 from kedro.pipeline import Pipeline, node
+from kedro.pipeline.node import Node
 from kedro.pipeline.pipeline import CircularDependencyError, OutputNotUniqueError
 from kedro.runner import SequentialRunner
 
@@ -286,6 +288,20 @@ class TestValidPipeline:
 
         assert set(outputs) == pipeline.outputs()
 
+    def test_grouped_nodes_order(self):
+        """Nodes of the same group keep the order they were given in"""
+        nodes = [
+            node(identity, "B", "C", name="node1"),
+            node(constant_output, None, "A", name="node2"),
+            node(identity, "A", "D", name="node3"),
+            node(constant_output, None, "B", name="node4"),
+        ]
+        grouped = Pipeline(nodes).grouped_nodes
+        assert [[n.name for n in group] for group in grouped] == [
+            ["node2", "node4"],
+            ["node1", "node3"],
+        ]
+
     def test_combine(self):
         pipeline1 = Pipeline([node(biconcat, ["input", "input1"], "output1", name="a")])
         pipeline2 = Pipeline([node(biconcat, ["input", "input2"], "output2", name="b")])
@@ -311,6 +327,28 @@ class TestValidPipeline:
         """Empty pipeline is possible"""
         Pipeline([])
 
+    def test_data_sets_are_frozen(self, input_data):
+        """Data set names are computed once and cannot be altered"""
+        pipeline = Pipeline(input_data["nodes"])
+
+        for data_sets in (
+            pipeline.all_inputs(),
+            pipeline.all_outputs(),
+            pipeline.inputs(),
+            pipeline.outputs(),
+            pipeline.data_sets(),
+        ):
+            assert isinstance(data_sets, frozenset)
+        assert pipeline.inputs() is pipeline.inputs()
+        assert pipeline.data_sets() == pipeline.all_inputs() | pipeline.all_outputs()
+
+    def test_nodes_copy(self, input_data):
+        """Modifying the returned list of nodes does not alter the pipeline"""
+        pipeline = Pipeline(input_data["nodes"])
+        nodes = pipeline.nodes
+        nodes.pop()
+        assert len(pipeline.nodes) == len(nodes) + 1
+
 
 def pipeline_with_circle():
     return [
@@ -336,6 +374,35 @@ class TestInvalidPipeline:
         with pytest.raises(CircularDependencyError, match=pattern):
             Pipeline(pipeline_with_circle())
 
+    def test_circle_case_names_nodes(self):
+        """Only the nodes forming the circle are reported"""
+        nodes = pipeline_with_circle() + [
+            node(identity, "C", "D", name="node4"),
+            node(identity, "E", "F", name="node5"),
+        ]
+        with pytest.raises(CircularDependencyError) as excinfo:
+            Pipeline(nodes)
+
+        message = str(excinfo.value)
+        assert all(name in message for name in ("node1", "node2", "node3"))
+        assert "node4" not in message
+        assert "node5" not in message
+
+    def test_circle_case_prunes_chain(self):
+        """The nodes of a chain depending on the circle are not reported,
+        however long the chain is"""
+        nodes = pipeline_with_circle() + [
+            node(identity, "C", "D", name="node4"),
+            node(identity, "D", "E", name="node5"),
+            node(biconcat, ["E", "B"], "F", name="node6"),
+        ]
+        with pytest.raises(CircularDependencyError) as excinfo:
+            Pipeline(nodes)
+
+        message = str(excinfo.value)
+        assert all(name in message for name in ("node1", "node2", "node3"))
+        assert all(name not in message for name in ("node4", "node5", "node6"))
+
     def test_unique_outputs(self):
         with pytest.raises(OutputNotUniqueError, match=r"\['D', 'E'\]"):
             Pipeline(non_unique_node_outputs())
@@ -477,6 +544,39 @@ class TestComplexPipeline:
         with pytest.raises(ValueError, match=pattern):
             complex_pipeline.to_nodes("missing_node")
 
+    @pytest.mark.parametrize(
+        "operation,args",
+        [
+            ("only_nodes", ["node1", "node4", "node7"]),
+            ("only_nodes_with_inputs", ["H", "B"]),
+            ("from_inputs", ["E"]),
+            ("only_nodes_with_outputs", ["N", "F", "C"]),
+            ("to_outputs", ["I"]),
+            ("from_nodes", ["node4"]),
+            ("to_nodes", ["node2", "node5"]),
+        ],
+    )
+    def test_slicing_grouped_nodes(self, complex_pipeline, operation, args):
+        """Sub-pipelines are grouped as if they were built from scratch"""
+        sliced = getattr(complex_pipeline, operation)(*args)
+        rebuilt = Pipeline(sliced.nodes)
+
+        assert [set(group) for group in sliced.grouped_nodes] == [
+            set(group) for group in rebuilt.grouped_nodes
+        ]
+        assert sliced.inputs() == rebuilt.inputs()
+        assert sliced.outputs() == rebuilt.outputs()
+        assert sliced.node_dependencies == rebuilt.node_dependencies
+        assert sliced.name is None
+
+    def test_slicing_skips_validation(self, mocker, complex_pipeline):
+        """Sub-pipelines reuse the validation and order of their parent"""
+        toposort = mocker.patch("kedro.pipeline.pipeline._topologically_sorted")
+        complex_pipeline.from_nodes("node7")
+        complex_pipeline.to_nodes("node1")
+        complex_pipeline.decorate(apply_f)
+        toposort.assert_not_called()
+
     def test_connected_pipeline(self, disjoint_pipeline):
         """Connect two separate pipelines."""
         nodes = disjoint_pipeline["nodes"]
@@ -648,3 +748,80 @@ def test_pipeline_to_json(input_data):
         assert all([node_output in json_rep for node_output in pipeline_node.outputs])
 
     assert kedro.__version__ in json_rep
+
+
+class TestPipelineSnapshot:
+    def test_from_snapshot(self, input_data):
+        pipeline = Pipeline(input_data["nodes"], name="snapshot")
+        loaded = Pipeline.from_snapshot(pipeline.to_snapshot())
+
+        def _grouped_names(pipe):
+            return [[str(n) for n in group] for group in pipe.grouped_nodes]
+
+        assert _grouped_names(loaded) == _grouped_names(pipeline)
+        assert loaded.describe() == pipeline.describe()
+        assert [n.tags for n in loaded.nodes] == [n.tags for n in pipeline.nodes]
+        assert loaded.data_sets() == pipeline.data_sets()
+
+    def test_snapshot_is_compact(self, pipeline_list_with_lists):
+        pipeline = Pipeline(pipeline_list_with_lists["nodes"])
+        assert len(pipeline.to_snapshot()) < len(pipeline.to_json())
+
+    def test_slicing_snapshot(self, nodes_with_tags):
+        pipeline = Pipeline.from_snapshot(Pipeline(nodes_with_tags).to_snapshot())
+        assert {n.name for n in pipeline.only_nodes_with_tags("tag1").nodes} == {
+            "node2",
+            "node6",
+        }
+
+    def test_run_snapshot(self, branchless_pipeline):
+        pipeline = Pipeline.from_snapshot(
+            Pipeline(branchless_pipeline["nodes"]).to_snapshot()
+        )
+        pattern = r"Node function `.+\.constant_output` was not imported"
+        with pytest.raises(ValueError, match=pattern):
+            SequentialRunner().run(pipeline, DataCatalog())
+
+    def test_source_hash_mismatch(self, branchless_pipeline):
+        snapshot = Pipeline(branchless_pipeline["nodes"]).to_snapshot("old")
+        pattern = r"created from source code with hash `old`, whereas `new`"
+        with pytest.raises(ValueError, match=pattern):
+            Pipeline.from_snapshot(snapshot, "new")
+
+    def test_kedro_version_mismatch(self, branchless_pipeline, mocker):
+        snapshot = Pipeline(branchless_pipeline["nodes"]).to_snapshot()
+        mocker.patch.object(kedro, "__version__", "0.0.0")
+        pattern = (
+            r"written with snapshot format \d+ by Kedro .+ on Python .+, whereas "
+            r"this is snapshot format \d+, Kedro 0\.0\.0 on Python .+\. The "
+            r"snapshot must be regenerated"
+        )
+        with pytest.raises(ValueError, match=pattern):
+            Pipeline.from_snapshot(snapshot)
+
+    def test_python_version_mismatch(self, branchless_pipeline, mocker):
+        mocker.patch("sys.version_info", (2, 7, 0))
+        snapshot = Pipeline(branchless_pipeline["nodes"]).to_snapshot()
+        mocker.stopall()
+        pattern = r"by Kedro .+ on Python 2\.7, whereas .+ The snapshot must be"
+        with pytest.raises(ValueError, match=pattern):
+            Pipeline.from_snapshot(snapshot)
+
+    @pytest.mark.parametrize("snapshot", [b"", b"invalid", marshal.dumps((1, 2))])
+    def test_invalid_snapshot(self, snapshot):
+        pattern = (
+            r"Invalid pipeline snapshot\. It is either corrupt or was written "
+            r"with a different snapshot format or Python version\. The snapshot "
+            r"must be regenerated"
+        )
+        with pytest.raises(ValueError, match=pattern):
+            Pipeline.from_snapshot(snapshot)
+
+    def test_nodes_not_validated(self, input_data, mocker):
+        """Nodes are restored from the snapshot without creating them again"""
+        pipeline = Pipeline(input_data["nodes"])
+        init = mocker.patch.object(Node, "__init__")
+        loaded = Pipeline.from_snapshot(pipeline.to_snapshot())
+        init.assert_not_called()
+        assert [str(n) for n in loaded.nodes] == [str(n) for n in pipeline.nodes]
+        assert {hash(n) for n in loaded.nodes} == {hash(n) for n in pipeline.nodes}
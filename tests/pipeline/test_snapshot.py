@@ -0,0 +1,114 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline.snapshot import cached_pipeline, source_hash
+
+
+def identity(arg):
+    return arg  # pragma: no cover
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    source = tmp_path / "src"
+    (source / "nodes").mkdir(parents=True)
+    (source / "pipeline.py").write_text("PIPELINE = 1\n")
+    (source / "nodes" / "example.py").write_text("def example(): pass\n")
+    return source
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / ".pipeline_snapshot"
+
+
+@pytest.fixture
+def create_pipeline(mocker):
+    return mocker.Mock(
+        side_effect=lambda: Pipeline(
+            [node(identity, "A", "B"), node(identity, "B", "C", tags=["tag"])]
+        )
+    )
+
+
+class TestSourceHash:
+    def test_unchanged(self, source_path):
+        assert source_hash(source_path) == source_hash(str(source_path))
+
+    def test_file_changed(self, source_path):
+        original = source_hash(source_path)
+        (source_path / "nodes" / "example.py").write_text("def example(): 1\n")
+        assert source_hash(source_path) != original
+
+    def test_file_added(self, source_path):
+        original = source_hash(source_path)
+        (source_path / "nodes" / "other.py").write_text("")
+        assert source_hash(source_path) != original
+
+    def test_non_python_file_ignored(self, source_path):
+        original = source_hash(source_path)
+        (source_path / "README.md").write_text("readme")
+        assert source_hash(source_path) == original
+
+    def test_single_file(self, source_path):
+        filepath = source_path / "pipeline.py"
+        assert source_hash(filepath) != source_hash(source_path)
+
+
+class TestCachedPipeline:
+    def test_create_and_load(self, snapshot_path, source_path, create_pipeline):
+        created = cached_pipeline(snapshot_path, source_path, create_pipeline)
+        assert snapshot_path.is_file()
+
+        loaded = cached_pipeline(snapshot_path, source_path, create_pipeline)
+        create_pipeline.assert_called_once_with()
+        assert loaded.describe() == created.describe()
+        assert [n.tags for n in loaded.nodes] == [n.tags for n in created.nodes]
+
+    def test_source_changed(self, snapshot_path, source_path, create_pipeline):
+        cached_pipeline(snapshot_path, source_path, create_pipeline)
+        (source_path / "pipeline.py").write_text("PIPELINE = 2\n")
+        cached_pipeline(snapshot_path, source_path, create_pipeline)
+        cached_pipeline(snapshot_path, source_path, create_pipeline)
+        assert create_pipeline.call_count == 2
+
+    def test_invalid_snapshot(self, snapshot_path, source_path, create_pipeline):
+        snapshot_path.write_bytes(b"invalid")
+        cached_pipeline(snapshot_path, source_path, create_pipeline)
+        create_pipeline.assert_called_once_with()
+        assert Pipeline.from_snapshot(
+            snapshot_path.read_bytes(), source_hash(source_path)
+        )
+
+    def test_save_fails(self, tmp_path, source_path, create_pipeline, caplog):
+        snapshot_path = tmp_path / "missing" / ".pipeline_snapshot"
+        pipeline = cached_pipeline(snapshot_path, source_path, create_pipeline)
+        assert len(pipeline.nodes) == 2
+        assert "Failed to save pipeline snapshot" in caplog.text
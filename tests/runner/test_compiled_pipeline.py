@@ -0,0 +1,196 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from kedro.io import DataCatalog, LambdaDataSet, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline.decorators import batchable
+from kedro.runner import CompiledPipeline, SequentialRunner
+
+
+def identity(arg):
+    return arg
+
+
+def add(arg1, arg2):
+    return arg1 + arg2
+
+
+def double(arg):
+    return arg * 2
+
+
+def exception_fn(arg):
+    raise ValueError("test exception")
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(add, ["x", "params:y"], "z", name="add"),
+            node(double, "z", "doubled", name="double"),
+            node(add, ["z", "doubled"], "result", name="add_again"),
+            node(identity, "z", "saved", name="save"),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog({"params:y": MemoryDataSet(2), "saved": MemoryDataSet()})
+
+
+class TestCompiledPipeline:
+    def test_run(self, pipeline, catalog):
+        run = CompiledPipeline(pipeline, catalog)
+        assert run({"x": 1}) == {"result": 9}
+        assert run({"x": 2}) == {"result": 12}
+        assert catalog.load("saved") == 4
+
+    def test_same_as_runner(self, pipeline):
+        runner_catalog = DataCatalog({}, {"x": 3, "params:y": 1})
+        expected = SequentialRunner().run(pipeline, runner_catalog)
+        assert CompiledPipeline(pipeline)({"x": 3, "params:y": 1}) == expected
+
+    def test_inputs_outputs(self, pipeline, catalog):
+        run = CompiledPipeline(pipeline, catalog)
+        assert run.inputs == {"x"}
+        assert run.outputs == {"result"}
+
+        run = CompiledPipeline(pipeline)
+        assert run.inputs == {"x", "params:y"}
+        assert run.outputs == {"result", "saved"}
+
+    def test_missing_inputs(self, pipeline, catalog):
+        run = CompiledPipeline(pipeline, catalog)
+        pattern = r"Pipeline input\(s\) \['x'\] not found"
+        with pytest.raises(ValueError, match=pattern):
+            run({"params:y": 3})
+
+    def test_feed_dict_overrides_catalog(self, pipeline, catalog):
+        run = CompiledPipeline(pipeline, catalog)
+        assert run({"x": 1, "params:y": 0}) == {"result": 3}
+
+    def test_catalog_inputs_loaded_once_per_call(self, mocker, pipeline):
+        load = mocker.Mock(return_value=2)
+        catalog = DataCatalog({"params:y": LambdaDataSet(load=load, save=None)})
+        run = CompiledPipeline(pipeline, catalog)
+        run({"x": 1})
+        run({"x": 1})
+        assert load.call_count == 2
+
+    def test_intermediate_not_copied(self, catalog):
+        data = [1, 2]
+        pipeline = Pipeline(
+            [node(identity, "x", "y", name="first"), node(identity, "y", "z")]
+        )
+        assert CompiledPipeline(pipeline, catalog)({"x": data})["z"] is data
+
+    def test_no_node_logging(self, caplog, pipeline, catalog):
+        CompiledPipeline(pipeline, catalog)({"x": 1})
+        assert not caplog.records
+
+    def test_node_failure(self, caplog, catalog):
+        pipeline = Pipeline([node(exception_fn, "x", "y", name="fails")])
+        run = CompiledPipeline(pipeline, catalog)
+        with pytest.raises(ValueError, match="test exception"):
+            run({"x": 1})
+        assert "fails" in caplog.records[-1].getMessage()
+
+
+@batchable
+def batch_double(args):
+    return [arg * 2 for arg in args]
+
+
+@batchable
+def batch_wrong_length(args):
+    return args[:1]
+
+
+@pytest.fixture
+def batch_pipeline():
+    return Pipeline(
+        [
+            node(add, ["x", "params:y"], "z", name="add"),
+            node(batch_double, "z", "doubled", name="double"),
+            node(add, ["z", "doubled"], "result", name="add_again"),
+            node(identity, "z", "saved", name="save"),
+        ]
+    )
+
+
+class TestRunBatch:
+    def test_run_batch(self, batch_pipeline, catalog):
+        run = CompiledPipeline(batch_pipeline, catalog)
+        feed_dicts = [{"x": x} for x in range(5)]
+        assert run.run_batch(feed_dicts) == [run(feed) for feed in feed_dicts]
+        assert catalog.load("saved") == 6
+
+    def test_batchable_called_once(self, mocker, catalog):
+        func = batchable(mocker.Mock(side_effect=batch_double, __name__="batch"))
+        pipeline = Pipeline([node(func, "x", "doubled")])
+        results = CompiledPipeline(pipeline, catalog).run_batch(
+            [{"x": 1}, {"x": 2}], max_workers=2
+        )
+        assert results == [{"doubled": 2}, {"doubled": 4}]
+        func.assert_called_once_with([1, 2])
+
+    def test_catalog_loaded_once(self, mocker, batch_pipeline):
+        load = mocker.Mock(return_value=2)
+        catalog = DataCatalog({"params:y": LambdaDataSet(load=load, save=None)})
+        CompiledPipeline(batch_pipeline, catalog).run_batch([{"x": 1}, {"x": 2}])
+        load.assert_called_once_with()
+
+    def test_catalog_saved_per_run(self, mocker, batch_pipeline, catalog):
+        """Outputs in the catalog are saved with the value of every run,
+        like ``__call__`` saves them, rather than with a list of values"""
+        save = mocker.Mock()
+        catalog.add("saved", LambdaDataSet(load=None, save=save), replace=True)
+        run = CompiledPipeline(batch_pipeline, catalog)
+        run.run_batch([{"x": 1}, {"x": 2}, {"x": 3}])
+        assert save.call_args_list == [mocker.call(3), mocker.call(4), mocker.call(5)]
+
+    def test_empty_batch(self, batch_pipeline, catalog):
+        assert CompiledPipeline(batch_pipeline, catalog).run_batch([]) == []
+
+    def test_missing_inputs(self, batch_pipeline, catalog):
+        run = CompiledPipeline(batch_pipeline, catalog)
+        pattern = r"Pipeline input\(s\) \['x'\] not found"
+        with pytest.raises(ValueError, match=pattern):
+            run.run_batch([{"x": 1}, {}])
+
+    def test_wrong_batch_length(self, caplog, catalog):
+        pipeline = Pipeline([node(batch_wrong_length, "x", "y", name="wrong")])
+        run = CompiledPipeline(pipeline, catalog)
+        pattern = r"returned 1 value\(s\) for output `y`, whereas the batch has 2"
+        with pytest.raises(ValueError, match=pattern):
+            run.run_batch([{"x": 1}, {"x": 2}])
+        assert "wrong" in caplog.records[-1].getMessage()
@@ -149,6 +149,52 @@ class TestSeqentialRunnerBranchlessPipeline:
         output = SequentialRunner().run(saving_result_pipeline, catalog)
         assert output == {}
 
+    def test_default_data_set_max_loads(self, mocker):
+        """Default data sets may be loaded once per consuming node"""
+        pipeline = Pipeline(
+            [
+                node(random, None, "A", name="node1"),
+                node(identity, "A", "B", name="node2"),
+                node(multi_input_list_output, ["A", "B"], ["C", "D"], name="node3"),
+            ]
+        )
+        runner = SequentialRunner()
+        create = mocker.spy(runner, "create_default_data_set")
+        runner.run(pipeline, DataCatalog())
+
+        max_loads = {call[0][0]: call[0][1] for call in create.call_args_list}
+        assert max_loads == {"A": 2, "B": 1, "C": None, "D": None}
+
+    def test_data_sets_released(self, mocker, branchless_pipeline):
+        data_set = MemoryDataSet(42)
+        release = mocker.spy(data_set, "release")
+        SequentialRunner().run(branchless_pipeline, DataCatalog({"ds1": data_set}))
+        release.assert_called_once_with()
+
+    def test_data_sets_released_on_failure(self, mocker, saving_none_pipeline):
+        release = mocker.patch.object(DataCatalog, "release")
+        with pytest.raises(DataSetError):
+            SequentialRunner().run(saving_none_pipeline, DataCatalog())
+        release.assert_called_once_with()
+
+    def test_release_error_on_failure(self, mocker, caplog, saving_none_pipeline):
+        """Check that a release error does not hide the error of the run"""
+        mocker.patch.object(
+            DataCatalog, "release", side_effect=DataSetError("Release failed")
+        )
+        pattern = "Saving `None` to a `DataSet` is not allowed"
+        with pytest.raises(DataSetError, match=pattern):
+            SequentialRunner().run(saving_none_pipeline, DataCatalog())
+        assert "Release failed" in caplog.text
+
+    def test_release_error(self, mocker, branchless_pipeline):
+        mocker.patch.object(
+            DataCatalog, "release", side_effect=DataSetError("Release failed")
+        )
+        catalog = DataCatalog({"ds1": MemoryDataSet(42)})
+        with pytest.raises(DataSetError, match="Release failed"):
+            SequentialRunner().run(branchless_pipeline, catalog)
+
 
 @pytest.fixture
 def unfinished_outputs_pipeline():
@@ -0,0 +1,371 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pylint: disable=unused-argument
+import threading
+
+import pandas as pd
+import pytest
+
+from kedro.io import (
+    CSVLocalDataSet,
+    DataCatalog,
+    JSONLinesLocalDataSet,
+    MemoryDataSet,
+    PickleLocalDataSet,
+)
+from kedro.pipeline import Pipeline, map_node, node
+from kedro.pipeline.decorators import batchable, streaming
+from kedro.runner import SequentialRunner, StreamingRunner
+
+
+def identity(arg):
+    return arg
+
+
+def count_up(limit):
+    for value in range(limit):
+        yield value
+
+
+def double(chunks):
+    for chunk in chunks:
+        yield chunk * 2
+
+
+def split(chunks):
+    for chunk in chunks:
+        yield [chunk, -chunk]
+
+
+def total(chunks):
+    return sum(chunks)
+
+
+@streaming
+def first(chunks):
+    return next(iter(chunks))
+
+
+def fail(chunks):
+    for chunk in chunks:
+        if chunk == 3:
+            raise ValueError("Failed on chunk 3")
+        yield chunk
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog({"limit": MemoryDataSet(10)})
+
+
+class TestStreamingRunner:
+    def test_invalid_queue_size(self):
+        pattern = r"`queue_size` of StreamingRunner must be positive"
+        with pytest.raises(ValueError, match=pattern):
+            StreamingRunner(queue_size=0)
+
+    def test_not_streamed(self, catalog):
+        pipeline = Pipeline(
+            [
+                node(identity, "limit", "A"),
+                node(identity, "A", "B"),
+                node(sum, "B", "C"),
+            ]
+        )
+        catalog.add_feed_dict({"limit": [1, 2, 3]}, replace=True)
+        assert StreamingRunner().run(pipeline, catalog) == SequentialRunner().run(
+            pipeline, catalog
+        )
+
+    def test_chain(self, catalog):
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(double, "numbers", "doubled"),
+                node(total, "doubled", "total"),
+            ]
+        )
+        assert StreamingRunner().run(pipeline, catalog) == {"total": 90}
+
+    def test_free_output_chunks(self, catalog):
+        """Chunks of a streamed free output are collected in a list."""
+        pipeline = Pipeline(
+            [node(count_up, "limit", "numbers"), node(double, "numbers", "doubled")]
+        )
+        outputs = StreamingRunner().run(pipeline, catalog)
+        assert outputs == {"doubled": list(range(0, 20, 2))}
+
+    def test_multiple_consumers(self, catalog):
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(total, "numbers", "total"),
+                node(first, "numbers", "first"),
+                node(double, "numbers", "doubled"),
+            ]
+        )
+        outputs = StreamingRunner(queue_size=1).run(pipeline, catalog)
+        assert outputs == {"total": 45, "first": 0, "doubled": list(range(0, 20, 2))}
+
+    def test_multiple_outputs(self, catalog):
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(split, "numbers", ["positive", "negative"]),
+                node(total, "positive", "positive_total"),
+                node(total, "negative", "negative_total"),
+            ]
+        )
+        outputs = StreamingRunner().run(pipeline, catalog)
+        assert outputs == {"positive_total": 45, "negative_total": -45}
+
+    def test_streamed_and_loaded_inputs(self, catalog):
+        def scale(chunks, factor):
+            for chunk in chunks:
+                yield chunk * factor
+
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(scale, ["numbers", "limit"], "scaled"),
+                node(total, "scaled", "total"),
+            ]
+        )
+        assert StreamingRunner().run(pipeline, catalog) == {"total": 450}
+
+    def test_backpressure(self, catalog):
+        """A producer cannot run ahead of its consumer by more than the size
+        of the queue between them."""
+        produced = []
+        consumed = []
+        lags = []
+
+        def produce(limit):
+            for value in range(limit):
+                produced.append(value)
+                yield value
+
+        @streaming
+        def consume(chunks):
+            for chunk in chunks:
+                lags.append(len(produced) - len(consumed))
+                consumed.append(chunk)
+            return len(consumed)
+
+        pipeline = Pipeline(
+            [node(produce, "limit", "numbers"), node(consume, "numbers", "count")]
+        )
+        assert StreamingRunner(queue_size=2).run(pipeline, catalog) == {"count": 10}
+        assert max(lags) <= 4
+
+    def test_stream_to_data_set(self, catalog, tmp_path):
+        """Streamed data sets registered in the catalog are saved chunk by
+        chunk, as well as passed on to their consumers."""
+        filepath = str(tmp_path / "doubled.jsonl")
+        catalog.add("doubled", JSONLinesLocalDataSet(filepath))
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(double, "numbers", "doubled"),
+                node(total, "doubled", "total"),
+            ]
+        )
+        assert StreamingRunner().run(pipeline, catalog) == {"total": 90}
+        assert list(catalog.load("doubled")) == list(range(0, 20, 2))
+
+    def test_stream_data_frames_to_csv(self, catalog, tmp_path):
+        def frames(limit):
+            for value in range(limit):
+                yield pd.DataFrame({"value": [value]})
+
+        filepath = str(tmp_path / "frames.csv")
+        catalog.add("frames", CSVLocalDataSet(filepath))
+        pipeline = Pipeline([node(frames, "limit", "frames")])
+        assert StreamingRunner().run(pipeline, catalog) == {}
+        assert catalog.load("frames")["value"].tolist() == list(range(10))
+
+    def test_plain_consumer_gets_collected_chunks(self, catalog):
+        """Nodes which are neither generators nor marked as streaming
+        receive the list of chunks rather than an iterator"""
+        pipeline = Pipeline(
+            [node(count_up, "limit", "numbers"), node(len, "numbers", "count")]
+        )
+        assert StreamingRunner(queue_size=1).run(pipeline, catalog) == {"count": 10}
+
+    def test_data_frame_chunks_concatenated(self, catalog):
+        def frames(limit):
+            for value in range(limit):
+                yield pd.DataFrame({"value": [value]})
+
+        def column_total(data):
+            return int(data["value"].sum())
+
+        pipeline = Pipeline(
+            [node(frames, "limit", "frames"), node(column_total, "frames", "total")]
+        )
+        assert StreamingRunner().run(pipeline, catalog) == {"total": 45}
+
+    def test_stream_to_data_set_without_chunks(self, catalog, tmp_path):
+        """Data sets which cannot save chunks one at a time receive the list
+        of chunks"""
+        catalog.add("numbers", PickleLocalDataSet(str(tmp_path / "numbers.pkl")))
+        pipeline = Pipeline(
+            [node(count_up, "limit", "numbers"), node(total, "numbers", "total")]
+        )
+        assert StreamingRunner().run(pipeline, catalog) == {"total": 45}
+        assert catalog.load("numbers") == list(range(10))
+
+    def test_stream_to_memory_data_set(self, catalog):
+        """A streamed ``MemoryDataSet`` is only saved when nothing in the
+        pipeline consumes it."""
+        catalog.add("numbers", MemoryDataSet())
+        catalog.add("doubled", MemoryDataSet())
+        pipeline = Pipeline(
+            [node(count_up, "limit", "numbers"), node(double, "numbers", "doubled")]
+        )
+        StreamingRunner().run(pipeline, catalog)
+        assert not catalog.exists("numbers")
+        assert catalog.load("doubled") == list(range(0, 20, 2))
+
+    def test_node_fails(self, catalog, caplog):
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(fail, "numbers", "checked"),
+                node(total, "checked", "total"),
+                node(total, "numbers", "numbers_total"),
+            ]
+        )
+        with pytest.raises(ValueError, match=r"Failed on chunk 3"):
+            StreamingRunner(queue_size=1).run(pipeline, catalog)
+        assert "Node `fail([numbers]) -> [checked]` failed" in caplog.text
+        assert threading.active_count() == 1
+
+    def test_batchable_node(self, catalog):
+        @batchable
+        def increment(values):
+            return [value + 1 for value in values]
+
+        pipeline = Pipeline(
+            [node(increment, "limit", "A"), node(count_up, "A", "numbers")]
+        )
+        outputs = StreamingRunner().run(pipeline, catalog)
+        assert outputs == {"numbers": list(range(11))}
+
+    def test_map_node(self):
+        """Map nodes run over all their partitions at once, and their outputs
+        are not streamed"""
+        catalog = DataCatalog({"partitions": MemoryDataSet({"a": 1, "b": 2})})
+        pipeline = Pipeline(
+            [
+                map_node(identity, "partitions", "mapped"),
+                node(sorted, "mapped", "keys"),
+            ]
+        )
+        outputs = StreamingRunner().run(pipeline, catalog)
+        assert outputs == {"keys": ["a", "b"]}
+
+    def test_stream_consumed_with_derived_data_set(self, catalog):
+        """A node consuming a streamed data set together with the result of
+        another node consuming it would block the stream, so it is rejected
+        rather than left waiting forever"""
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(double, "numbers", "doubled"),
+                node(lambda *chunks: None, ["numbers", "doubled"], "pairs"),
+            ]
+        )
+        pattern = (
+            r"Node `<lambda>\(\[doubled,numbers\]\) -> \[pairs\]` consumes data sets "
+            r"\['doubled', 'numbers'\], which are all computed from the chunks "
+            r"streamed by node `count_up\(\[limit\]\) -> \[numbers\]`"
+        )
+        with pytest.raises(ValueError, match=pattern):
+            StreamingRunner(queue_size=4).run(pipeline, catalog)
+        assert threading.active_count() == 1
+
+    def test_stream_checked_before_run(self, mocker, catalog):
+        """Pipelines which would block a stream are rejected before any node
+        runs"""
+        produce = mocker.Mock()
+
+        def numbers(limit):
+            produce()
+            yield from range(limit)
+
+        catalog.add("other", MemoryDataSet())
+        pipeline = Pipeline(
+            [
+                node(identity, "limit", "other"),
+                node(numbers, "limit", "numbers"),
+                node(double, "numbers", "doubled"),
+                node(lambda *chunks: None, ["numbers", "doubled"], "pairs"),
+            ]
+        )
+        with pytest.raises(ValueError, match=r"\['doubled', 'numbers'\]"):
+            StreamingRunner().run(pipeline, catalog)
+        produce.assert_not_called()
+        assert not catalog.exists("other")
+
+    def test_returned_generator_checked(self, catalog):
+        """Nodes returning a generator without being generator functions are
+        checked when they start streaming"""
+        pipeline = Pipeline(
+            [
+                node(lambda limit: (i for i in range(limit)), "limit", "numbers"),
+                node(double, "numbers", "doubled"),
+                node(lambda *chunks: None, ["numbers", "doubled"], "pairs"),
+            ]
+        )
+        with pytest.raises(ValueError, match=r"\['doubled', 'numbers'\]"):
+            StreamingRunner().run(pipeline, catalog)
+
+    def test_stream_consumed_with_indirect_result(self, catalog):
+        """Data sets computed from a stream through a chain of nodes which
+        are not generators are also rejected"""
+        pipeline = Pipeline(
+            [
+                node(count_up, "limit", "numbers"),
+                node(total, "numbers", "numbers_total"),
+                node(identity, "numbers_total", "result"),
+                node(lambda chunks, result: list(chunks), ["numbers", "result"], "out"),
+            ]
+        )
+        with pytest.raises(ValueError, match=r"\['numbers', 'result'\]"):
+            StreamingRunner(queue_size=4).run(pipeline, catalog)
+
+    def test_nodes_not_scheduled(self, mocker, catalog):
+        """The run fails if some nodes never get their inputs"""
+        pipeline = Pipeline([node(count_up, "limit", "numbers")])
+        mocker.patch.object(pipeline, "inputs", return_value=set())
+        pattern = r"Unable to schedule new tasks although some nodes have not been run"
+        with pytest.raises(RuntimeError, match=pattern):
+            StreamingRunner()._run(
+                pipeline, catalog
+            )  # pylint: disable=protected-access
@@ -0,0 +1,90 @@
+# Copyright 2018-2019 QuantumBlack Visual Analytics Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE, AND
+# NONINFRINGEMENT. IN NO EVENT WILL THE LICENSOR OR OTHER CONTRIBUTORS
+# BE LIABLE FOR ANY CLAIM, DAMAGES, OR OTHER LIABILITY, WHETHER IN AN
+# ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF, OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# The QuantumBlack Visual Analytics Limited (“QuantumBlack”) name and logo
+# (either separately or in combination, “QuantumBlack Trademarks”) are
+# trademarks of QuantumBlack. The License does not grant you any right or
+# license to the QuantumBlack Trademarks. You may not use the QuantumBlack
+# Trademarks or any confusingly similar mark as a trademark for your product,
+#     or use the QuantumBlack Trademarks in any other manner that might cause
+# confusion in the marketplace, including but not limited to in advertising,
+# on websites, or on software.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the construction of large ``Pipeline`` objects.
+
+Run from the root of the repository with::
+
+    python tools/benchmark_pipeline.py 1000 10000 100000
+"""
+
+import random
+import sys
+import time
+
+from kedro.pipeline import Pipeline, node
+
+
+def identity(*args):
+    return args[0]
+
+
+def chain_nodes(size):
+    """A single chain of nodes, the deepest possible pipeline."""
+    return [
+        node(identity, "ds{}".format(i), "ds{}".format(i + 1), name="node{}".format(i))
+        for i in range(size)
+    ]
+
+
+def random_dag_nodes(size, max_inputs=3, seed=0):
+    """Nodes consuming up to ``max_inputs`` outputs of earlier nodes, given in
+    random order."""
+    rand = random.Random(seed)
+    nodes = []
+    for i in range(size):
+        inputs = (
+            {"ds{}".format(rand.randrange(i)) for _ in range(max_inputs)} if i else []
+        )
+        nodes.append(
+            node(identity, sorted(inputs), "ds{}".format(i), name="node{}".format(i))
+        )
+    rand.shuffle(nodes)
+    return nodes
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print("{:>8} {:>12} {:>12}".format("nodes", "chain (s)", "random (s)"))
+    for size in sizes:
+        print(
+            "{:>8} {:>12.3f} {:>12.3f}".format(
+                size,
+                timed(Pipeline, chain_nodes(size)),
+                timed(Pipeline, random_dag_nodes(size)),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])